@@ -1 +1,3 @@
 name = "bulb"
+
+default_app_config = "bulb.apps.BulbConfig"
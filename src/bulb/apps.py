@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class BulbConfig(AppConfig):
+    name = "bulb"
+
+    def ready(self):
+        from bulb.db.registry import node_models_registry
+
+        # Register all the node_models of the project once, when the application is ready.
+        node_models_registry.autodiscover()
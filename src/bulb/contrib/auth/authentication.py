@@ -30,9 +30,9 @@ def _login_user(request, user):
     request.user = user
 
     gdbh.w_transaction("""
-        MATCH (u:User {uuid: '%s'}), (s:Session {session_key: '%s'})
+        MATCH (u:User {uuid: $user_uuid}), (s:Session {session_key: $session_key})
         CREATE (s)-[:IS_SESSION_OF]->(u)
-    """ % (user.uuid, request.session.session_key))
+    """, {"user_uuid": user.uuid, "session_key": request.session.session_key})
 
 
 def preserve_or_login(request, if_authentication_user=AnonymousUser()):
@@ -143,16 +143,16 @@ def force_clear_user_session(request, user=None):
 
     if not isinstance(request.user, AnonymousUser):
         gdbh.w_transaction("""
-            MATCH (:User {uuid: '%s'})<-[:IS_SESSION_OF]-(s:Session)
+            MATCH (:User {uuid: $uuid})<-[:IS_SESSION_OF]-(s:Session)
             DETACH DELETE (s)
-        """ % (request.user.uuid))
+        """, {"uuid": request.user.uuid})
 
     if user is not None:
         if not isinstance(user, AnonymousUser):
             gdbh.w_transaction("""
-                MATCH (:User {uuid: '%s'})<-[:IS_SESSION_OF]-(s:Session)
+                MATCH (:User {uuid: $uuid})<-[:IS_SESSION_OF]-(s:Session)
                 DETACH DELETE (s)
-            """ % (user.uuid))
+            """, {"uuid": user.uuid})
 
     request.session.flush()
     request.user = AnonymousUser()
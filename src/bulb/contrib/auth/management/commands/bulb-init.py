@@ -38,8 +38,7 @@ class Command(BaseCommand):
         print("-----------------------------------")
 
         for permission_name, permission in permissions_dict.items():
-            p = Permission.get(codename=permission_name)
-            if p is None:
+            if not Permission.objects.filter(codename=permission_name).exists():
                 eval(permission)
                 print(f"✔   '{permission_name}' has been created in the database.")
 
@@ -82,10 +82,10 @@ class Command(BaseCommand):
                         # end CONSOLE RENDER PART 4 #
 
                         # Check if the "create" permission is already in the database.
-                        create_permission = Permission.get(codename="create_" + str(node_class_name).lower())
+                        create_permission_exists = Permission.objects.filter(codename="create_" + str(node_class_name).lower()).exists()
 
                         # If there is'nt create it :
-                        if create_permission is None:
+                        if not create_permission_exists:
                             Permission.create(codename="create_" + str(node_class_name).lower(),
                                        description=f"The user can create {str(node_class_name)} nodes.")
                             print(f"                        ✔   Create a 'create' permission.")
@@ -94,10 +94,10 @@ class Command(BaseCommand):
                             print(f"                        ❌   'create' permission was already created.")
 
                         # Check if the "view" permission is already in the database.
-                        view_permission = Permission.get(codename="view_" + str(node_class_name).lower())
+                        view_permission_exists = Permission.objects.filter(codename="view_" + str(node_class_name).lower()).exists()
 
                         # If there is'nt create it :
-                        if view_permission is None:
+                        if not view_permission_exists:
                             Permission.create(codename="view_" + str(node_class_name).lower(),
                                        description=f"The user can view {str(node_class_name)} nodes.")
                             print(f"                        ✔   Create a 'view' permission.")
@@ -106,10 +106,10 @@ class Command(BaseCommand):
                             print(f"                        ❌   'view' permission was already created.")
 
                         # Check if the "update" permission is already in the database.
-                        update_permission = Permission.get(codename="update_" + str(node_class_name).lower())
+                        update_permission_exists = Permission.objects.filter(codename="update_" + str(node_class_name).lower()).exists()
 
                         # If there is'nt create it :
-                        if update_permission is None:
+                        if not update_permission_exists:
                             Permission.create(codename="update_" + str(node_class_name).lower(),
                                        description=f"The user can update {str(node_class_name)} nodes.")
                             print(f"                        ✔   Create an 'update' permission.")
@@ -118,10 +118,10 @@ class Command(BaseCommand):
                             print(f"                        ❌   'update' permission was already created.")
 
                         # Check if the "delete" permission is already in the database.
-                        delete_permission = Permission.get(codename="delete_" + str(node_class_name).lower())
+                        delete_permission_exists = Permission.objects.filter(codename="delete_" + str(node_class_name).lower()).exists()
 
                         # If there is'nt create it :
-                        if delete_permission is None:
+                        if not delete_permission_exists:
                             Permission.create(codename="delete_" + str(node_class_name).lower(),
                                        description=f"The user can delete {str(node_class_name)} nodes.")
                             print(f"                        ✔   Create a 'delete' permission.")
@@ -1,6 +1,5 @@
 from bulb.contrib.auth.hashers import _hash_password
 from bulb.contrib.auth.exceptions import *
-from bulb.db.exceptions import BULBNodeError
 from bulb.utils.log import bulb_logger
 from bulb.db.utils import make_uuid
 from bulb.db import node_models
@@ -122,7 +121,7 @@ class Permission(node_models.Node):
 
     @classmethod
     def get(cls, uuid=None, codename=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-            handmade=None, return_query=False):
+            handmade=None, parameters=None, return_query=False, prefetch=None):
         """
         This method allow the retrieving of Permission (or of one of its children classes) instances.
 
@@ -160,139 +159,32 @@ class Permission(node_models.Node):
 
                          In addition, note that the RETURN must absolutely be named 'p' like "permission".
 
-        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return the cypher query.
+        :param parameters (optional, default=None) : Must be a dict. The parameters of the 'handmade' query (referenced in the
+                                                     query with the $name syntax).
+
+        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return a tuple that contains
+                                                        the cypher query and its parameters dictionary.
+
+        :param prefetch (optional, default=None) : Must be a list of relationships names. The nodes related to the returned
+                                                   instances by these relationships are loaded with a single query per
+                                                   relationship (see Node.prefetch_relationships()).
 
         :return: If uuid is None, a list will be returned. Else it will be a unique instance.
         """
 
         if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct, prefetch=prefetch)
 
-            where_statement = ""
-            property_statement = ""
-            order_by_statement = ""
-            limit_statement = ""
-            skip_statement = ""
-            desc_statement = ""
-
-            # Build the property_statement.
-            if uuid is not None and codename is not None:
-                property_statement = "{uuid:'%s', codename:'%s'}" % (uuid, codename)
-
-            elif uuid is not None:
-                property_statement = "{uuid:'%s'}" % uuid
-
-            elif codename is not None:
-                property_statement = "{codename:'%s'}" % codename
-
-            # Build the match_statement.
-            cyher_labels = node_models.DatabaseNode.format_labels_to_cypher(cls._get_labels())
-            match_statement = f"MATCH (p:{cyher_labels} {property_statement})"
-
-            # Build the where statement.
-            if filter is not None:
-                if not filter[0] != "n":
-                    where_statement = "WHERE " + filter
-
-                else:
-                    where_statement = filter
-
-                where_statement = where_statement.replace("n.", "p.")
-
-            # Build the with_statement.
-            with_statement = "WITH p"
-
-            # Build order_by statements.
-            if order_by is not None:
-                order_by_statement = f"ORDER BY p.{order_by}"
-
-            # Build return_statement statements.
-            if not only:
-                if not distinct:
-                    return_statement = "RETURN (p)"
-
-                else:
-                    return_statement = "RETURN DISTINCT (p)"
-
-            else:
-                only_statement_list = []
-
-                for element in only:
-                    only_statement_list.append(f"p.{element}")
-
-                only_statement = ", ".join(only_statement_list)
-
-                if not distinct:
-                    return_statement = f"RETURN {only_statement}"
-
-                else:
-                    return_statement = f"RETURN DISTINCT {only_statement}"
-
-            # Build limit_statement.
-            if limit is not None:
-                if not isinstance(limit, str) and not isinstance(limit, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'limit\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'limit' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    limit_statement = f"LIMIT {limit}"
-
-            # Build skip_statement and add its required variable.
-            if skip is not None:
-                if not isinstance(skip, str) and not isinstance(skip, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'skip\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'skip' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    skip_statement = f"SKIP {skip}"
-
-            # Build desc_statement.
-            if not isinstance(desc, bool):
-                bulb_logger.error(
-                    f'BULBNodeError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
-                raise BULBNodeError(
-                    f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
-
-            else:
-                if desc is True:
-                    desc_statement = "DESC"
-
-            request_statement = """
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                """ % (match_statement,
-                       where_statement,
-                       with_statement,
-                       order_by_statement,
-                       desc_statement,
-                       skip_statement,
-                       limit_statement,
-                       return_statement)
+            if codename is not None:
+                queryset = queryset.filter(codename=codename)
 
             if return_query is False:
-                response = gdbh.r_transaction(request_statement)
+                response = list(queryset)
 
                 if response:
-                    if only is None:
-                        fake_instances_list = []
-
-                        for permission_object in response:
-                            fake_instances_list.append(cls.build_fake_instance(permission_object["p"],
-                                                                               forced_fake_instance_class=cls))
-
-                        if uuid is not None or codename is not None:
-                            return fake_instances_list[0]
-                        else:
-                            return fake_instances_list
+                    if only is None and (uuid is not None or codename is not None):
+                        return response[0]
 
                     else:
                         return response
@@ -301,10 +193,10 @@ class Permission(node_models.Node):
                     return None
 
             else:
-                return request_statement
+                return queryset.compile()
 
         else:
-            response = gdbh.r_transaction(handmade)
+            response = gdbh.r_transaction(handmade, parameters)
 
             fake_instances_list = []
 
@@ -312,15 +204,24 @@ class Permission(node_models.Node):
                 fake_instances_list.append(cls.build_fake_instance(node_object["p"],
                                                                    forced_fake_instance_class=cls))
 
+            if prefetch:
+                cls.prefetch_relationships(fake_instances_list, prefetch)
+
             return fake_instances_list
 
     @classmethod
     def count(cls, uuid=None, codename=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-              handmade=None, **extrafields):
-        request_statement = cls.get(uuid=uuid, codename=codename, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
-                                    filter=filter, handmade=handmade, return_query=True, **extrafields)
+              handmade=None, parameters=None, **extrafields):
+        if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct).filter(**extrafields)
+
+            if codename is not None:
+                queryset = queryset.filter(codename=codename)
 
-        request_count_statement = None
+            return queryset.count()
+
+        request_statement, request_parameters = handmade, (parameters if parameters is not None else {})
 
         if not distinct:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(p)"
@@ -328,7 +229,7 @@ class Permission(node_models.Node):
         else:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(DISTINCT p)"
 
-        response = gdbh.r_transaction(request_count_statement)
+        response = gdbh.r_transaction(request_count_statement, request_parameters)
 
         if not distinct:
             return response[0]["COUNT(p)"]
@@ -377,7 +278,7 @@ class Group(node_models.Node):
 
     @classmethod
     def get(cls, uuid=None, name=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-            handmade=None, return_query=False):
+            handmade=None, parameters=None, return_query=False, prefetch=None):
         """
         This method allow the retrieving of Group (or of one of its children classes) instances.
 
@@ -415,139 +316,32 @@ class Group(node_models.Node):
 
                          In addition, note that the RETURN must absolutely be named 'g' like "group".
 
-        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return the cypher query.
+        :param parameters (optional, default=None) : Must be a dict. The parameters of the 'handmade' query (referenced in the
+                                                     query with the $name syntax).
+
+        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return a tuple that contains
+                                                        the cypher query and its parameters dictionary.
+
+        :param prefetch (optional, default=None) : Must be a list of relationships names. The nodes related to the returned
+                                                   instances by these relationships are loaded with a single query per
+                                                   relationship (see Node.prefetch_relationships()).
 
         :return: If uuid is None, a list will be returned. Else it will be a unique instance.
         """
 
         if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct, prefetch=prefetch)
 
-            where_statement = ""
-            property_statement = ""
-            order_by_statement = ""
-            limit_statement = ""
-            skip_statement = ""
-            desc_statement = ""
-
-            # Build the property_statement.
-            if uuid is not None and name is not None:
-                property_statement = "{uuid:'%s', name:'%s'}" % (uuid, name)
-
-            elif uuid is not None:
-                property_statement = "{uuid:'%s'}" % uuid
-
-            elif name is not None:
-                property_statement = "{name:'%s'}" % name
-
-            # Build the match_statement.
-            cyher_labels = node_models.DatabaseNode.format_labels_to_cypher(cls._get_labels())
-            match_statement = f"MATCH (g:{cyher_labels} {property_statement})"
-
-            # Build the where statement.
-            if filter is not None:
-                if not filter[0] != "n":
-                    where_statement = "WHERE " + filter
-
-                else:
-                    where_statement = filter
-
-                where_statement = where_statement.replace("n.", "g.")
-
-            # Build the with_statement.
-            with_statement = "WITH g"
-
-            # Build order_by statements.
-            if order_by is not None:
-                order_by_statement = f"ORDER BY g.{order_by}"
-
-            # Build return_statement statements.
-            if not only:
-                if not distinct:
-                    return_statement = "RETURN (g)"
-
-                else:
-                    return_statement = "RETURN DISTINCT (g)"
-
-            else:
-                only_statement_list = []
-
-                for element in only:
-                    only_statement_list.append(f"g.{element}")
-
-                only_statement = ", ".join(only_statement_list)
-
-                if not distinct:
-                    return_statement = f"RETURN {only_statement}"
-
-                else:
-                    return_statement = f"RETURN DISTINCT {only_statement}"
-
-            # Build limit_statement.
-            if limit is not None:
-                if not isinstance(limit, str) and not isinstance(limit, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'limit\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'limit' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    limit_statement = f"LIMIT {limit}"
-
-            # Build skip_statement and add its required variable.
-            if skip is not None:
-                if not isinstance(skip, str) and not isinstance(skip, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'skip\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'skip' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    skip_statement = f"SKIP {skip}"
-
-            # Build desc_statement.
-            if not isinstance(desc, bool):
-                bulb_logger.error(
-                    f'BULBNodeError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
-                raise BULBNodeError(
-                    f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
-
-            else:
-                if desc is True:
-                    desc_statement = "DESC"
-
-            request_statement = """
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                %s
-                """ % (match_statement,
-                       where_statement,
-                       with_statement,
-                       order_by_statement,
-                       desc_statement,
-                       skip_statement,
-                       limit_statement,
-                       return_statement)
+            if name is not None:
+                queryset = queryset.filter(name=name)
 
             if return_query is False:
-                response = gdbh.r_transaction(request_statement)
+                response = list(queryset)
 
                 if response:
-                    if only is None:
-                        fake_instances_list = []
-
-                        for group_object in response:
-                            fake_instances_list.append(cls.build_fake_instance(group_object["g"],
-                                                                               forced_fake_instance_class=cls))
-
-                        if uuid is not None or name is not None:
-                            return fake_instances_list[0]
-                        else:
-                            return fake_instances_list
+                    if only is None and (uuid is not None or name is not None):
+                        return response[0]
 
                     else:
                         return response
@@ -556,10 +350,10 @@ class Group(node_models.Node):
                     return None
 
             else:
-                return request_statement
+                return queryset.compile()
 
         else:
-            response = gdbh.r_transaction(handmade)
+            response = gdbh.r_transaction(handmade, parameters)
 
             fake_instances_list = []
 
@@ -567,14 +361,24 @@ class Group(node_models.Node):
                 fake_instances_list.append(cls.build_fake_instance(node_object["g"],
                                                                    forced_fake_instance_class=cls))
 
+            if prefetch:
+                cls.prefetch_relationships(fake_instances_list, prefetch)
+
             return fake_instances_list
 
     @classmethod
     def count(cls, uuid=None, name=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-              handmade=None, **extrafields):
-        request_statement = cls.get(uuid=uuid, name=name, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
-                                    filter=filter, handmade=handmade, return_query=True, **extrafields)
-        request_count_statement = None
+              handmade=None, parameters=None, **extrafields):
+        if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct).filter(**extrafields)
+
+            if name is not None:
+                queryset = queryset.filter(name=name)
+
+            return queryset.count()
+
+        request_statement, request_parameters = handmade, (parameters if parameters is not None else {})
 
         if not distinct:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(g)"
@@ -582,7 +386,7 @@ class Group(node_models.Node):
         else:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(DISTINCT g)"
 
-        response = gdbh.r_transaction(request_count_statement)
+        response = gdbh.r_transaction(request_count_statement, request_parameters)
 
         if not distinct:
             return response[0]["COUNT(g)"]
@@ -759,6 +563,26 @@ class User(node_models.Node):
 
         return new_user
 
+    @classmethod
+    def bulk_create(cls, list_of_dicts, batch_size=1000):
+        """
+        See Node.bulk_create() documentation part. The passwords are hashed like with the create() method, but no
+        confirmation email is sent.
+        """
+        def prepare_users_properties():
+            for extrafields in list_of_dicts:
+                extrafields = dict(extrafields)
+
+                extrafields.setdefault('is_super_user', False)
+                extrafields.setdefault('is_staff_user', False)
+                extrafields.setdefault('is_active_user', True)
+
+                extrafields['password'] = _hash_password(extrafields['password'])
+
+                yield extrafields
+
+        return super().bulk_create(prepare_users_properties(), batch_size=batch_size)
+
     @classmethod
     def create_super_user(cls, **extrafields):
         extrafields.setdefault('is_super_user', True)
@@ -784,7 +608,7 @@ class User(node_models.Node):
 
     @classmethod
     def get(cls, uuid=None, email=None, email_confirmation_key=None, order_by=None, limit=None, skip=None, desc=False, only=None,
-            filter=None, distinct=False, handmade=None, return_query=False):
+            filter=None, distinct=False, handmade=None, parameters=None, return_query=False, prefetch=None):
         """
         This method allow the retrieving of User (or of one of its children classes) instances.
 
@@ -825,146 +649,35 @@ class User(node_models.Node):
 
                          In addition, note that the RETURN must absolutely be named 'u' like "user".
 
-        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return the cypher query.
+        :param parameters (optional, default=None) : Must be a dict. The parameters of the 'handmade' query (referenced in the
+                                                     query with the $name syntax).
+
+        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return a tuple that contains
+                                                        the cypher query and its parameters dictionary.
+
+        :param prefetch (optional, default=None) : Must be a list of relationships names. The nodes related to the returned
+                                                   instances by these relationships are loaded with a single query per
+                                                   relationship (see Node.prefetch_relationships()).
 
         :return: If uuid is None, a list will be returned. Else it will be a unique instance.
         """
 
         if handmade is None:
-            where_statement = ""
-            property_statement = ""
-            order_by_statement = ""
-            limit_statement = ""
-            skip_statement = ""
-            desc_statement = ""
-
-            # Build the property_statement.
-            if uuid is not None and email is not None:
-                property_statement = "{uuid:'%s', email:'%s'}" % (uuid, email)
-
-            elif uuid is not None:
-                property_statement = "{uuid:'%s'}" % uuid
-
-            elif email is not None:
-                property_statement = "{email:'%s'}" % email
-
-            elif email_confirmation_key is not None:
-                property_statement = "{email_confirmation_key:'%s'}" % email_confirmation_key
-
-            # Build the match_statement.
-            cyher_labels = node_models.DatabaseNode.format_labels_to_cypher(cls._get_labels())
-            match_statement = f"MATCH (u:{cyher_labels} {property_statement})"
-
-            # Build the where statement.
-            if filter is not None:
-                # where_statement = "WHERE " + filter #removed to fix
-
-                if not filter[0] != "n":
-                    where_statement = "WHERE " + filter
-
-                else:
-                    where_statement = filter
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct, prefetch=prefetch)
 
-                where_statement = where_statement.replace("n.", "u.")
+            if email is not None:
+                queryset = queryset.filter(email=email)
 
-            # Build the with_statement.
-            with_statement = "WITH u"
-
-            # Build order_by statements.
-            if order_by is not None:
-                order_by_statement = f"ORDER BY u.{order_by}"
-
-            # Build return_statement statements.
-            if not only:
-                if not distinct:
-                    return_statement = "RETURN (u)"
-
-                else:
-                    return_statement = "RETURN DISTINCT (u)"
-
-            else:
-                only_statement_list = []
-
-                for element in only:
-                    only_statement_list.append(f"u.{element}")
-
-                only_statement = ", ".join(only_statement_list)
-
-                if not distinct:
-                    return_statement = f"RETURN {only_statement}"
-
-                else:
-                    return_statement = f"RETURN DISTINCT {only_statement}"
-
-            # Build limit_statement.
-            if limit is not None:
-                if not isinstance(limit, str) and not isinstance(limit, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'limit\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'limit' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    limit_statement = f"LIMIT {limit}"
-
-            # Build skip_statement and add its required variable.
-            if skip is not None:
-                if not isinstance(skip, str) and not isinstance(skip, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'skip\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'skip' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-                else:
-                    skip_statement = f"SKIP {skip}"
-
-            # Build desc_statement.
-            if not isinstance(desc, bool):
-                bulb_logger.error(
-                    f'BULBNodeError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
-                raise BULBNodeError(
-                    f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
-
-            else:
-                if desc is True:
-                    desc_statement = "DESC"
-
-            request_statement = """
-                   %s
-                   %s
-                   %s
-                   %s
-                   %s
-                   %s
-                   %s
-                   %s
-                   """ % (match_statement,
-                          where_statement,
-                          with_statement,
-                          order_by_statement,
-                          desc_statement,
-                          skip_statement,
-                          limit_statement,
-                          return_statement)
+            if email_confirmation_key is not None:
+                queryset = queryset.filter(email_confirmation_key=email_confirmation_key)
 
             if return_query is False:
-
-                response = gdbh.r_transaction(request_statement)
+                response = list(queryset)
 
                 if response:
-                    if only is None:
-
-                        fake_instances_list = []
-
-                        for user_object in response:
-                            fake_instances_list.append(cls.build_fake_instance(user_object["u"],
-                                                                               forced_fake_instance_class=cls))
-
-                        if uuid is not None or email is not None or email_confirmation_key is not None:
-                            return fake_instances_list[0]
-
-                        else:
-                            return fake_instances_list
+                    if only is None and (uuid is not None or email is not None or email_confirmation_key is not None):
+                        return response[0]
 
                     else:
                         return response
@@ -977,11 +690,12 @@ class User(node_models.Node):
 
                     else:
                         return None
+
             else:
-                return request_statement
+                return queryset.compile()
 
         else:
-            response = gdbh.r_transaction(handmade)
+            response = gdbh.r_transaction(handmade, parameters)
 
             fake_instances_list = []
 
@@ -989,17 +703,28 @@ class User(node_models.Node):
                 fake_instances_list.append(cls.build_fake_instance(node_object["u"],
                                                                    forced_fake_instance_class=cls))
 
+            if prefetch:
+                cls.prefetch_relationships(fake_instances_list, prefetch)
+
             return fake_instances_list
 
 
     @classmethod
     def count(cls, uuid=None, email=None,  email_confirmation_key=None, order_by=None, limit=None, skip=None, desc=False, only=None,
-              filter=None, distinct=False, handmade=None, **extrafields):
-        request_statement = cls.get(uuid=uuid, email=email,  email_confirmation_key=email_confirmation_key, order_by=order_by,
-                                    limit=limit, skip=skip, desc=desc, only=only, filter=filter, handmade=handmade, return_query=True,
-                                     **extrafields)
+              filter=None, distinct=False, handmade=None, parameters=None, **extrafields):
+        if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct).filter(**extrafields)
+
+            if email is not None:
+                queryset = queryset.filter(email=email)
+
+            if email_confirmation_key is not None:
+                queryset = queryset.filter(email_confirmation_key=email_confirmation_key)
+
+            return queryset.count()
 
-        request_count_statement = None
+        request_statement, request_parameters = handmade, (parameters if parameters is not None else {})
 
         if not distinct:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(u)"
@@ -1007,7 +732,7 @@ class User(node_models.Node):
         else:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(DISTINCT u)"
 
-        response = gdbh.r_transaction(request_count_statement)
+        response = gdbh.r_transaction(request_count_statement, request_parameters)
 
         if not distinct:
             return response[0]["COUNT(u)"]
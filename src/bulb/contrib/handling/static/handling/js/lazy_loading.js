@@ -1,8 +1,9 @@
 import {AJAXRequest} from "../../utils/js/ajax.js";
 
 window.addEventListener("load", function () {
-    // Default loaded instances
-    let loaded_instances = 20;
+    // The uuid of the last loaded instance (the next instances are loaded from it).
+    const last_initial_row = document.querySelector("table tbody#initial-tbody tr:last-child");
+    let last_uuid = last_initial_row !== null ? last_initial_row.dataset.uuid : "";
     const loader = document.querySelector("div#loader");
     const no_more_message = document.querySelector("p#no-more-message");
 
@@ -10,7 +11,7 @@ window.addEventListener("load", function () {
         const instances = JSON.parse(instances_json);
 
         if (instances.length !== 0) {
-            loaded_instances += instances.length;
+            last_uuid = instances[instances.length - 1]["uuid"];
 
             const instances_prefix = Object.keys(instances[0])[0][0];
 
@@ -63,7 +64,7 @@ window.addEventListener("load", function () {
                 window.removeEventListener("scroll", load_on_scroll);
 
                 const data = new FormData();
-                data.append("loaded_instances", loaded_instances);
+                data.append("last_uuid", last_uuid);
 
                 loader.removeAttribute("hidden");
                 no_more_message.setAttribute("hidden", "hidden");
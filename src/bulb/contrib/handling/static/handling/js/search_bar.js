@@ -7,7 +7,7 @@ window.addEventListener("load", function () {
     const search_tbody = document.querySelector("table tbody#search-tbody")
     let search_value = null;
     let timeout = null;
-    let loaded_instances = 20;
+    let last_uuid = "";
     const loader = document.querySelector("div#loader");
     const no_more_message = document.querySelector("p#no-more-message");
     let results_number = null;
@@ -48,6 +48,9 @@ window.addEventListener("load", function () {
                 // Remove the "count" dict of the response to let only instances didts.
                 response.pop()
 
+                // The next results are loaded from the last one.
+                last_uuid = response[response.length - 1]["uuid"];
+
                 for (const instance of response) {
                     // Create a row for the new instance.
                     const row = document.createElement("tr");
@@ -102,7 +105,7 @@ window.addEventListener("load", function () {
 
             if (instances.length !== 0) {
 
-                loaded_instances += instances.length;
+                last_uuid = instances[instances.length - 1]["uuid"];
 
                 for (const instance of instances) {
                     // Create a row for the new instance.
@@ -158,7 +161,7 @@ window.addEventListener("load", function () {
 
             const data = new FormData();
             data.append("value", search_value);
-            data.append("loaded_instances", loaded_instances);
+            data.append("last_uuid", last_uuid);
 
             loader.removeAttribute("hidden");
             no_more_message.setAttribute("hidden", "hidden");
@@ -2,9 +2,10 @@ from bulb.contrib.handling.exceptions import BULBAdminError
 from bulb.contrib.auth.exceptions import BULBPermissionError
 from bulb.contrib.auth.decorators import login_required, staff_only
 from bulb.utils import get_files_paths_list, get_all_node_models
+from bulb.db.registry import node_models_registry
 from bulb.contrib.auth.node_models import User
 from bulb.utils.log import bulb_logger
-from bulb.db import gdbh
+from bulb.db import gdbh, Q
 from django.contrib.messages import add_message, SUCCESS, ERROR
 from django.shortcuts import render, redirect
 from django.http import JsonResponse, StreamingHttpResponse
@@ -14,6 +15,7 @@ from multiprocessing.dummy import Pool
 import importlib.util
 import datetime
 import json
+import re
 import time
 import sys
 import asyncio
@@ -70,6 +72,75 @@ def get_admin_preview_fields(node_model_name):
     return None
 
 
+def get_admin_preview_queryset(node_model, preview_fields_names, order_by, desc, value_to_search=None):
+    """
+    This function returns the QuerySet of the instances previewed on the home page of a node_model, sorted like the preview
+    (with the uuid as tie-breaker), and filtered by the searched value if there is one.
+
+    :param node_model (required) : The node_model class.
+
+    :param preview_fields_names (required) : The names of the previewed properties, in which the value is searched.
+
+    :param order_by (required) : The name of the property with which the instances are sorted.
+
+    :param desc (required) : True to sort the instances in a descending order.
+
+    :param value_to_search (optional, default=None) : The searched value. If it is None, all the instances are previewed.
+                                                      It is escaped, so it is searched literally (its regex special
+                                                      characters like '(' or '*' are not interpreted).
+
+    :return: A QuerySet.
+    """
+    queryset = node_model.objects.order_by(("-" if desc else "") + order_by)
+
+    if value_to_search is not None:
+        search_q_statement = Q()
+
+        for preview_field_name in preview_fields_names:
+            search_q_statement = search_q_statement | Q(**{preview_field_name + "__iregex": f".*{re.escape(value_to_search)}.*"})
+
+        queryset = queryset.filter(search_q_statement)
+
+    return queryset
+
+
+def get_admin_preview_page(queryset, preview_fields_names, last_uuid=None):
+    """
+    This function returns the next 20 previewed instances of a QuerySet (see get_admin_preview_queryset()), read from the
+    last loaded one with the after() method of the QuerySet (keyset pagination), serialized as strings for the templates
+    and the lazy loading scripts.
+
+    :param queryset (required) : The QuerySet of the previewed instances.
+
+    :param preview_fields_names (required) : The names of the previewed properties.
+
+    :param last_uuid (optional, default=None) : The uuid of the last loaded instance. If it is None, the first page is
+                                                returned.
+
+    :return: A list of dicts, with the uuid of each instance under the "uuid" key, and its previewed properties under the
+             "n.<property_name>" keys.
+    """
+    if last_uuid is not None:
+        last_instance = queryset.node_model.objects.filter(uuid=last_uuid).first()
+
+        if last_instance is None:
+            return []
+
+        queryset = queryset.after(last_instance)
+
+    preview_page = []
+
+    for instance in queryset.limit(20):
+        preview = {"uuid": str(instance.uuid)}
+
+        for preview_field_name in preview_fields_names:
+            preview["n." + preview_field_name] = str(vars(instance).get(preview_field_name))
+
+        preview_page.append(preview)
+
+    return preview_page
+
+
 def get_admin_fields(node_model_name):
     """
     This function return the _fields_infos dictionary of an instance if there is one, else it return None.
@@ -138,13 +209,7 @@ def node_model_home_view(request, node_model_name):
     # Check 'view' permission.
     if request.user.has_perm("view_" + node_model_name.lower()) or request.user.has_perm("view"):
 
-        all_node_models = get_all_node_models()
-        node_model = None
-
-        for nm in all_node_models:
-            if nm.__name__ == node_model_name:
-                node_model = nm
-                break
+        node_model = node_models_registry.get_node_model(node_model_name)
 
         if node_model is not None:
             preview_fields_dict = get_admin_preview_fields(node_model_name)
@@ -161,39 +226,19 @@ def node_model_home_view(request, node_model_name):
                     order_by = preview_fields_dict["1"]
 
                 # Define the desc value.
-                desc = ""
+                desc = False
                 if "desc" in preview_fields_dict.keys():
-                    if preview_fields_dict["desc"] is True:
-                        desc = "DESC"
+                    desc = preview_fields_dict["desc"] is True
                     del preview_fields_dict["desc"]
 
-                # Define return statement.
-                return_statement = "RETURN DISTINCT n.uuid AS uuid,"
-
-                for key, value in preview_fields_dict.items():
-                    return_statement = return_statement + f" n.{value},"
-
-                return_statement = return_statement[:-1]
+                preview_fields_names = list(preview_fields_dict.values())
+                queryset = get_admin_preview_queryset(node_model, preview_fields_names, order_by, desc)
 
-                # Load more request.
+                # Load more request (keyset pagination : the instances are read from the last loaded one, instead of
+                # skipping all the loaded instances).
                 if request.is_ajax():
-                    loaded_instances = request.POST.get("loaded_instances")
-
-                    new_instances = gdbh.r_transaction(f"""
-                                                   MATCH (n:{node_model_name})
-
-                                                   WITH n
-                                                   ORDER BY n.{order_by}
-                                                   {desc}
-                                                   SKIP {loaded_instances}
-                                                   LIMIT 20
-                                                   {return_statement}
-                                                    """)
-                    if new_instances:
-                        # String serialize all the reiceived objects.
-                        for instance in new_instances:
-                            for property_key, property_value in instance.items():
-                                instance[property_key] = str(property_value)
+                    new_instances = get_admin_preview_page(queryset, preview_fields_names,
+                                                           last_uuid=request.POST.get("last_uuid"))
 
                     return JsonResponse(json.dumps(new_instances), safe=False)
 
@@ -201,29 +246,11 @@ def node_model_home_view(request, node_model_name):
                 else:
                     number_of_instances = 0
 
-                    twenty_last_instances = gdbh.r_transaction(f"""
-                                                   MATCH (n:{node_model_name})
-
-                                                   WITH n
-                                                   ORDER BY n.{order_by}
-                                                   {desc}
-                                                   LIMIT 20
-                                                   {return_statement}
-                                                    """)
+                    twenty_last_instances = get_admin_preview_page(queryset, preview_fields_names)
 
                     if twenty_last_instances:
-                        # String serialize all the reiceived objects.
-                        for instance in twenty_last_instances:
-                            for property_key, property_value in instance.items():
-                                instance[property_key] = str(property_value)
-
                         # Find the number of instances.
-                        number_of_instances = gdbh.r_transaction(f"""
-                                                       MATCH (n:{node_model_name})
-                                                       RETURN COUNT(DISTINCT n)
-                                                       """)[0]["COUNT(DISTINCT n)"]
-
-
+                        number_of_instances = queryset.count()
 
                     return render(request, "handling/pages/node_class_home.html", locals())
 
@@ -252,11 +279,12 @@ def node_model_home_search_view(request, node_model_name):
         # Check 'view' permission.
         if request.user.has_perm("view_" + node_model_name.lower()) or request.user.has_perm("view"):
 
+                node_model = node_models_registry.get_node_model(node_model_name)
                 preview_fields_dict = get_admin_preview_fields(node_model_name)
 
-                # First search.
-                if request.POST.get('value') and not request.POST.get("loaded_instances"):
+                if request.POST.get('value'):
                     value_to_search = request.POST.get('value')
+                    last_uuid = request.POST.get("last_uuid")
 
                     # Define the order_by value.
                     order_by = None
@@ -268,101 +296,29 @@ def node_model_home_search_view(request, node_model_name):
                         order_by = preview_fields_dict["1"]
 
                     # Define the desc value.
-                    desc = ""
+                    desc = False
                     if "desc" in preview_fields_dict.keys():
-                        if preview_fields_dict["desc"] is True:
-                            desc = "DESC"
+                        desc = preview_fields_dict["desc"] is True
                         del preview_fields_dict["desc"]
 
-                    # Define the where and return statements.
-                    where_statement = "WHERE"
-                    return_statement = "RETURN DISTINCT n.uuid AS uuid,"
-
-                    for key, value in preview_fields_dict.items():
-                        where_statement = where_statement + f" n.{value} =~ '(?i)(.*){value_to_search}(.*)' OR"
-                        return_statement = return_statement + f" n.{value},"
-
-                    where_statement = where_statement[:-3]
-                    return_statement = return_statement[:-1]
+                    preview_fields_names = list(preview_fields_dict.values())
+                    queryset = get_admin_preview_queryset(node_model, preview_fields_names, order_by, desc,
+                                                          value_to_search=value_to_search)
 
-                    response = gdbh.r_transaction(f"""
-                                                   MATCH (n:{node_model_name})
-                                                   {where_statement}
+                    # More (keyset pagination : the instances are read from the last loaded one, instead of skipping all
+                    # the loaded instances).
+                    if last_uuid:
+                        return JsonResponse(get_admin_preview_page(queryset, preview_fields_names, last_uuid=last_uuid),
+                                            safe=False)
 
-                                                   WITH n
-                                                   ORDER BY n.{order_by}
-                                                   {desc}
-                                                   LIMIT 20
-                                                   {return_statement}
-                                                    """)
+                    # First search.
+                    response = get_admin_preview_page(queryset, preview_fields_names)
 
                     if response:
-                        response.append({"count": gdbh.r_transaction(f"""
-                                                       MATCH (n:{node_model_name})
-                                                       {where_statement}
-
-                                                       RETURN COUNT(DISTINCT n)
-                                                        """)[0]["COUNT(DISTINCT n)"]})
-
-                        # String serialize all the reiceived objects.
-                        for received_object in response:
-                            for property_key, property_value in received_object.items():
-                                received_object[property_key] = str(property_value)
+                        response.append({"count": str(queryset.count())})
 
                     return JsonResponse(response, safe=False)
 
-                # More.
-                if request.POST.get('value') and request.POST.get('loaded_instances'):
-
-                    value_to_search = request.POST.get('value')
-                    loaded_instances = request.POST.get("loaded_instances")
-
-                    # Define the order_by value.
-                    order_by = None
-                    if "order_by" in preview_fields_dict.keys():
-                        order_by = preview_fields_dict["order_by"]
-                        del preview_fields_dict["order_by"]
-
-                    else:
-                        order_by = preview_fields_dict["1"]
-
-                    # Define the desc value.
-                    desc = ""
-                    if "desc" in preview_fields_dict.keys():
-                        if preview_fields_dict["desc"] == True:
-                            desc = "DESC"
-                        del preview_fields_dict["desc"]
-
-                    # Define the where and return statements.
-                    where_statement = "WHERE"
-                    return_statement = "RETURN DISTINCT n.uuid AS uuid,"
-
-                    for key, value in preview_fields_dict.items():
-                        where_statement = where_statement + f" n.{value} =~ '(?i)(.*){value_to_search}(.*)' OR"
-                        return_statement = return_statement + f"n.{value},"
-
-                    where_statement = where_statement[:-3]
-                    return_statement = return_statement[:-1]
-
-                    new_instances = gdbh.r_transaction(f"""
-                                                       MATCH (n:{node_model_name})
-                                                       {where_statement}
-
-                                                       WITH n
-                                                       ORDER BY n.{order_by}
-                                                       {desc}
-                                                       SKIP {loaded_instances}
-                                                       LIMIT 20
-                                                       {return_statement}
-                                                        """)
-
-                    # String serialize all the reiceived objects.
-                    for received_object in new_instances:
-                        for property_key, property_value in received_object.items():
-                            received_object[property_key] = str(property_value)
-
-                    return JsonResponse(new_instances, safe=False)
-
         else:
             return redirect(settings.BULB_HOME_PAGE_URL)
 
@@ -378,50 +334,44 @@ def handle_edition(request, admin_fields_dict, node_model_name, instance, all_ob
 
             if admin_request["action"][0] == "update":
 
-                # Remove the action of the request and the CSRF Token before uploading the new properties
-                del admin_request["action"]
-                del admin_request["csrfmiddlewaretoken"]
+                # Send all the modifications in a single transaction, committed once at the end.
+                with gdbh.transaction("WRITE"):
 
-                # Store field's name and value if there is a password.
-                password_field_name = None
-                password_field_value = None
-                password_confirmation_field_name = None
-                password_confirmation_field_value = None
+                    # Remove the action of the request and the CSRF Token before uploading the new properties
+                    del admin_request["action"]
+                    del admin_request["csrfmiddlewaretoken"]
 
-                for property_name, property_value in admin_request.items():
+                    # Store field's name and value if there is a password.
+                    password_field_name = None
+                    password_field_value = None
+                    password_confirmation_field_name = None
+                    password_confirmation_field_value = None
 
-                    if property_value[0]:
-                        # Ensure that it is not an helper field.
-                        try:
-                            related_admin_field_dict = admin_fields_dict[property_name]
+                    # Regroup the new values of the properties to update them with a single query.
+                    properties_to_update_dict = {}
 
-                        except KeyError:
-                            pass
+                    for property_name, property_value in admin_request.items():
 
-                        else:
-                            # Handle boolean values.
-                            if property_value[0] == "on":
-                                property_value[0] = True
-                            elif property_value[0] == "off":
-                                property_value[0] = False
-
-                            # Handle datetime values.
-                            elif related_admin_field_dict["type"] == "datetime":
-                                if isinstance(property_value[0], str):
-                                    try:
-                                        # property_value[0] = datetime.datetime.fromisoformat(property_value[0]) # Doesn't work before Python 3.7
-                                        property_value[0] = datetime.datetime(int(property_value[3]),
-                                                                              int(property_value[2]),
-                                                                              int(property_value[1]),
-                                                                              int(property_value[4]),
-                                                                              int(property_value[5]),
-                                                                              int(property_value[6]))
+                        if property_value[0]:
+                            # Ensure that it is not an helper field.
+                            try:
+                                related_admin_field_dict = admin_fields_dict[property_name]
 
-                                    # Per default the Neo4j database add timezone (represented by 9 characters) to time object.
-                                    except ValueError:
-                                        # property_value[0] = datetime.datetime.fromisoformat(property_value[0][:-9]) # Doesn't work before Python 3.7
+                            except KeyError:
+                                pass
 
+                            else:
+                                # Handle boolean values.
+                                if property_value[0] == "on":
+                                    property_value[0] = True
+                                elif property_value[0] == "off":
+                                    property_value[0] = False
+
+                                # Handle datetime values.
+                                elif related_admin_field_dict["type"] == "datetime":
+                                    if isinstance(property_value[0], str):
                                         try:
+                                            # property_value[0] = datetime.datetime.fromisoformat(property_value[0]) # Doesn't work before Python 3.7
                                             property_value[0] = datetime.datetime(int(property_value[3]),
                                                                                   int(property_value[2]),
                                                                                   int(property_value[1]),
@@ -429,133 +379,128 @@ def handle_edition(request, admin_fields_dict, node_model_name, instance, all_ob
                                                                                   int(property_value[5]),
                                                                                   int(property_value[6]))
 
-                                        except:
-                                            pass
+                                        # Per default the Neo4j database add timezone (represented by 9 characters) to time object.
+                                        except ValueError:
+                                            # property_value[0] = datetime.datetime.fromisoformat(property_value[0][:-9]) # Doesn't work before Python 3.7
 
-                            # Handle date values.
-                            elif related_admin_field_dict["type"] == "date":
-                                if isinstance(property_value[0], str):
-                                    try:
-                                        # property_value[0] = datetime.date.fromisoformat(property_value[0]) # Doesn't work before Python 3.7
-                                        property_value[0] = datetime.date(int(property_value[3]),
-                                                                          int(property_value[2]),
-                                                                          int(property_value[1]))
+                                            try:
+                                                property_value[0] = datetime.datetime(int(property_value[3]),
+                                                                                      int(property_value[2]),
+                                                                                      int(property_value[1]),
+                                                                                      int(property_value[4]),
+                                                                                      int(property_value[5]),
+                                                                                      int(property_value[6]))
 
-                                    # Per default the Neo4j database add timezone (represented by 9 characters) to time object.
-                                    except ValueError:
-                                        # property_value[0] = datetime.date.fromisoformat(property_value[0][:-9]) # Doesn't work before Python 3.7
-                                        property_value[0] = datetime.date(int(property_value[3]),
-                                                                          int(property_value[2]),
-                                                                          int(property_value[1]))
+                                            except:
+                                                pass
 
+                                # Handle date values.
+                                elif related_admin_field_dict["type"] == "date":
+                                    if isinstance(property_value[0], str):
+                                        try:
+                                            # property_value[0] = datetime.date.fromisoformat(property_value[0]) # Doesn't work before Python 3.7
+                                            property_value[0] = datetime.date(int(property_value[3]),
+                                                                              int(property_value[2]),
+                                                                              int(property_value[1]))
 
-                            # Handle time values.
-                            elif related_admin_field_dict["type"] == "time":
-                                if isinstance(property_value[0], str):
-                                    try:
-                                        str_to_datetime = datetime.datetime.strptime(property_value[0], "%H:%M:%S")
-                                        datetime_to_time = datetime.datetime.time(str_to_datetime)
-                                        property_value[0] = datetime_to_time
+                                        # Per default the Neo4j database add timezone (represented by 9 characters) to time object.
+                                        except ValueError:
+                                            # property_value[0] = datetime.date.fromisoformat(property_value[0][:-9]) # Doesn't work before Python 3.7
+                                            property_value[0] = datetime.date(int(property_value[3]),
+                                                                              int(property_value[2]),
+                                                                              int(property_value[1]))
 
-                                    # Per default the Neo4j database add milisecond (represented by 10 characters) to time object.
-                                    except ValueError:
-                                        str_to_datetime = datetime.datetime.strptime(property_value[0][:-10], "%H:%M:%S")
-                                        datetime_to_time = datetime.datetime.time(str_to_datetime)
-                                        property_value[0] = datetime_to_time
 
-                        # Helpers fields and password.
+                                # Handle time values.
+                                elif related_admin_field_dict["type"] == "time":
+                                    if isinstance(property_value[0], str):
+                                        try:
+                                            str_to_datetime = datetime.datetime.strptime(property_value[0], "%H:%M:%S")
+                                            datetime_to_time = datetime.datetime.time(str_to_datetime)
+                                            property_value[0] = datetime_to_time
 
-                        # Handle passwords.
-                        if property_name == "password-info":
-                            password_field_name = property_value[0]
-                            password_confirmation_field_name = f"{property_value[0]}-confirmation"
+                                        # Per default the Neo4j database add milisecond (represented by 10 characters) to time object.
+                                        except ValueError:
+                                            str_to_datetime = datetime.datetime.strptime(property_value[0][:-10], "%H:%M:%S")
+                                            datetime_to_time = datetime.datetime.time(str_to_datetime)
+                                            property_value[0] = datetime_to_time
 
-                        elif property_name == password_field_name:
-                            password_field_value = property_value
+                            # Helpers fields and password.
 
-                        elif property_name == password_confirmation_field_name:
-                            password_confirmation_field_value = property_value
+                            # Handle passwords.
+                            if property_name == "password-info":
+                                password_field_name = property_value[0]
+                                password_confirmation_field_name = f"{property_value[0]}-confirmation"
 
-                            if password_field_value == password_confirmation_field_value:
-                                instance.set_password(password_field_value[0])
+                            elif property_name == password_field_name:
+                                password_field_value = property_value
 
-                            else:
-                                # TODO : Ajouter l'erreur sur le formulaire
-                                # add_message(
-                                #     request, ERROR,
-                                #     "Le mot de passe et sa confirmation ne correspondent pas. Le mot de passe n'a donc pas été modifié.")
-                                bulb_logger.error(
-                                    'BULBAdminError("The password and its confirmation don\'t match. So the password was not modified.")')
-                                raise BULBAdminError(
-                                    "The password and its confirmation don\'t match. So the password was not modified.")
-
-                        # Handle relationships.
-                        elif property_name == "relationships-helper":
-                            recovered_dict = json.loads(property_value[0])
-
-                            for field_name, field_instructions in recovered_dict.items():
-                                related_relationship_object = eval(f"instance.{field_name}")
+                            elif property_name == password_confirmation_field_name:
+                                password_confirmation_field_value = property_value
 
-                                add_list = field_instructions["add"]
-                                remove_list = field_instructions["remove"]
+                                if password_field_value == password_confirmation_field_value:
+                                    instance.set_password(password_field_value[0])
 
-                                if add_list:
-                                    for to_add_uuid in add_list:
+                                else:
+                                    # TODO : Ajouter l'erreur sur le formulaire
+                                    # add_message(
+                                    #     request, ERROR,
+                                    #     "Le mot de passe et sa confirmation ne correspondent pas. Le mot de passe n'a donc pas été modifié.")
+                                    bulb_logger.error(
+                                        'BULBAdminError("The password and its confirmation don\'t match. So the password was not modified.")')
+                                    raise BULBAdminError(
+                                        "The password and its confirmation don\'t match. So the password was not modified.")
 
-                                        # Check uuid to prevent HTML modification attack.
-                                        uuid_is_valid = False
-                                        for other_values_tuple in all_objects_dict[field_name]:
-                                            if other_values_tuple[0] == to_add_uuid:
-                                                uuid_is_valid = True
-                                                break
+                            # Handle relationships.
+                            elif property_name == "relationships-helper":
+                                recovered_dict = json.loads(property_value[0])
 
-                                        if uuid_is_valid is False:
-                                            bulb_logger.error(
-                                                'BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
-                                            raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
+                                for field_name, field_instructions in recovered_dict.items():
+                                    related_relationship_object = eval(f"instance.{field_name}")
 
-                                        related_relationship_object.add(uuid=to_add_uuid)
+                                    add_list = field_instructions["add"]
+                                    remove_list = field_instructions["remove"]
 
-                                if remove_list:
-                                    for to_remove_uuid in remove_list:
+                                    # Check uuids to prevent HTML modification attack.
+                                    available_uuids = set(other_values_tuple[0] for other_values_tuple in all_objects_dict[field_name])
 
-                                        # Check uuid to prevent HTML modification attack.
-                                        uuid_is_valid = False
-                                        for other_values_tuple in all_objects_dict[field_name]:
-                                            if other_values_tuple[0] == to_remove_uuid:
-                                                uuid_is_valid = True
-                                                break
+                                    if not available_uuids.issuperset(add_list) or not available_uuids.issuperset(remove_list):
+                                        bulb_logger.error(
+                                            'BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
+                                        raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
 
-                                        if uuid_is_valid is False:
-                                            bulb_logger.error(
-                                                'BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
-                                            raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
+                                    if remove_list:
+                                        related_relationship_object.remove_many(remove_list)
 
-                                        related_relationship_object.remove(uuid=to_remove_uuid)
+                                    if add_list:
+                                        related_relationship_object.add_many(add_list)
 
-                        # Handle unique relationships.
-                        elif property_name == "unique-relationship-helper":
-                            field_name = property_value[0].split(",")[0]
-                            object_uuid = property_value[0].split(",")[1]
+                            # Handle unique relationships.
+                            elif property_name == "unique-relationship-helper":
+                                field_name = property_value[0].split(",")[0]
+                                object_uuid = property_value[0].split(",")[1]
 
-                            related_relationship_object = eval(f"instance.{field_name}")
+                                related_relationship_object = eval(f"instance.{field_name}")
 
-                            # Check uuid to prevent HTML modification attack.
-                            uuid_is_valid = False
-                            for other_values_tuple in all_objects_dict[field_name]:
-                                if other_values_tuple[0] == object_uuid:
-                                    uuid_is_valid = True
-                                    break
+                                # Check uuid to prevent HTML modification attack.
+                                uuid_is_valid = False
+                                for other_values_tuple in all_objects_dict[field_name]:
+                                    if other_values_tuple[0] == object_uuid:
+                                        uuid_is_valid = True
+                                        break
 
-                            if uuid_is_valid is False:
-                                bulb_logger.error(
-                                    'BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
-                                raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
+                                if uuid_is_valid is False:
+                                    bulb_logger.error(
+                                        'BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
+                                    raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
 
-                            related_relationship_object.remove(uuid=object_uuid)
+                                related_relationship_object.remove(uuid=object_uuid)
 
-                        else:
-                            instance.update(property_name, property_value[0])
+                            else:
+                                properties_to_update_dict[property_name] = property_value[0]
+
+                    if properties_to_update_dict:
+                        instance.update_many(properties_to_update_dict)
 
                 # add_message(request, SUCCESS, "L'instance a bien été mise à jour.")
 
@@ -569,7 +514,9 @@ def handle_edition(request, admin_fields_dict, node_model_name, instance, all_ob
                 # Check 'delete' permission.
                 if request.user.has_perm("delete_" + node_model_name.lower()) or request.user.has_perm("delete"):
 
-                    instance.delete()
+                    with gdbh.transaction("WRITE"):
+                        instance.delete()
+
                     bulb_logger.activity(
                         f"{request.user.first_name} {request.user.last_name} ({request.user.uuid[:6]}) | delete | {node_model_name} | {instance.uuid[:6]}")
                     # add_message(request, SUCCESS, "L'instance a bien été supprimée.")
@@ -604,12 +551,7 @@ def node_handling_view(request, node_model_name, node_uuid):
 
         # Try to get the corresponding node model
         all_node_models = get_all_node_models()
-        node_model = None
-
-        # For each path of the node_models.py files :
-        for found_node_model in all_node_models:
-            if found_node_model.__name__ == node_model_name:
-                node_model = found_node_model
+        node_model = node_models_registry.get_node_model(node_model_name)
 
         instance = node_model.get(uuid=node_uuid)
 
@@ -1719,31 +1661,28 @@ def handle_creation(request, admin_fields_dict, node_model, node_model_name, ava
                                 datetime_to_time = datetime.datetime.time(str_to_datetime)
                                 properties[property_name] = datetime_to_time
 
-        new_instance = node_model.create(**properties)
+        # Create the instance and its relationships in a single transaction, committed once at the end.
+        with gdbh.transaction("WRITE"):
+            new_instance = node_model.create(**properties)
 
-        bulb_logger.activity(
-            f"{request.user.first_name} {request.user.last_name} ({request.user.uuid[:6]}) | create | {node_model_name} | {new_instance.uuid[:6]}")
+            bulb_logger.activity(
+                f"{request.user.first_name} {request.user.last_name} ({request.user.uuid[:6]}) | create | {node_model_name} | {new_instance.uuid[:6]}")
 
-        for rel_name, rel_instructions in relationships_dict.items():
-            related_relationship_object = eval(f"new_instance.{rel_name}")
+            for rel_name, rel_instructions in relationships_dict.items():
+                related_relationship_object = eval(f"new_instance.{rel_name}")
 
-            add_list = rel_instructions["add"]
+                add_list = rel_instructions["add"]
 
-            if add_list:
-                for to_add_uuid in add_list:
+                if add_list:
 
-                    # Check uuid to prevent HTML modification attack.
-                    uuid_is_valid = False
-                    for other_values_tuple in available_objects_dict[rel_name]:
-                        if other_values_tuple[0] == to_add_uuid:
-                            uuid_is_valid = True
-                            break
+                    # Check uuids to prevent HTML modification attack.
+                    available_uuids = set(other_values_tuple[0] for other_values_tuple in available_objects_dict[rel_name])
 
-                    if uuid_is_valid is False:
+                    if not available_uuids.issuperset(add_list):
                         bulb_logger.error('BULBAdminError("HTML modifications was found, the modifications cannot be done.")')
                         raise BULBAdminError("HTML modifications was found, the modifications cannot be done.")
 
-                    related_relationship_object.add(uuid=to_add_uuid)
+                    related_relationship_object.add_many(add_list)
 
         # admin_preview_fields = get_admin_preview_fields(node_model_name)
 
@@ -1767,12 +1706,7 @@ def node_creation_view(request, node_model_name):
 
         # Try to get the corresponding node model
         all_node_models = get_all_node_models()
-        node_model = None
-
-        # For each path of the node_models.py files :
-        for found_node_model in all_node_models:
-            if found_node_model.__name__ == node_model_name:
-                node_model = found_node_model
+        node_model = node_models_registry.get_node_model(node_model_name)
 
         admin_fields_dict = get_admin_fields(node_model_name)
 
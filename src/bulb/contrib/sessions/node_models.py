@@ -1,8 +1,8 @@
-from bulb.contrib.sessions.exceptions import BULBSessionError, BULBSessionDoesNotExist,\
-    BULBSessionDoesNotHaveData, BULBSessionWarning
+from bulb.contrib.sessions.exceptions import BULBSessionDoesNotExist, BULBSessionDoesNotHaveData, BULBSessionWarning
 from bulb.utils.log import bulb_logger
 from bulb.db import node_models
 from bulb.db.base import gdbh
+from bulb.db.utils import format_value_to_parameter
 from django.utils import timezone
 from django.conf import settings
 import importlib.util
@@ -73,7 +73,7 @@ class Session(node_models.Node, AbstractBaseSession):
 
     session_data = node_models.Property()
 
-    expire_date = node_models.Property()  # TODO : add db_index = True
+    expire_date = node_models.Property(index=True)
 
     related_user = RelatedUserRelationship()
 
@@ -116,124 +116,23 @@ class Session(node_models.Node, AbstractBaseSession):
         :param filter: Must be Q statement. You must use the Q class stored in bulb.db
                Example: Q(name__contains="al") | Q(age__year__lte=8)
 
-        :param return_query: Must be a boolean. If true, the method will return the cypher query.
+        :param return_query: Must be a boolean. If true, the method will return a tuple that contains the cypher query and
+                             its parameters dictionary.
 
         :return: If uuid is None, a list will be returned. Else it will be a unique instance.
         """
-        where_statement = ""
-        property_statement = ""
-        order_by_statement = ""
-        limit_statement = ""
-        skip_statement = ""
-        desc_statement = ""
+        queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                       filter=filter)
 
-        # Build the property_statement.
-        if uuid is not None and session_key is not None:
-            property_statement = "{uuid:'%s', session_key:'%s'}" % (uuid, session_key)
-
-        elif uuid is not None:
-            property_statement = "{uuid:'%s'}" % uuid
-
-        elif session_key is not None:
-            property_statement = "{session_key:'%s'}" % session_key
-
-        # Build the match_statement.
-        cyher_labels = node_models.DatabaseNode.format_labels_to_cypher(cls._get_labels())
-        match_statement = f"MATCH (s:{cyher_labels} {property_statement})"
-
-        # Build the where statement.
-        if filter is not None:
-            where_statement = "WHERE " + filter
-            where_statement = where_statement.replace("n.", "s.")
-
-        # Build the with_statement.
-        with_statement = "WITH s"
-
-        # Build order_by statements.
-        if order_by is not None:
-            order_by_statement = f"ORDER BY s.{order_by}"
-
-        # Build return_statement statements.
-        if not only:
-            return_statement = "RETURN (s)"
-
-        else:
-            only_statement_list = []
-
-            for element in only:
-                only_statement_list.append(f"s.{element}")
-
-            only_statement = ", ".join(only_statement_list)
-
-            return_statement = f"RETURN {only_statement}"
-
-        # Build limit_statement.
-        if limit is not None:
-            if not isinstance(limit, str) and not isinstance(limit, int):
-                bulb_logger.error(
-                    f'BULBSessionError("The \'limit\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                raise BULBSessionError(
-                    f"The 'limit' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-            else:
-                limit_statement = f"LIMIT {limit}"
-
-        # Build skip_statement and add its required variable.
-        if skip is not None:
-            if not isinstance(skip, str) and not isinstance(skip, int):
-                bulb_logger.error(
-                    f'BULBSessionError("The \'skip\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                raise BULBSessionError(
-                    f"The 'skip' parameter of the get() method of {cls.__name__} must be a string or an integer.")
-
-            else:
-                skip_statement = f"SKIP {skip}"
-
-        # Build desc_statement.
-        if not isinstance(desc, bool):
-            bulb_logger.error(
-                f'BULBSessionError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
-            raise BULBSessionError(
-                f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
-
-        else:
-            if desc is True:
-                desc_statement = "DESC"
-
-        request_statement = """
-             %s
-             %s
-             %s
-             %s
-             %s
-             %s
-             %s
-             %s
-             """ % (match_statement,
-                    where_statement,
-                    with_statement,
-                    order_by_statement,
-                    desc_statement,
-                    skip_statement,
-                    limit_statement,
-                    return_statement)
+        if session_key is not None:
+            queryset = queryset.filter(session_key=session_key)
 
         if return_query is False:
-            response = gdbh.r_transaction(request_statement)
+            response = list(queryset)
 
             if response:
-                if only is None:
-                    fake_instances_list = []
-
-                    for session_object in response:
-                        fake_instances_list.append(cls.build_fake_instance(session_object["s"],
-                                                                           forced_fake_instance_class=cls))
-
-                    if uuid is not None or session_key is not None:
-                        return fake_instances_list[0]
-
-                    else:
-                        return fake_instances_list
+                if only is None and (uuid is not None or session_key is not None):
+                    return response[0]
 
                 else:
                     return response
@@ -242,33 +141,22 @@ class Session(node_models.Node, AbstractBaseSession):
                 return None
 
         else:
-            return request_statement
+            return queryset.compile()
 
     @classmethod
     def count(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, **extrafields):
-        request_statement = cls.get(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
-                                    filter=filter, return_query=True, **extrafields)
-        request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(s)"
-        response = gdbh.r_transaction(request_count_statement)
-
-        return response[0]["COUNT(s)"]
+        return cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                   filter=filter).filter(**extrafields).count()
 
     @classmethod
     def exists(cls, session_key):
-        response = cls.get(session_key=session_key)
-
-        if response:
-            return True
-
-        else:
-            return False
+        return cls.objects.filter(session_key=session_key).exists()
 
     @classmethod
     def delete_session(cls, session_key):
-        response = cls.get(session_key=session_key)
-
-        if response:
-            gdbh.w_transaction("MATCH (s:Session {session_key:'%s'}) DETACH DELETE (s)" % session_key)
+        if cls.exists(session_key):
+            gdbh.w_transaction("MATCH (s:Session {session_key: $session_key}) DETACH DELETE (s)",
+                               {"session_key": session_key})
 
         else:
             bulb_logger.error(
@@ -277,11 +165,11 @@ class Session(node_models.Node, AbstractBaseSession):
 
     @classmethod
     def clear_expired_sessions(cls):
-        gdbh.r_transaction("""
+        gdbh.w_transaction("""
             MATCH (s:Session)
-            WHERE s.expire_date < datetime('%s')
+            WHERE s.expire_date < $now
             DETACH DELETE (s)
-            """ % str(timezone.now()).replace(' ', 'T'))
+            """, {"now": format_value_to_parameter(timezone.now())})
 
 
 def get_session_node_model():
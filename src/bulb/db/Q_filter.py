@@ -1,5 +1,5 @@
+from bulb.db.utils import format_value_to_parameter
 from bulb.utils.log import bulb_logger
-import datetime
 
 
 class BULBQError(Exception):
@@ -8,365 +8,386 @@ class BULBQError(Exception):
 
 class Qstr(str):
     """
-    :param complex_query: A simple query is when the search is done on the self instance properties (example:
-                          "user__name='John'". And a complex query is when the search is focused on the instances
-                          related (with a relationship) to the self instance (example: user__friends__name="John", we
-                          search all the friends with name="John")
+    A raw Cypher condition (example: "n.name = 'John'"). Qstr instances are accepted everywhere a Q statement is accepted,
+    and can be combined with the & and | operators with other Qstr instances (which gives a new Qstr) or with Q instances
+    (which gives a new Q instance).
     """
 
     def __or__(self, other):
-        self_statement = Qstr(self)
+        if isinstance(other, Q):
+            return Q(self) | other
 
-        if isinstance(other, Qstr):
-            return Qstr(self_statement + " OR " + other)
-
-        elif isinstance(other, Q):
-            other_statement = other.filter
-
-            if not other.complex_query:
-                return Qstr(self_statement + " OR " + other_statement)
+        elif isinstance(other, str):
+            return Qstr(self + " OR " + other)
 
         else:
             bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
             raise BULBQError("Q queries must contains only Q instances.")
 
     def __and__(self, other):
-        self_statement = Qstr(self)
-
-        if isinstance(other, Qstr):
-            return Qstr(self_statement + " AND " + other)
-
-        elif isinstance(other, Q):
-            other_statement = other.filter
-            return Qstr(self_statement + " AND " + other_statement)
-
-        else:
-            bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
-            raise BULBQError("Q queries must contains only Q instances.")
-
+        if isinstance(other, Q):
+            return Q(self) & other
 
-class Q:
-    def __init__(self, complex_query=False):
-        self.complex_query = complex_query
-
-    def __new__(cls, **kwargs):
-        instance = super().__new__(cls)
-        instance.filter = kwargs
-        instance.build_filter()
-        return instance.filter
-
-    def __or__(self, other):
-        self_statement = Qstr(self.filter)
-
-        if isinstance(other, Qstr):
-            return Qstr(self_statement + " OR " + other)
-
-        elif isinstance(other, Q):
-            other_statement = other.filter
-            return Qstr(self_statement + " OR " + other_statement)
+        elif isinstance(other, str):
+            return Qstr(self + " AND " + other)
 
         else:
             bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
             raise BULBQError("Q queries must contains only Q instances.")
 
-    def __and__(self, other):
-        self_statement = Qstr(self.filter)
-
-        if isinstance(other, Qstr):
-            return Qstr(self_statement + " AND " + other)
 
-        elif isinstance(other, Q):
-            other_statement = other.filter
-            return Qstr(self_statement + " AND " + other_statement)
+def _build_comparison(operator):
+    return lambda expression, parameter: f"{expression} {operator} {parameter}"
+
+
+# The lookups dispatch table : each action is associated with a function which takes the compiled property expression
+# (example: "n.name") and the name of the parameter of the value (example: "$q_0"), and returns the Cypher condition.
+# Each action can also be negated with the 'not_' prefix (example: "name__not_contains").
+LOOKUPS = {
+    # Structure lookups.
+    "exact": _build_comparison("="),
+    "startswith": _build_comparison("STARTS WITH"),
+    "endswith": _build_comparison("ENDS WITH"),
+    "contains": _build_comparison("CONTAINS"),
+    "regex": _build_comparison("=~"),
+
+    # Case insensitive structure lookups.
+    "iexact": lambda expression, parameter: f"toLower({expression}) = toLower({parameter})",
+    "istartswith": lambda expression, parameter: f"toLower({expression}) STARTS WITH toLower({parameter})",
+    "iendswith": lambda expression, parameter: f"toLower({expression}) ENDS WITH toLower({parameter})",
+    "icontains": lambda expression, parameter: f"toLower({expression}) CONTAINS toLower({parameter})",
+    "iregex": lambda expression, parameter: f"{expression} =~ ('(?i)' + {parameter})",
+
+    # Quantity and datetime lookups.
+    "lt": _build_comparison("<"),
+    "gt": _build_comparison(">"),
+    "lte": _build_comparison("<="),
+    "gte": _build_comparison(">="),
+
+    # List lookups (the value is a list, sent as a single parameter).
+    "in": _build_comparison("IN"),
+}
+
+# Datetime components lookups (example: "birthday__year_gte").
+for _component_name, _temporal_function in (("year", "date"), ("month", "date"), ("day", "date"),
+                                            ("hour", "time"), ("minute", "time"), ("second", "time")):
+    for _suffix, _operator in (("", "="), ("_exact", "="), ("_lt", "<"), ("_gt", ">"), ("_lte", "<="), ("_gte", ">=")):
+        LOOKUPS[_component_name + _suffix] = (
+            lambda expression, parameter, component_name=_component_name, temporal_function=_temporal_function,
+            operator=_operator: f"{temporal_function}({expression}).{component_name} {operator} {parameter}")
+
+
+class Lookup:
+    """
+    A leaf of the expression tree of a Q statement : a condition on a property of the filtered nodes, or of the nodes
+    related to them by relationships.
 
-        else:
-            bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
-            raise BULBQError("Q queries must contains only Q instances.")
+    :param property_name (required) : The name of the property.
 
-    def build_filter(self):
-        for property_name, property_value in self.filter.items():
-            filter_list = property_name.split("__")
+    :param action (required) : The action of the lookup (a key of the LOOKUPS dispatch table), optionally prefixed with
+                               'not_'.
 
-            if len(filter_list) == 2:
-                parameter_name = filter_list[0]
-                action = filter_list[1]
+    :param value (required) : The value compared to the property. It is sent to the database as a parameter.
 
-                # Structure filters.
-                if action == "startswith":
-                    self.filter = Qstr(f"n.{parameter_name} STARTS WITH '{property_value}'")
+    :param relationships_names (optional, default=()) : The names of the relationships to traverse, from the filtered
+                                                        nodes to the nodes which own the property. Example : ("friends",)
+    """
 
-                if action == "not_startswith":
-                    self.filter = Qstr(f"NOT n.{parameter_name} STARTS WITH '{property_value}'")
+    def __init__(self, property_name, action, value, relationships_names=()):
+        negated = action.startswith("not_")
+        base_action = action[4:] if negated else action
 
-                elif action == "endswith":
-                    self.filter = Qstr(f"n.{parameter_name} ENDS WITH '{property_value}'")
+        if base_action not in LOOKUPS:
+            bulb_logger.error(f'BULBQError("\'{action}\' is not a valid action of Q queries.")')
+            raise BULBQError(f"'{action}' is not a valid action of Q queries.")
 
-                elif action == "not_endswith":
-                    self.filter = Qstr(f"NOT n.{parameter_name} ENDS WITH '{property_value}'")
+        # Values which are not strings are compared as they are (like the previous Q statements did).
+        if base_action == "iexact" and not isinstance(value, str):
+            base_action = "exact"
 
-                elif action == "contains":
-                    self.filter = Qstr(f"n.{parameter_name} CONTAINS '{property_value}'")
+        # The values of the 'in' lookups must be lists (sets, tuples and other iterables are converted).
+        if base_action == "in":
+            if isinstance(value, (str, bytes, dict)) or not hasattr(value, "__iter__"):
+                bulb_logger.error(
+                    f'BULBQError("The value of the \'{action}\' lookup of the \'{property_name}\' property must be a list.")')
+                raise BULBQError(f"The value of the '{action}' lookup of the '{property_name}' property must be a list.")
 
-                elif action == "not_contains":
-                    self.filter = Qstr(f"NOT n.{parameter_name} CONTAINS '{property_value}'")
+            value = list(value)
 
-                elif action == "regex":
-                    self.filter = Qstr(f"n.{parameter_name} =~ '{property_value}'")
+        self.property_name = property_name
+        self.action = base_action
+        self.negated = negated
+        self.value = value
+        self.relationships_names = tuple(relationships_names)
 
-                elif action == "not_regex":
-                    self.filter = Qstr(f"NOT n.{parameter_name} =~ '{property_value}'")
+    def __repr__(self):
+        return f"<Lookup: {self._describe()}>"
 
-                elif action == "exact":
-                    if isinstance(property_value, bool) or isinstance(property_value, int) or isinstance(property_value, list):
-                        self.filter = Qstr(f"n.{parameter_name} = {property_value}")
+    def _describe(self):
+        """
+        This method returns the lookup as the keyword argument of Q which builds it.
+        Example : "friends__name__contains='al'"
+        """
+        action = f"not_{self.action}" if self.negated else self.action
+        keyword = "__".join(self.relationships_names + (self.property_name,) + ((action,) if action != "exact" else ()))
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} = datetime('{str(property_value).replace(' ', 'T')}')")
+        return f"{keyword}={self.value!r}"
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} = date('{property_value}')")
+    @staticmethod
+    def _is_action(name):
+        return name in LOOKUPS or (name.startswith("not_") and name[4:] in LOOKUPS)
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} = time('{property_value}')")
+    @classmethod
+    def from_keyword(cls, keyword, value):
+        """
+        This method builds a Lookup from a keyword argument of Q.
 
-                    elif isinstance(property_value, str):
-                        self.filter = Qstr(f"n.{parameter_name} = '{property_value}'")
+        :param keyword (required) : The keyword : 'property_name' (exact lookup) or 'property_name__action', optionally
+                                    prefixed with the names of the relationships to traverse.
+                                    Examples : "name", "name__contains", "friends__name__contains"
 
-                    else:
-                        self.filter = Qstr(f"n.{parameter_name} = '{property_value}'")
+        :param value (required) : The value compared to the property.
+        """
+        keyword_list = keyword.split("__")
 
-                elif action == "not_exact":
-                    if isinstance(property_value, bool) or isinstance(property_value, int) or isinstance(property_value, list):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = {property_value}")
+        if len(keyword_list) > 1 and cls._is_action(keyword_list[-1]):
+            action = keyword_list.pop()
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = datetime('{str(property_value).replace(' ', 'T')}')")
+        else:
+            action = "exact"
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = date('{property_value}')")
+        if not all(keyword_list):
+            bulb_logger.error('BULBQError("Q queries must respect the syntax : \'param__action=property_value\'")')
+            raise BULBQError("Q queries must respect the syntax : 'param__action=property_value'")
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = time('{property_value}')")
+        return cls(keyword_list[-1], action, value, relationships_names=keyword_list[:-1])
 
-                    elif isinstance(property_value, str):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = '{property_value}'")
+    def compile(self, node_variable, parameters, node_model=None):
+        """
+        This method compiles the lookup into a Cypher condition, and adds its value to the parameters dictionary.
+        If the lookup traverses relationships, the condition is true if any of the related nodes matches the lookup. The
+        related nodes are collected with pattern comprehensions, so the whole filter is run in the same query :
+            ANY(n_friends IN [(n)-[:FRIEND]-(n_friends:Person) | n_friends] WHERE n_friends.name = $q_0)
 
-                    else:
-                        self.filter = Qstr(f"NOT n.{parameter_name} = '{property_value}'")
+        :param node_variable (required) : The name of the variable of the filtered nodes in the query.
 
-                # Case insensitive structure filters.
-                elif action == "istartswith":
-                    self.filter = Qstr(f"n.{parameter_name} =~ '(?i){property_value}(.*)'")
+        :param parameters (required) : The parameters dictionary of the query.
 
-                elif action == "not_istartswith":
-                    self.filter = Qstr(f"NOT n.{parameter_name} =~ '(?i){property_value}(.*)'")
+        :param node_model (optional, default=None) : The node_model of the filtered nodes. It is required to traverse
+                                                     relationships.
 
-                elif action == "iendswith":
-                    self.filter = Qstr(f"n.{parameter_name} =~ '(?i)(.*){property_value}'")
+        :return: The Cypher condition.
+        """
+        traversal_patterns = []
+        current_node_model = node_model
+        current_variable = node_variable
 
-                elif action == "not_iendswith":
-                    self.filter = Qstr(f"NOT n.{parameter_name} =~ '(?i)(.*){property_value}'")
+        for relationship_name in self.relationships_names:
+            relationship = None
 
-                elif action == "icontains":
-                    self.filter = Qstr(f"n.{parameter_name} =~ '(?i)(.*){property_value}(.*)'")
+            if current_node_model is not None:
+                relationship = current_node_model._get_relationship_fields().get(relationship_name)
 
-                elif action == "not_icontains":
-                    self.filter = Qstr(f"NOT n.{parameter_name} =~ '(?i)(.*){property_value}(.*)'")
+            if relationship is None:
+                bulb_logger.error(
+                    f'BULBQError("\'{relationship_name}\' is not a relationship of the filtered nodes (or \'{self.property_name}\' is not a valid action of Q queries).")')
+                raise BULBQError(
+                    f"'{relationship_name}' is not a relationship of the filtered nodes (or '{self.property_name}' is not a valid action of Q queries).")
 
-                elif action == "iregex":
-                    self.filter = Qstr(f"n.{parameter_name} =~ '(?i){property_value}'")
+            if relationship.manage_is_done is False:
+                relationship._manage_relationship_parameters()
+                relationship.manage_is_done = True
 
-                elif action == "not_iregex":
-                    self.filter = Qstr(f"NOT n.{parameter_name} =~ '(?i){property_value}'")
+            related_variable = f"{current_variable}_{relationship_name}"
+            related_nodes_labels = relationship._get_related_nodes_labels(current_node_model)
 
-                elif action == "iexact":
-                    if isinstance(property_value, bool) or isinstance(property_value, int) or isinstance(property_value, list):
-                        self.filter = Qstr(f"n.{parameter_name} = {property_value}")
+            traversal_patterns.append(
+                (related_variable,
+                 f"({current_variable})-[:{relationship.rel_type}]-({related_variable}{related_nodes_labels})"))
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} = datetime('{str(property_value).replace(' ', 'T')}')")
+            # Find the node_model of the related nodes, to traverse their own relationships.
+            related_node_model = relationship.start if relationship.direction == "to" else relationship.target
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} = date('{property_value}')")
+            if related_node_model != "self":
+                current_node_model = related_node_model if isinstance(related_node_model, type) else None
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} = time('{property_value}')")
+            current_variable = related_variable
 
-                    elif isinstance(property_value, str):
-                        self.filter = Qstr(f"n.{parameter_name} =~ '(?i){property_value}'")
+        parameter_name = Q._add_parameter(parameters, self.value)
+        condition = LOOKUPS[self.action](f"{current_variable}.{self.property_name}", "$" + parameter_name)
 
-                    else:
-                        self.filter = Qstr(f"n.{parameter_name} =~ '(?i){property_value}'")
+        if self.negated:
+            condition = f"NOT {condition}"
 
-                elif action == "not_iexact":
-                    if isinstance(property_value, bool) or isinstance(property_value, int) or isinstance(property_value, list):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = {property_value}")
+        for related_variable, traversal_pattern in reversed(traversal_patterns):
+            condition = f"ANY({related_variable} IN [{traversal_pattern} | {related_variable}] WHERE {condition})"
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = datetime('{str(property_value).replace(' ', 'T')}')")
+        return condition
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = date('{property_value}')")
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"NOT n.{parameter_name} = time('{property_value}')")
+class Q:
+    """
+    A filter statement, built as an expression tree : its children are lookups (given as keyword arguments), other Q
+    statements or raw Cypher conditions (strings or Qstr instances), joined with AND. Q statements can be combined with
+    the & (AND), | (OR) and ~ (NOT) operators.
 
-                    elif isinstance(property_value, str):
-                        self.filter = Qstr(f"NOT n.{parameter_name} =~ '(?i){property_value}'")
+    The Q statements are compiled into Cypher conditions whose values are sent as parameters (see compile()). So the same
+    filter shape always gives the same query, whatever the values are.
 
-                    else:
-                        self.filter = Qstr(f"n.{parameter_name} =~ '(?i){property_value}'")
+    The lookups can traverse the relationships of the filtered nodes (and of the related nodes) : the condition is true if
+    any of the related nodes matches the lookup.
 
-                # Quantity and datetime filters.
-                elif action == "lt":
-                    if isinstance(property_value, int):
-                        self.filter = Qstr(f"n.{parameter_name} < {property_value}")
+    Examples :
+        Q(name__contains="al") | Q(birthday__year_lte=2012)
+        ~Q(first_name="John") & Q(last_name__istartswith="do")
+        Q(friends__first_name="John") | Q(groups__permissions__codename__startswith="view")
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} < datetime('{str(property_value).replace(' ', 'T')}')")
+    :param children (optional) : Q statements or raw Cypher conditions.
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} < date('{property_value}')")
+    :param lookups (optional) : Lookups of the form property_name=value or property_name__action=value (see the LOOKUPS
+                                dispatch table for the available actions).
+    """
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} < time('{property_value}')")
+    AND = "AND"
+    OR = "OR"
 
-                elif action == "gt":
-                    if isinstance(property_value, int):
-                        self.filter = Qstr(f"n.{parameter_name} > {property_value}")
+    def __init__(self, *children, **lookups):
+        self.connector = Q.AND
+        self.negated = False
+        self.children = []
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} > datetime('{str(property_value).replace(' ', 'T')}')")
+        for child in children:
+            if not isinstance(child, (Q, str)):
+                bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
+                raise BULBQError("Q queries must contains only Q instances.")
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} > date('{property_value}')")
+            self.children.append(child)
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} > time('{property_value}')")
+        for keyword, value in lookups.items():
+            self.children.append(Lookup.from_keyword(keyword, value))
 
-                elif action == "lte":
-                    if isinstance(property_value, int):
-                        self.filter = Qstr(f"n.{parameter_name} <= {property_value}")
+    def __repr__(self):
+        return f"<Q: {self._describe()}>"
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} <= datetime('{str(property_value).replace(' ', 'T')}')")
+    def _describe(self):
+        """
+        This method returns a readable description of the expression tree of the Q statement, without compiling it (so
+        the lookups which traverse relationships are described without the node_model).
+        Example : "(first_name='John' OR friends__first_name='John') AND NOT (age__lt=18)"
+        """
+        described_children = []
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} <= date('{property_value}')")
+        for child in self.children:
+            if isinstance(child, Q):
+                described_child = child._describe()
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} <= time('{property_value}')")
+                if len(child.children) > 1 and not child.negated:
+                    described_child = f"({described_child})"
 
-                elif action == "gte":
-                    if isinstance(property_value, int):
-                        self.filter = Qstr(f"n.{parameter_name} >= {property_value}")
+            elif isinstance(child, Lookup):
+                described_child = child._describe()
 
-                    elif isinstance(property_value, datetime.datetime):
-                        self.filter = Qstr(f"n.{parameter_name} >= datetime('{str(property_value).replace(' ', 'T')}')")
+            else:
+                described_child = "(" + (child[6:] if child[0:6] == "WHERE " else child) + ")"
 
-                    elif isinstance(property_value, datetime.date):
-                        self.filter = Qstr(f"n.{parameter_name} >= date('{property_value}')")
+            described_children.append(described_child)
 
-                    elif isinstance(property_value, datetime.time):
-                        self.filter = Qstr(f"n.{parameter_name} >= time('{property_value}')")
+        description = f" {self.connector} ".join(described_children)
 
-                # Year.
-                elif action == "year" or action == "year_exact":
-                    self.filter = Qstr(f"date(n.{parameter_name}).year = {property_value}")
+        if self.negated:
+            description = f"NOT ({description})"
 
-                elif action == "year_lt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).year < {property_value}")
+        return description
 
-                elif action == "year_gt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).year > {property_value}")
+    def __bool__(self):
+        return bool(self.children)
 
-                elif action == "year_lte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).year <= {property_value}")
+    def _combine(self, other, connector):
+        if isinstance(other, str):
+            other = Q(other)
 
-                elif action == "year_gte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).year >= {property_value}")
+        elif not isinstance(other, Q):
+            bulb_logger.error('BULBQError("Q queries must contains only Q instances.")')
+            raise BULBQError("Q queries must contains only Q instances.")
 
-                # Month.
-                elif action == "month" or action == "month_exact":
-                    self.filter = Qstr(f"date(n.{parameter_name}).month = {property_value}")
+        combined_q = Q()
+        combined_q.connector = connector
+        combined_q.children = [child for child in (self, other) if child]
 
-                elif action == "month_lt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).month < {property_value}")
+        return combined_q
 
-                elif action == "month_gt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).month > {property_value}")
+    def __and__(self, other):
+        return self._combine(other, Q.AND)
 
-                elif action == "month_lte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).month <= {property_value}")
+    def __or__(self, other):
+        return self._combine(other, Q.OR)
 
-                elif action == "month_gte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).month >= {property_value}")
+    def __rand__(self, other):
+        return Q(other)._combine(self, Q.AND)
 
-                # Day.
-                elif action == "day" or action == "day_exact":
-                    self.filter = Qstr(f"date(n.{parameter_name}).day = {property_value}")
+    def __ror__(self, other):
+        return Q(other)._combine(self, Q.OR)
 
-                elif action == "day_lt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).day < {property_value}")
+    def __invert__(self):
+        negated_q = Q()
+        negated_q.connector = self.connector
+        negated_q.children = list(self.children)
+        negated_q.negated = not self.negated
 
-                elif action == "day_gt":
-                    self.filter = Qstr(f"date(n.{parameter_name}).day > {property_value}")
+        return negated_q
 
-                elif action == "day_lte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).day <= {property_value}")
+    @staticmethod
+    def _add_parameter(parameters, value):
+        """
+        This method adds a value to the parameters dictionary of a query, under a new name, and returns this name.
+        """
+        parameter_index = len(parameters)
 
-                elif action == "day_gte":
-                    self.filter = Qstr(f"date(n.{parameter_name}).day >= {property_value}")
+        while f"q_{parameter_index}" in parameters:
+            parameter_index += 1
 
-                # Hour.
-                elif action == "hour" or action == "hour_exact":
-                    self.filter = Qstr(f"time(n.{parameter_name}).hour = {property_value}")
+        parameter_name = f"q_{parameter_index}"
+        parameters[parameter_name] = format_value_to_parameter(value)
 
-                elif action == "hour_lt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).hour < {property_value}")
+        return parameter_name
 
-                elif action == "hour_gt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).hour > {property_value}")
+    def compile(self, node_variable="n", parameters=None, node_model=None):
+        """
+        This method compiles the Q statement into a Cypher condition.
 
-                elif action == "hour_lte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).hour <= {property_value}")
+        :param node_variable (optional, default="n") : The name of the variable of the filtered nodes in the query.
 
-                elif action == "hour_gte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).hour >= {property_value}")
+        :param parameters (optional, default=None) : The parameters dictionary of the query. The values of the lookups are
+                                                     added to it (so a Q statement can be compiled into an existing query).
 
-                # Minute.
-                elif action == "minute" or action == "minute_exact":
-                    self.filter = Qstr(f"time(n.{parameter_name}).minute = {property_value}")
+        :param node_model (optional, default=None) : The node_model of the filtered nodes. It is required by the lookups
+                                                     which traverse relationships.
 
-                elif action == "minute_lt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).minute < {property_value}")
+        :return: A tuple that contains the Cypher condition and the parameters dictionary.
+        """
+        if parameters is None:
+            parameters = {}
 
-                elif action == "minute_gt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).minute > {property_value}")
+        compiled_children = []
 
-                elif action == "minute_lte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).minute <= {property_value}")
+        for child in self.children:
+            if isinstance(child, Q):
+                compiled_child = child.compile(node_variable, parameters, node_model)[0]
 
-                elif action == "minute_gte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).minute >= {property_value}")
+                if len(child.children) > 1 and not child.negated:
+                    compiled_child = f"({compiled_child})"
 
-                # Second.
-                elif action == "second" or action == "second_exact":
-                    self.filter = Qstr(f"time(n.{parameter_name}).second = {property_value}")
+            elif isinstance(child, Lookup):
+                compiled_child = child.compile(node_variable, parameters, node_model)
 
-                elif action == "second_lt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).second < {property_value}")
+            else:
+                compiled_child = "(" + (child[6:] if child[0:6] == "WHERE " else child) + ")"
 
-                elif action == "second_gt":
-                    self.filter = Qstr(f"time(n.{parameter_name}).second > {property_value}")
+            compiled_children.append(compiled_child)
 
-                elif action == "second_lte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).second <= {property_value}")
+        condition = f" {self.connector} ".join(compiled_children)
 
-                elif action == "second_gte":
-                    self.filter = Qstr(f"time(n.{parameter_name}).second >= {property_value}")
+        if self.negated:
+            condition = f"NOT ({condition})"
 
-            else:
-                bulb_logger.error(
-                    'BULBQError("Q queries must respect the syntax : \'param__action=property_value\'")')
-                raise BULBQError("Q queries must respect the syntax : 'param__action=property_value'")
+        return condition, parameters
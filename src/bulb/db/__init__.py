@@ -1,2 +1,4 @@
 from bulb.db.base import gdbh
-from bulb.db.Q_filter import Q, Qstr
\ No newline at end of file
+from bulb.db.Q_filter import Q, Qstr
+from bulb.db.aggregates import Count, Sum, Avg, Min, Max
+from bulb.db.indexes import Index, PointIndex, FullTextIndex
\ No newline at end of file
@@ -0,0 +1,93 @@
+from bulb.db.exceptions import BULBQuerySetError
+from bulb.utils.log import bulb_logger
+
+
+class Aggregate:
+    """
+    An aggregation function computed by the database on the nodes of a QuerySet (see QuerySet.aggregate() and
+    QuerySet.annotate()). This class should not be instantiated directly : use one of its children classes.
+
+    :param property_name (optional, default=None) : The name of the aggregated property. If it is None, the nodes
+                                                    themselves are aggregated (only supported by Count).
+
+    :param distinct (optional, default=False) : Must be a boolean. If it is True, only the distinct values are aggregated.
+    """
+
+    function_name = None
+    requires_property = True
+
+    def __init__(self, property_name=None, distinct=False):
+        if property_name is None and self.requires_property:
+            bulb_logger.error(
+                f'BULBQuerySetError("The {self.__class__.__name__} aggregate must take the name of a property.")')
+            raise BULBQuerySetError(f"The {self.__class__.__name__} aggregate must take the name of a property.")
+
+        if not isinstance(distinct, bool):
+            bulb_logger.error(
+                f'BULBQuerySetError("The \'distinct\' parameter of the {self.__class__.__name__} aggregate must be a boolean.")')
+            raise BULBQuerySetError(
+                f"The 'distinct' parameter of the {self.__class__.__name__} aggregate must be a boolean.")
+
+        self.property_name = property_name
+        self.distinct = distinct
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({self.property_name!r})>'
+
+    def compile(self, node_variable="n"):
+        """
+        This method compiles the aggregate into a Cypher aggregation function.
+
+        :param node_variable (optional, default="n") : The name of the variable of the aggregated nodes in the query.
+
+        :return: The Cypher expression. Example : "sum(n.price)"
+        """
+        aggregated_expression = node_variable if self.property_name is None else f"{node_variable}.{self.property_name}"
+
+        return f"{self.function_name}({'DISTINCT ' if self.distinct else ''}{aggregated_expression})"
+
+
+class Count(Aggregate):
+    """
+    Count the nodes, or the non null values of a property.
+    Example : Product.objects.aggregate(products_count=Count())
+    """
+
+    function_name = "count"
+    requires_property = False
+
+
+class Sum(Aggregate):
+    """
+    Sum the values of a property.
+    Example : Product.objects.aggregate(total=Sum("price"))
+    """
+
+    function_name = "sum"
+
+
+class Avg(Aggregate):
+    """
+    Average the values of a property.
+    Example : Product.objects.aggregate(average_price=Avg("price"))
+    """
+
+    function_name = "avg"
+
+
+class Min(Aggregate):
+    """
+    Return the smallest value of a property.
+    Example : Product.objects.aggregate(cheapest=Min("price"))
+    """
+
+    function_name = "min"
+
+
+class Max(Aggregate):
+    """
+    Return the biggest value of a property.
+    Example : Product.objects.aggregate(most_expensive=Max("price"))
+    """
+
+    function_name = "max"
@@ -1,8 +1,9 @@
 from bulb.utils.log import bulb_logger
 from neo4j.v1 import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j.exceptions import ServiceUnavailable, AuthError, ConstraintError
 from bulb.db.exceptions import *
 from django.conf import settings
+import threading
 import warnings
 import time
 
@@ -170,16 +171,25 @@ class Session:
     :param (optional) bookmarks : The bookmark in a Neo4j causal chaining.
                                   Explanation here:
                                   https://neo4j.com/docs/driver-manual/1.7/sessions-transactions/#driver-transactions-causal-chaining
+    :param (optional) fetch_size : The number of records fetched by each network round trip when a result is streamed. It
+                                   is only sent to the drivers which support it (the 1.7 driver streams the records as they
+                                   arrive and ignores it).
     """
-    def __init__(self, database_instance, type=None, bookmarks=None):
+    def __init__(self, database_instance, type=None, bookmarks=None, fetch_size=None):
         self.database_instance = database_instance
         self.type = Session.check_and_set_session_type(type)
         self.session = None
         self.bookmarks = bookmarks
+        self.fetch_size = fetch_size
 
     def __enter__(self):
+        session_parameters = {"access_mode": self.type, "bookmark": self.bookmarks}
+
+        if self.fetch_size is not None:
+            session_parameters["fetch_size"] = self.fetch_size
+
         try:
-            self.session = self.database_instance.driver.session(access_mode=self.type, bookmark=self.bookmarks)
+            self.session = self.database_instance.driver.session(**session_parameters)
         except AttributeError:
             bulb_logger.error(
                 'BULBConnectionError("Failed to establish connection with the database. Check yours given informations (uri, id and password).")')
@@ -211,11 +221,17 @@ class Transaction:
                              Explanations here :
                              https://neo4j.com/docs/driver-manual/1.7/sessions-transactions/#driver-transactions-access-mode
     :param (required) cypher_query : The cypher query to send to the Neo4j database.
+    :param (optional) parameters : A dictionary of parameters referenced in the cypher query with the $name syntax.
+                                   Using parameters instead of interpolated values allows the Neo4j database to reuse
+                                   the execution plan of queries which have the same shape.
+                                   Explanations here :
+                                   https://neo4j.com/docs/cypher-manual/3.5/syntax/parameters/
     """
-    def __init__(self, session, type, cypher_query):
+    def __init__(self, session, type, cypher_query, parameters=None):
         self.session = session
         self.type = Transaction.check_and_set_transaction_type(type)
         self.cypher_query = cypher_query
+        self.parameters = parameters
 
         self.active_transaction = None
 
@@ -223,11 +239,13 @@ class Transaction:
         if self.active_transaction is None:
             if self.type == 'WRITE':
                 self.active_transaction = self.session.write_transaction(
-                    lambda tx, cypher_query: tx.run(cypher_query), self.cypher_query)
+                    lambda tx, cypher_query, parameters: tx.run(cypher_query, parameters),
+                    self.cypher_query, self.parameters)
                 return self.active_transaction.data()
             else:
                 self.active_transaction = self.session.read_transaction(
-                    lambda tx, cypher_query: tx.run(cypher_query), self.cypher_query)
+                    lambda tx, cypher_query, parameters: tx.run(cypher_query, parameters),
+                    self.cypher_query, self.parameters)
                 return self.active_transaction.data()
         else:
             bulb_logger.error('BULBTransactionError("A transaction is already running...")')
@@ -247,6 +265,132 @@ class Transaction:
             return transaction_type
 
 
+class ExplicitTransaction:
+    """
+    This class opens a Neo4j session and an explicit transaction that stays open during a whole 'with' block, then
+    commits it once at the end of the block (or rollbacks it if an exception is raised in the block).
+    While it is running, all the queries sent with the w_transaction() and r_transaction() methods of the
+    GraphDatabaseHandler (and so all the node models' methods : create(), update(), delete(), Relationship.add(), etc...)
+    are executed in it instead of opening a new session and a new transaction for each statement.
+    If an ExplicitTransaction is started while another one is already running in the same thread, it joins the running
+    one : only the outermost block commits.
+    Explanations here : https://neo4j.com/docs/driver-manual/1.7/sessions-transactions/#driver-transactions
+
+    NB : Only the database operations are rollbacked, the files already stored on the SFTP server are kept.
+
+    :param (required) database_handler : The GraphDatabaseHandler instance that will run the transaction.
+    :param (optional) type : The type of the transaction ('WRITE' or 'READ'). Default = 'WRITE'.
+    :param (optional) bookmarks : The bookmarks in a Neo4j causal chaining.
+    """
+    def __init__(self, database_handler, type='WRITE', bookmarks=None):
+        self.database_handler = database_handler
+        self.type = Transaction.check_and_set_transaction_type(type)
+        self.bookmarks = bookmarks
+
+        self.session = None
+        self.driver_session = None
+        self.active_transaction = None
+        self.joined_transaction = None
+        self.needs_rollback = False
+        self.last_bookmark = None
+
+    def run(self, cypher_query, parameters=None):
+        """
+        This method executes a cypher query in the running transaction.
+        :param cypher_query: The cypher query to send to the Neo4j database.
+        :param parameters: The parameters dictionary of the cypher query (values referenced with the $name syntax).
+        :return: The response of the database.
+        """
+        if self.active_transaction is None:
+            bulb_logger.error('BULBTransactionError("The transaction is not running.")')
+            raise BULBTransactionError("The transaction is not running.")
+
+        try:
+            return self.active_transaction.run(cypher_query, parameters).data()
+
+        except Exception:
+            # The database has failed the transaction : it must not be committed, even if the error is caught.
+            self.needs_rollback = True
+            raise
+
+    def stream(self, cypher_query, parameters=None):
+        """
+        This method executes a cypher query in the running transaction and yields its records one by one.
+        :param cypher_query: The cypher query to send to the Neo4j database.
+        :param parameters: The parameters dictionary of the cypher query (values referenced with the $name syntax).
+        :return: A generator of the records of the response, as dicts.
+        """
+        if self.active_transaction is None:
+            bulb_logger.error('BULBTransactionError("The transaction is not running.")')
+            raise BULBTransactionError("The transaction is not running.")
+
+        try:
+            for record in self.active_transaction.run(cypher_query, parameters).records():
+                yield record.data()
+
+        except Exception:
+            # The database has failed the transaction : it must not be committed, even if the error is caught.
+            self.needs_rollback = True
+            raise
+
+    def __enter__(self):
+        running_transaction = self.database_handler.get_running_transaction()
+
+        # Join the running transaction.
+        if running_transaction is not None:
+            if self.type == 'WRITE' and running_transaction.type == 'READ':
+                bulb_logger.error(
+                    'BULBTransactionError("A \'WRITE\' transaction cannot join a running \'READ\' transaction.")')
+                raise BULBTransactionError("A 'WRITE' transaction cannot join a running 'READ' transaction.")
+
+            self.joined_transaction = running_transaction
+            return running_transaction
+
+        self.session = self.database_handler.init_session(self.type, self.bookmarks)
+        self.driver_session = self.session.__enter__()
+
+        try:
+            self.active_transaction = self.driver_session.begin_transaction()
+
+        except Exception:
+            self.session.__exit__(None, None, None)
+            raise
+
+        self.database_handler._set_running_transaction(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Let the outermost transaction commit or rollback.
+        if self.joined_transaction is not None:
+            if exc_type is not None:
+                self.joined_transaction.needs_rollback = True
+
+            self.joined_transaction = None
+            return False
+
+        self.database_handler._set_running_transaction(None)
+
+        try:
+            if exc_type is None and not self.needs_rollback:
+                self.active_transaction.commit()
+
+            else:
+                self.active_transaction.rollback()
+
+        finally:
+            self.active_transaction = None
+            self.last_bookmark = self.driver_session.last_bookmark()
+            self.session.__exit__(exc_type, exc_val, exc_tb)
+
+        if exc_type is None and self.needs_rollback:
+            bulb_logger.error(
+                'BULBTransactionError("An error occurred in a nested transaction block or in a query of the transaction, the whole transaction has been rollbacked.")')
+            raise BULBTransactionError(
+                "An error occurred in a nested transaction block or in a query of the transaction, the whole transaction has been rollbacked.")
+
+        return False
+
+
 class GraphDatabaseHandler:
     """
     This class handles interactions between instances of the three above classes.
@@ -257,47 +401,162 @@ class GraphDatabaseHandler:
         self.database_instance = Database()
         self.database_instance.open_connection()
 
+        # Store the running explicit transaction of each thread.
+        self._local = threading.local()
+
     def get_database_instance(self):
         return self.database_instance
 
-    def init_session(self, type=None, bookmarks=None):
+    def init_session(self, type=None, bookmarks=None, fetch_size=None):
         """
         This method creates and return a Session instance.
 
         :param (optional) type: The type of the session ('WRITE' or 'READ')
         :param (optional) bookmarks: The bookmarks recovered by the session.
+        :param (optional) fetch_size: The number of records fetched by each network round trip of a streamed result.
         """
-        return Session(database_instance=self.database_instance, type=type, bookmarks=bookmarks)
+        return Session(database_instance=self.database_instance, type=type, bookmarks=bookmarks, fetch_size=fetch_size)
 
-    def init_transaction(self, session, type, cypher_query):
+    def init_transaction(self, session, type, cypher_query, parameters=None):
         """
         This method creates and return a Transaction instance.
 
         :param (required) session: The session instance where is contained the transaction.
         :param (required) type: The type of the session.
         :param (required) cypher_query: The cypher query to send to the Neo4j database.
+        :param (optional) parameters: The parameters dictionary of the cypher query.
+        """
+        return Transaction(session=session, type=type, cypher_query=cypher_query, parameters=parameters)
+
+    def transaction(self, type='WRITE', bookmarks=None):
         """
-        return Transaction(session=session, type=type, cypher_query=cypher_query)
+        This method creates and return an ExplicitTransaction instance, to use with the 'with' statement :
+
+            with gdbh.transaction("WRITE"):
+                user = User.create(...)
+                user.groups.add(group)
 
-    def w_transaction(self, cypher_query):
+        :param (optional) type: The type of the transaction ('WRITE' or 'READ'). Default = 'WRITE'.
+        :param (optional) bookmarks: The bookmarks recovered by the session of the transaction.
+        """
+        return ExplicitTransaction(database_handler=self, type=type, bookmarks=bookmarks)
+
+    def get_running_transaction(self):
+        """
+        :return: The ExplicitTransaction instance running in the current thread, or None.
+        """
+        return getattr(self._local, "running_transaction", None)
+
+    def _set_running_transaction(self, explicit_transaction):
+        self._local.running_transaction = explicit_transaction
+
+    def w_transaction(self, cypher_query, parameters=None):
         """
         This method pre-configures and executes a writing transaction.
+        If an explicit transaction is running (see the transaction() method), the query is executed in it.
+        The constraints errors raised by the database are translated into BULBUniqueConstraintError and
+        BULBRequiredConstraintError (see the BULB_USE_DATABASE_UNIQUE_CONSTRAINTS setting).
         :param cypher_query: The cypher query to send to the Neo4j database.
+        :param parameters: The parameters dictionary of the cypher query (values referenced with the $name syntax).
         :return: The response of the database.
         """
-        with self.init_session('WRITE') as writing_session:
-            with self.init_transaction(writing_session, 'WRITE', cypher_query) as writing_transaction:
-                return writing_transaction
+        running_transaction = self.get_running_transaction()
+
+        if running_transaction is not None:
+            if running_transaction.type == 'READ':
+                bulb_logger.error(
+                    'BULBTransactionError("A writing query cannot be executed in a running \'READ\' transaction.")')
+                raise BULBTransactionError("A writing query cannot be executed in a running 'READ' transaction.")
+
+            # If the query fails, the running transaction is marked to be rollbacked (see ExplicitTransaction.run()), so
+            # catching the translated error doesn't commit a transaction which has been failed by the database.
+            try:
+                return running_transaction.run(cypher_query, parameters)
+
+            except ConstraintError as error:
+                self._raise_constraint_error(error)
+
+        try:
+            with self.init_session('WRITE') as writing_session:
+                with self.init_transaction(writing_session, 'WRITE', cypher_query, parameters) as writing_transaction:
+                    return writing_transaction
 
-    def r_transaction(self, cypher_query):
+        except ConstraintError as error:
+            self._raise_constraint_error(error)
+
+    @staticmethod
+    def _raise_constraint_error(error):
+        """
+        This method translates a constraint error of the Neo4j driver into a bulb error and raises it.
+        :param error: The neo4j.exceptions.ConstraintError instance.
+        """
+        error_message = str(error).replace('"', "'")
+
+        # The UNIQUE constraints errors look like : "Node(0) already exists with label `User` and property `email` = '...'"
+        if "already exists" in error_message:
+            bulb_logger.error(f'BULBUniqueConstraintError("{error_message}")')
+            raise BULBUniqueConstraintError(error_message) from error
+
+        else:
+            bulb_logger.error(f'BULBRequiredConstraintError("{error_message}")')
+            raise BULBRequiredConstraintError(error_message) from error
+
+    def r_transaction(self, cypher_query, parameters=None):
         """
         This method pre-configures and executes a reading transaction.
+        If an explicit transaction is running (see the transaction() method), the query is executed in it, so it can
+        read the uncommitted changes of this transaction.
         :param cypher_query: The cypher query to send to the Neo4j database.
+        :param parameters: The parameters dictionary of the cypher query (values referenced with the $name syntax).
         :return: The response of the database.
         """
+        running_transaction = self.get_running_transaction()
+
+        if running_transaction is not None:
+            return running_transaction.run(cypher_query, parameters)
+
         with self.init_session('READ') as reading_session:
-            with self.init_transaction(reading_session, 'READ', cypher_query) as reading_transaction:
+            with self.init_transaction(reading_session, 'READ', cypher_query, parameters) as reading_transaction:
                 return reading_transaction
 
+    def stream(self, cypher_query, parameters=None, type='READ', fetch_size=None):
+        """
+        This method executes a cypher query and yields the records of the response one by one, as they are received from
+        the database, instead of loading the whole response in memory like the w_transaction() and r_transaction() methods.
+        If an explicit transaction is running (see the transaction() method), the query is executed in it.
+        Else, the query is executed in a transaction which is committed once all the records have been consumed (and
+        rollbacked if the generator is closed before).
+        :param cypher_query: The cypher query to send to the Neo4j database.
+        :param parameters: The parameters dictionary of the cypher query (values referenced with the $name syntax).
+        :param type: The type of the transaction ('WRITE' or 'READ'). Default = 'READ'.
+        :param fetch_size: The number of records fetched by each network round trip (see the Session class).
+        :return: A generator of the records of the response, as dicts.
+        """
+        transaction_type = Transaction.check_and_set_transaction_type(type)
+        running_transaction = self.get_running_transaction()
+
+        if running_transaction is not None:
+            if transaction_type == 'WRITE' and running_transaction.type == 'READ':
+                bulb_logger.error(
+                    'BULBTransactionError("A writing query cannot be executed in a running \'READ\' transaction.")')
+                raise BULBTransactionError("A writing query cannot be executed in a running 'READ' transaction.")
+
+            yield from running_transaction.stream(cypher_query, parameters)
+            return
+
+        with self.init_session(transaction_type, fetch_size=fetch_size) as streaming_session:
+            streaming_transaction = streaming_session.begin_transaction()
+
+            try:
+                for record in streaming_transaction.run(cypher_query, parameters).records():
+                    yield record.data()
+
+            except BaseException:
+                streaming_transaction.rollback()
+                raise
+
+            else:
+                streaming_transaction.commit()
+
 
 gdbh = GraphDatabaseHandler()
@@ -30,6 +30,11 @@ class BULBLabelsError(BULBNodeError):
     pass
 
 
+#  BULBException --> BULBDatabaseError --> BULBNodeError --> BULBQuerySetError
+class BULBQuerySetError(BULBNodeError):
+    pass
+
+
 #  BULBException --> BULBDatabaseError --> BULBPropertyError
 class BULBPropertyError(BULBDatabaseError):
     pass
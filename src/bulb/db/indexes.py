@@ -0,0 +1,129 @@
+from bulb.db.exceptions import BULBNodeError
+from bulb.utils.log import bulb_logger
+from bulb.db.base import gdbh
+
+
+class Index:
+    """
+    A range index on one or many properties of the nodes of a node_model. The indexes are declared with 'index=True' on a
+    property, or in the 'indexes' list of the Meta class of a node_model (composite indexes), and they are created (and
+    dropped once they are not declared anymore) by the bulb-apply command.
+
+    Example :
+        class Person(node_models.Node):
+            first_name = node_models.Property()
+            last_name = node_models.Property(index=True)
+
+            class Meta:
+                indexes = [Index("last_name", "first_name")]
+
+    :param properties_names (required) : The names of the indexed properties. The order matters for the composite indexes.
+    """
+
+    index_type = "node_label_property"
+
+    def __init__(self, *properties_names):
+        if not properties_names or not all(isinstance(property_name, str) and property_name
+                                           for property_name in properties_names):
+            bulb_logger.error(
+                f'BULBNodeError("The {self.__class__.__name__} index must take the names of the indexed properties.")')
+            raise BULBNodeError(f"The {self.__class__.__name__} index must take the names of the indexed properties.")
+
+        self.properties_names = tuple(properties_names)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({", ".join(repr(name) for name in self.properties_names)})>'
+
+    def get_key(self, label):
+        """
+        :return: The key which identifies the index of the label in the database (see get_database_indexes()).
+        """
+        return self.index_type, (label,), self.properties_names
+
+    def get_create_query(self, label):
+        """
+        :return: A tuple that contains the cypher query which creates the index of the label, and its parameters.
+        """
+        return f"CREATE INDEX ON :{label}({', '.join(self.properties_names)})", {}
+
+
+class PointIndex(Index):
+    """
+    An index on a property configured with 'spatial_2D=True', used by the spatial queries (like
+    "WHERE distance(n.location, $point) < 1000"). The points are stored in the same native indexes as the other values,
+    so a PointIndex is a range index on a single property.
+
+    :param property_name (required) : The name of the indexed property.
+    """
+
+    def __init__(self, property_name):
+        super().__init__(property_name)
+
+
+class FullTextIndex(Index):
+    """
+    A full-text index on one or many string properties, queried with the db.index.fulltext.queryNodes() procedure.
+
+    :param properties_names (required) : The names of the indexed properties.
+
+    :param name (optional, default=None) : The name of the index (the name given to db.index.fulltext.queryNodes()). If it
+                                           is None, the name is "<label>_<properties_names>_fulltext".
+    """
+
+    index_type = "node_fulltext"
+
+    def __init__(self, *properties_names, name=None):
+        super().__init__(*properties_names)
+
+        if name is not None and not isinstance(name, str):
+            bulb_logger.error('BULBNodeError("The \'name\' parameter of the FullTextIndex index must be a string.")')
+            raise BULBNodeError("The 'name' parameter of the FullTextIndex index must be a string.")
+
+        self.name = name
+
+    def get_name(self, label):
+        return self.name or f"{label}_{'_'.join(self.properties_names)}_fulltext"
+
+    def get_key(self, label):
+        return self.index_type, (label,), self.properties_names, self.get_name(label)
+
+    def get_create_query(self, label):
+        return ("CALL db.index.fulltext.createNodeIndex($name, $labels, $properties_names)",
+                {"name": self.get_name(label), "labels": [label], "properties_names": list(self.properties_names)})
+
+
+def get_database_indexes():
+    """
+    This function returns the indexes of the database (except those of the constraints, which are handled with the
+    constraints), as a dict whose keys identify the indexes like the get_key() method of the Index classes, and whose
+    values are the cypher queries (with their parameters) which drop them.
+    """
+    database_indexes = {}
+
+    for record in gdbh.r_transaction("CALL db.indexes()"):
+        index_type = record["type"]
+        labels = tuple(record["tokenNames"])
+        properties_names = tuple(record["properties"])
+
+        if index_type == Index.index_type:
+            database_indexes[(index_type, labels, properties_names)] = (
+                f"DROP INDEX ON :{labels[0]}({', '.join(properties_names)})", {})
+
+        elif index_type == FullTextIndex.index_type:
+            database_indexes[(index_type, labels, properties_names, record["indexName"])] = (
+                "CALL db.index.fulltext.drop($name)", {"name": record["indexName"]})
+
+    return database_indexes
+
+
+def describe_index(index_key):
+    """
+    This function returns a readable description of an index, from its key. Example : "INDEX ON :Person(last_name)"
+    """
+    index_type, labels, properties_names = index_key[0:3]
+    description = f"INDEX ON :{':'.join(labels)}({', '.join(properties_names)})"
+
+    if index_type == FullTextIndex.index_type:
+        return f"FULLTEXT {description} named '{index_key[3]}'"
+
+    return description
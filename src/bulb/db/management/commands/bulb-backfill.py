@@ -0,0 +1,174 @@
+from bulb.db.exceptions import BULBNodeError
+from bulb.db.registry import node_models_registry
+from bulb.db.utils import format_value_to_parameter
+from bulb.utils.log import bulb_logger
+from bulb.db.base import gdbh
+from django.core.management.base import BaseCommand
+import time
+
+
+class Command(BaseCommand):
+    args = ''
+    help = """
+            Fill the properties of the existing nodes with the 'default' values of their node models, when they have
+            not these properties (for example, after a property has been added to a node model). The nodes are filled
+            by batches, each one in its own transaction, so the locks are short and the command can be stopped and run
+            again : it continues with the nodes which are not filled yet.
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument("node_models_names", nargs="*",
+                            help="The names of the node models to fill. By default, all the node models are filled.")
+        parser.add_argument("--batch-size", type=int, default=1000, dest="batch_size",
+                            help="The number of nodes filled by each transaction. Default = 1000.")
+        parser.add_argument("--sleep", type=float, default=0, dest="sleep",
+                            help="The number of seconds to wait between two transactions, to reduce the load of the "
+                                 "database. Default = 0.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        sleep = options["sleep"]
+
+        if batch_size < 1:
+            bulb_logger.error('BULBNodeError("The \'--batch-size\' option must be a positive integer.")')
+            raise BULBNodeError("The '--batch-size' option must be a positive integer.")
+
+        if sleep < 0:
+            bulb_logger.error('BULBNodeError("The \'--sleep\' option must be a positive number.")')
+            raise BULBNodeError("The '--sleep' option must be a positive number.")
+
+        # Get the node models to fill.
+        node_models = node_models_registry.get_all_node_models()
+
+        if options["node_models_names"]:
+            node_models_by_name = {node_model.__name__: node_model for node_model in node_models}
+            selected_node_models = []
+
+            for node_model_name in options["node_models_names"]:
+                if node_model_name not in node_models_by_name:
+                    bulb_logger.error(f'BULBNodeError("\'{node_model_name}\' is not the name of a node model.")')
+                    raise BULBNodeError(f"'{node_model_name}' is not the name of a node model.")
+
+                selected_node_models.append(node_models_by_name[node_model_name])
+
+            node_models = selected_node_models
+
+        # beginning CONSOLE RENDER PART 1 #
+        print("\n--------------------------------------\n")
+        # end CONSOLE RENDER PART 1 #
+
+        for node_model in node_models:
+            label = node_model.__name__
+
+            # beginning CONSOLE RENDER PART 2 #
+            print(f"    {label} :")
+            # end CONSOLE RENDER PART 2 #
+
+            for property_name, property_field in node_model._get_property_fields().items():
+                if property_field.default is not None:
+                    self.backfill_property(label, property_name, property_field.default, batch_size, sleep)
+
+                elif property_field.required:
+                    missing_count = self.count_missing_nodes(label, property_name)
+
+                    # beginning CONSOLE RENDER PART 3 #
+                    if missing_count:
+                        print(f"        ✘   '{property_name}' : {missing_count} nodes have not this required property, "
+                              f"and it has no default value to fill them.")
+                    # end CONSOLE RENDER PART 3 #
+
+        # beginning CONSOLE RENDER PART 4 #
+        print("\n--------------------------------------\n")
+        # end CONSOLE RENDER PART 4 #
+
+    @staticmethod
+    def count_missing_nodes(label, property_name):
+        response = gdbh.r_transaction(f"""
+            MATCH (n:{label})
+            WHERE NOT exists(n.{property_name})
+            RETURN count(n) AS missing_count
+            """)
+
+        return response[0]["missing_count"]
+
+    def backfill_property(self, label, property_name, default, batch_size, sleep):
+        """
+        This method fills the property of the nodes of the label which have not this property with its default value,
+        batch by batch. The ids of each batch are read in a short read transaction, from the id of the last node of the
+        previous batch, then the batch is written in its own transaction, with the ids : no transaction lasts longer than a
+        batch. The filled nodes are those without the property, so a stopped backfill continues where it stopped.
+        If the default value is a callable, it is called once per node (like on creation), else the value is sent once
+        per batch.
+        """
+        missing_count = self.count_missing_nodes(label, property_name)
+
+        if not missing_count:
+            # beginning CONSOLE RENDER PART 5 #
+            print(f"        ✔   '{property_name}' : all the nodes are already filled.")
+            # end CONSOLE RENDER PART 5 #
+            return
+
+        # The property is still checked when a batch is written : the node may have been updated since it was read.
+        if callable(default):
+            fill_query = f"""
+                UNWIND $rows AS row
+                MATCH (n:{label})
+                WHERE id(n) = row.node_id AND NOT exists(n.{property_name})
+                SET n.{property_name} = row.value
+                RETURN count(n) AS filled_count
+                """
+
+        else:
+            fill_query = f"""
+                UNWIND $node_ids AS node_id
+                MATCH (n:{label})
+                WHERE id(n) = node_id AND NOT exists(n.{property_name})
+                SET n.{property_name} = $value
+                RETURN count(n) AS filled_count
+                """
+            value = format_value_to_parameter(default)
+
+        filled_count = 0
+        read_count = 0
+        last_node_id = -1
+
+        while True:
+            # Each batch of ids is read in its own short transaction, from the last processed id : no transaction stays
+            # open during the whole backfill (which could exceed the 'dbms.transaction.timeout' of the database).
+            node_ids = [record["node_id"] for record in gdbh.r_transaction(f"""
+                MATCH (n:{label})
+                WHERE id(n) > $last_node_id AND NOT exists(n.{property_name})
+                RETURN id(n) AS node_id
+                ORDER BY node_id
+                LIMIT $batch_size
+                """, {"last_node_id": last_node_id, "batch_size": batch_size})]
+
+            if not node_ids:
+                break
+
+            if callable(default):
+                response = gdbh.w_transaction(fill_query, {"rows": [{"node_id": node_id,
+                                                                     "value": format_value_to_parameter(default())}
+                                                                    for node_id in node_ids]})
+
+            else:
+                response = gdbh.w_transaction(fill_query, {"node_ids": node_ids, "value": value})
+
+            filled_count += response[0]["filled_count"]
+            read_count += len(node_ids)
+            last_node_id = node_ids[-1]
+
+            # The nodes created without the property during the backfill are also filled.
+            missing_count = max(missing_count, read_count)
+
+            # beginning CONSOLE RENDER PART 6 #
+            print(f"        ...  '{property_name}' : {filled_count}/{missing_count} nodes filled "
+                  f"({filled_count * 100 // missing_count}%).")
+            # end CONSOLE RENDER PART 6 #
+
+            if sleep:
+                time.sleep(sleep)
+
+        # beginning CONSOLE RENDER PART 7 #
+        print(f"        ✔   '{property_name}' : {filled_count} nodes have been filled.")
+        # end CONSOLE RENDER PART 7 #
@@ -0,0 +1,186 @@
+from bulb.db.exceptions import BULBFakeInstanceError
+from bulb.db.node_models import FakeClass, Node, RelationshipInstance
+from bulb.utils.log import bulb_logger
+from bulb.db import node_models
+from django.core.management.base import BaseCommand
+import timeit
+
+
+def build_benchmark_models():
+    """
+    This function defines the node_model and the relationship of the benchmarks. They are defined when the command is run
+    (and not when this module is imported), and the node_model is not registered, so they are never returned by the
+    registry (to the admin, to the 'bulb-apply' command, etc...).
+
+    :return: A tuple (BenchmarkPerson, BenchmarkFriendshipRelationship).
+    """
+    class BenchmarkFriendshipRelationship(node_models.Relationship):
+        rel_type = "BENCHMARK_FRIEND"
+        direction = "bi"
+        start = "self"
+        target = "self"
+
+    class BenchmarkPerson(node_models.Node, register=False):
+        first_name = node_models.Property()
+        last_name = node_models.Property()
+        age = node_models.Property()
+
+        friends = BenchmarkFriendshipRelationship()
+
+    return BenchmarkPerson, BenchmarkFriendshipRelationship
+
+
+class BenchmarkDatabaseNode:
+    """
+    A node like those received from the Neo4j driver (with the 'labels' and '_properties' attributes read by the
+    hydrators), so the benchmarks don't depend on the database.
+    """
+
+    def __init__(self, node_id):
+        self.id = node_id
+        self.labels = frozenset(["BenchmarkPerson"])
+        self._properties = {"uuid": f"{node_id:032x}", "first_name": "John", "last_name": "Smith", "age": node_id % 100}
+
+
+class BenchmarkDatabaseRelationship:
+    """
+    A relationship like those received from the Neo4j driver (with the 'type' and '_properties' attributes read by the
+    hydrators).
+    """
+
+    def __init__(self, relationship_id):
+        self.id = relationship_id
+        self.type = "BENCHMARK_FRIEND"
+        self._properties = {"uuid": f"{relationship_id:032x}", "since": relationship_id}
+
+
+def build_reference_fake_instance(relationship_or_node_model, node_or_rel_object, forced_fake_instance_class,
+                                  additional_parameters=None):
+    """
+    The previous implementation of the build_fake_instance() method (before the hydrators), which sets the attributes one
+    by one and checks the __mro__ of the class for each node. The hydrators must build the same instances.
+    """
+    fake_instance = FakeClass()
+    fake_instance.__class__ = forced_fake_instance_class
+
+    for property_name, property_value in node_or_rel_object._properties.items():
+        setattr(fake_instance, property_name, property_value)
+
+    if Node in forced_fake_instance_class.__mro__:
+        setattr(fake_instance, "labels", list(node_or_rel_object.labels))
+
+    elif RelationshipInstance in forced_fake_instance_class.__mro__:
+        setattr(fake_instance, "rel_type", node_or_rel_object.type)
+        fake_instance.__class__.__name__ = f"{relationship_or_node_model.__name__}Instance"
+
+    for name, value in (additional_parameters or {}).items():
+        setattr(fake_instance, name, value)
+
+    return fake_instance
+
+
+class Command(BaseCommand):
+    args = ''
+    help = """
+            Measure the throughput of the hot paths of the node models, without querying the database : the attribute
+            accesses on node instances (properties and relationships), and the building of the instances from the
+            records of the database (the hydrators, compared with the previous implementation of build_fake_instance()).
+            Before measuring the hydrators, the command checks that they build the same instances as the previous
+            implementation.
+            """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=1000000, dest="number",
+                            help="The number of attribute accesses of each measure (the hydrators build a tenth of "
+                                 "it). Default = 1000000.")
+        parser.add_argument("--repeat", type=int, default=5, dest="repeat",
+                            help="The number of times each measure is repeated (the best one is kept). Default = 5.")
+
+    @staticmethod
+    def measure(label, statement, namespace, number, repeat, operations_per_statement=1):
+        best_duration = min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat))
+
+        # beginning CONSOLE RENDER PART 2 #
+        print(f"        {label:<40} {number * operations_per_statement / best_duration / 1000000:>8.2f}M operations/s")
+        # end CONSOLE RENDER PART 2 #
+
+    @staticmethod
+    def check_instances(instance, reference_instance):
+        if instance.__class__ is not reference_instance.__class__ or instance.__dict__ != reference_instance.__dict__:
+            bulb_logger.error(
+                f'BULBFakeInstanceError("The hydrator built {instance.__dict__} instead of {reference_instance.__dict__}.")')
+            raise BULBFakeInstanceError(
+                f"The hydrator built {instance.__dict__} instead of {reference_instance.__dict__}.")
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        repeat = options["repeat"]
+
+        BenchmarkPerson, BenchmarkFriendshipRelationship = build_benchmark_models()
+
+        person = BenchmarkPerson.build_fake_instance(BenchmarkDatabaseNode(1))
+        namespace = {"person": person, "BenchmarkPerson": BenchmarkPerson}
+
+        # beginning CONSOLE RENDER PART 1 #
+        print("\n--------------------------------------\n")
+        print(f"    Attribute accesses (best of {repeat}) :")
+        # end CONSOLE RENDER PART 1 #
+
+        self.measure("person.uuid", "person.uuid", namespace, number, repeat)
+        self.measure("person.first_name", "person.first_name", namespace, number, repeat)
+        self.measure("person.labels", "person.labels", namespace, number, repeat)
+        self.measure("person.friends (relationship)", "person.friends", namespace, number, repeat)
+
+        # Check that the hydrators build the same instances as the previous implementation of build_fake_instance().
+        database_nodes = [BenchmarkDatabaseNode(node_id) for node_id in range(max(number // 10, 1))]
+        database_relationships = [BenchmarkDatabaseRelationship(rel_id) for rel_id in range(max(number // 10, 1))]
+        relationship_parameters = {"related_relationship": BenchmarkPerson.friends}
+
+        for database_node in database_nodes:
+            self.check_instances(
+                BenchmarkPerson.build_fake_instance(database_node, forced_fake_instance_class=BenchmarkPerson),
+                build_reference_fake_instance(BenchmarkPerson, database_node, BenchmarkPerson))
+
+        for database_relationship in database_relationships:
+            self.check_instances(
+                BenchmarkFriendshipRelationship.build_fake_instance(database_relationship,
+                                                                    forced_fake_instance_class=RelationshipInstance,
+                                                                    additional_parameters=relationship_parameters),
+                build_reference_fake_instance(BenchmarkFriendshipRelationship, database_relationship,
+                                              RelationshipInstance, relationship_parameters))
+
+        namespace.update({"database_nodes": database_nodes,
+                          "database_relationships": database_relationships,
+                          "relationship_parameters": relationship_parameters,
+                          "BenchmarkFriendshipRelationship": BenchmarkFriendshipRelationship,
+                          "RelationshipInstance": RelationshipInstance,
+                          "build_reference_fake_instance": build_reference_fake_instance,
+                          "hydrator": BenchmarkPerson._get_hydrator(BenchmarkPerson)})
+
+        # beginning CONSOLE RENDER PART 4 #
+        print(f"\n    Hydration of {len(database_nodes)} records (best of {repeat}, the hydrators build the same instances "
+              f"as the previous implementation) :")
+        # end CONSOLE RENDER PART 4 #
+
+        self.measure("node, previous implementation",
+                     "[build_reference_fake_instance(BenchmarkPerson, database_node, BenchmarkPerson) "
+                     "for database_node in database_nodes]", namespace, 1, repeat, len(database_nodes))
+        self.measure("node, build_fake_instance()",
+                     "[BenchmarkPerson.build_fake_instance(database_node, forced_fake_instance_class=BenchmarkPerson) "
+                     "for database_node in database_nodes]", namespace, 1, repeat, len(database_nodes))
+        self.measure("node, hydrator (QuerySet)",
+                     "[hydrator(database_node) for database_node in database_nodes]",
+                     namespace, 1, repeat, len(database_nodes))
+        self.measure("relationship, previous implementation",
+                     "[build_reference_fake_instance(BenchmarkFriendshipRelationship, database_relationship, "
+                     "RelationshipInstance, relationship_parameters) for database_relationship in database_relationships]",
+                     namespace, 1, repeat, len(database_relationships))
+        self.measure("relationship, build_fake_instance()",
+                     "[BenchmarkFriendshipRelationship.build_fake_instance(database_relationship, "
+                     "forced_fake_instance_class=RelationshipInstance, additional_parameters=relationship_parameters) "
+                     "for database_relationship in database_relationships]",
+                     namespace, 1, repeat, len(database_relationships))
+
+        # beginning CONSOLE RENDER PART 3 #
+        print("\n--------------------------------------\n")
+        # end CONSOLE RENDER PART 3 #
@@ -1,16 +1,20 @@
 from bulb.contrib.statictools.compressor import compress_file_and_build_paths
-from bulb.db.utils import make_uuid, compare_different_modules_classes
-from bulb.utils import get_all_node_models
+from bulb.db.utils import make_uuid, format_value_to_parameter
 from bulb.sftp_and_cdn.sftp import SFTP
 from bulb.utils.log import bulb_logger
 from bulb.db.exceptions import *
+from bulb.db.queryset import QuerySetDescriptor
+from bulb.db.registry import node_models_registry
+from bulb.db.indexes import Index, PointIndex
 from bulb.db import gdbh, Q
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
 from django.conf import settings
+from types import MappingProxyType
 import datetime
 import warnings
 import inspect
 import neotime
+import weakref
 import os
 
 BASE_DIR = os.environ["BASE_DIR"]
@@ -32,6 +36,7 @@ class DatabaseNode:
     """
     This class has tools to :
     - Transform Python objects like lists and dictionaries in a Cypher format : format_labels_to_cypher(), format_properties_to_cypher().
+    - Transform Python properties dictionaries in a dictionary of query parameters : format_properties_to_parameters().
     - Create a node in the database : create()
 
     :param current_object_labels_list (optional, default=None) : a list of all the node's labels. No labels = None. Default = None
@@ -64,10 +69,11 @@ class DatabaseNode:
         :return: It returns the created node.
         """
         object_labels = self.__class__.format_labels_to_cypher(self.current_object_labels_list)
-        object_properties = self.__class__.format_properties_to_cypher(self.related_class_properties_fields_dict,
-                                                                       self.current_object_properties_dict)
+        object_properties = self.__class__.format_properties_to_parameters(self.related_class_properties_fields_dict,
+                                                                           self.current_object_properties_dict)
 
-        response = gdbh.w_transaction('CREATE (n:%s %s) RETURN (n)' % (object_labels, object_properties))
+        response = gdbh.w_transaction('CREATE (n:%s $properties) RETURN (n)' % object_labels,
+                                      {"properties": object_properties})
         self.returned_node_object = response[0]["n"]
 
     @classmethod
@@ -138,6 +144,26 @@ class DatabaseNode:
             bulb_logger.error('BULBNodeLabelsInitializationError("\'object_properties_dict\' attribute must be a dict.")')
             raise BULBNodeLabelsInitializationError("'object_properties_dict' attribute must be a dict.")
 
+    @classmethod
+    def format_properties_to_parameters(cls, class_properties_dict, object_properties_dict):
+        """
+        This method converts properties dict format in a dictionary that can be sent as a query parameter.
+
+        :return: A dictionary of properties converted with format_value_to_parameter().
+        """
+        if isinstance(object_properties_dict, dict):
+            render = {}
+
+            for field_name in class_properties_dict.keys():
+                if field_name in object_properties_dict:
+                    render[field_name] = format_value_to_parameter(object_properties_dict[field_name])
+
+            return render
+
+        else:
+            bulb_logger.error('BULBNodeLabelsInitializationError("\'object_properties_dict\' attribute must be a dict.")')
+            raise BULBNodeLabelsInitializationError("'object_properties_dict' attribute must be a dict.")
+
 
 class Property:
     """
@@ -157,18 +183,24 @@ class Property:
     :param (optional, default=False) spatial_2D: Create a 2 dimensions spatial object. Must be filled with tuple of integers
                                                  (latitude, longitude)
 
+    :param (optional, default=False) index: If set on True, the bulb-apply command creates an index on the property (a
+                                            point index if the property is configured with 'spatial_2D=True'). The unique
+                                            properties are already indexed by their constraint.
+
     """
 
-    def __init__(self, content=None, required=False, unique=False, default=None, sftp=False, spatial_2D=False):
+    def __init__(self, content=None, required=False, unique=False, default=None, sftp=False, spatial_2D=False,
+                 index=False):
         self.content = content
         self.required = required
         self.unique = unique
         self.default = default
         self.sftp = sftp
         self.spatial_2D = spatial_2D
+        self.index = index
 
     @staticmethod
-    def _build(node_or_rel_object, recovered_fields_values_dict):
+    def _build(node_or_rel_object, recovered_fields_values_dict, check_unique=True):
         """
         This method take a Node object and datas recovered during its instantiation and build a dictionary that
         contains key/content combinations for each property of the object.
@@ -178,6 +210,9 @@ class Property:
         :param recovered_fields_values_dict: The dictionary of values recovered during the instantiation of the
                                              node_model class.
 
+        :param check_unique (optional, default=True): If it is False, the 'unique' constraints will not be checked in the
+                                                      database (used by bulk methods which check them once per batch).
+
         :return: A dictionary that contains key+content combinations for the given object.
                  NB : All property without content nor 'default' parameter, will be filled by 'None'.
         """
@@ -190,7 +225,8 @@ class Property:
         not_defined_fields = [field_item for field_item in class_properties_dict.items()]
 
         for field_name, field_content in class_properties_dict.items():
-            if field_content._check_property_datas(node_or_rel_object, field_name, recovered_fields_values_dict):
+            if field_content._check_property_datas(node_or_rel_object, field_name, recovered_fields_values_dict,
+                                                   check_unique=check_unique):
 
                 for key, value in recovered_fields_values_dict.items():
                     if value is not None:
@@ -308,7 +344,7 @@ class Property:
 
         return current_object_properties_dict
 
-    def _check_property_datas(self, node_or_rel_object, property_name, recovered_fields_values_dict):
+    def _check_property_datas(self, node_or_rel_object, property_name, recovered_fields_values_dict, check_unique=True):
         """
         This method checks and enforces the restrictions (required, unique, etc...) of a field.
 
@@ -319,15 +355,14 @@ class Property:
         :param (required) recovered_fields_values_dict: The dictionary of values recovered during the instantiation
                                                         of the node_model class.
 
+        :param (optional, default=True) check_unique: If it is False, the 'unique' restriction will not be checked in the
+                                                      database.
+
         :return:
         """
 
         try:
-            if isinstance(recovered_fields_values_dict[property_name], str):
-                property_value = recovered_fields_values_dict[property_name].replace('"', '\\"').replace("'", "\\'")
-
-            else:
-                property_value = recovered_fields_values_dict[property_name]
+            property_value = recovered_fields_values_dict[property_name]
 
         except KeyError:
             # Check if a property is 'required' :
@@ -352,22 +387,18 @@ class Property:
 
         else:
             # Check if a property is 'unique' :
-            if self.unique:
+            if self.unique and check_unique:
 
                 if Node in node_or_rel_object.__class__.__mro__:
+                    # The database UNIQUE constraints (see the 'bulb-apply' command) will raise the error on creation.
+                    if settings.BULB_USE_DATABASE_UNIQUE_CONSTRAINTS:
+                        return True
+
                     cypher_syntax_node_or_rel_object_labels = DatabaseNode.format_labels_to_cypher(node_or_rel_object.labels,)
                     # Try to get an instance of the current node class with the same property
-                    if isinstance(property_value, str):
-                        query = 'MATCH (n:%s) WHERE n.%s = "%s" RETURN (n)' % (cypher_syntax_node_or_rel_object_labels,
-                                                                               property_name,
-                                                                               property_value)
-                        result = gdbh.r_transaction(query)
-
-                    else:
-                        query = 'MATCH (n:%s) WHERE n.%s = %s RETURN (n)' % (cypher_syntax_node_or_rel_object_labels,
-                                                                             property_name,
-                                                                             property_value)
-                        result = gdbh.r_transaction(query)
+                    query = 'MATCH (n:%s) WHERE n.%s = $value RETURN (n) LIMIT 1' % (cypher_syntax_node_or_rel_object_labels,
+                                                                                     property_name)
+                    result = gdbh.r_transaction(query, {"value": format_value_to_parameter(property_value)})
 
                     # If an instance is found, raise an error
                     if result:
@@ -381,17 +412,9 @@ class Property:
 
                 elif Relationship in node_or_rel_object.__class__.__mro__:
                     # Try to get an instance of the current relationship class with the same property
-                    if isinstance(property_value, str):
-                        query = 'MATCH ()-[r:%s]->() WHERE r.%s = "%s" RETURN (r)' % (node_or_rel_object.rel_type,
-                                                                                      property_name,
-                                                                                      property_value)
-                        result = gdbh.r_transaction(query)
-
-                    else:
-                        query = 'MATCH ()-[r:%s]->() WHERE r.%s = %s RETURN (r)' % (node_or_rel_object.rel_type,
-                                                                                    property_name,
-                                                                                    property_value)
-                        result = gdbh.r_transaction(query)
+                    query = 'MATCH ()-[r:%s]->() WHERE r.%s = $value RETURN (r) LIMIT 1' % (node_or_rel_object.rel_type,
+                                                                                            property_name)
+                    result = gdbh.r_transaction(query, {"value": format_value_to_parameter(property_value)})
 
                     # If an instance is found, raise an error
                     if result:
@@ -413,7 +436,59 @@ class Property:
                 raise BULBPropertyError("A property must not have \'required=True\' and a \'default\' value.")
 
 
-class BaseNodeAndRelationship:
+class BaseNodeAndRelationshipMetaclass(type):
+    """
+    The metaclass of the BaseNodeAndRelationship class, and so of all the node_models and relationships classes.
+    It stores the metadata of each class (labels, property fields and relationship fields) once they have been computed
+    from the class and its parents, so they are not computed again on each instantiation, get(), count(), delete(), etc...
+    The stored metadata are cleared if a class is mutated (if one of its attributes is set or deleted).
+    """
+
+    # The metadata of each class.
+    _metadata_cache = weakref.WeakKeyDictionary()
+
+    # The hydrators of each class and forced class (see BaseNodeAndRelationship._get_hydrator()). They are stored in a
+    # simple dict because they are fetched for each node or relationship received from the database.
+    _hydrators_cache = {}
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        cls._clear_metadata_cache(name)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls._clear_metadata_cache(name)
+
+    def _clear_metadata_cache(cls, attribute_name):
+        # Special attributes (like '__doc__') have no effect on the metadata.
+        if attribute_name[0:2] != "__" or attribute_name[-2:] != "__":
+
+            # The metadata of the children classes are computed with those of their parents : clear all of them.
+            BaseNodeAndRelationshipMetaclass._metadata_cache.clear()
+            BaseNodeAndRelationshipMetaclass._hydrators_cache.clear()
+
+    def _get_cached_metadata(cls, metadata_name, build_function):
+        """
+        This method returns the metadata stored for the class, and computes them with 'build_function' if they are not
+        already stored.
+
+        :param metadata_name (required) : The name of the metadata.
+
+        :param build_function (required) : A function without parameters which computes the metadata.
+
+        :return: The metadata.
+        """
+        class_metadata = BaseNodeAndRelationshipMetaclass._metadata_cache.setdefault(cls, {})
+
+        try:
+            return class_metadata[metadata_name]
+
+        except KeyError:
+            metadata = class_metadata[metadata_name] = build_function()
+            return metadata
+
+
+class BaseNodeAndRelationship(metaclass=BaseNodeAndRelationshipMetaclass):
 
     # The UUID is the common property that all nodes have.
     uuid = Property(default=make_uuid,
@@ -440,6 +515,22 @@ class BaseNodeAndRelationship:
 
     @classmethod
     def _get_property_fields(cls, additional_fields_dict=None):
+        """
+        This method returns a read-only dictionary of all property fields of a Node instance. The dictionary is computed
+        once per class (see BaseNodeAndRelationshipMetaclass).
+
+        :param additional_fields_dict (optional, default=None) : An additional dict where the scripts will go to search the property
+                                                                 fields. If it is filled, the dictionary is computed again.
+
+        :return: A dictionary of all Node instance's properties.
+        """
+        if additional_fields_dict is not None:
+            return cls._build_property_fields(additional_fields_dict)
+
+        return cls._get_cached_metadata("property_fields", lambda: MappingProxyType(cls._build_property_fields()))
+
+    @classmethod
+    def _build_property_fields(cls, additional_fields_dict=None):
         """
         This method detects and regroups in a dictionary, all property fields of a Node instance. Then, it returns the
         dictionary.
@@ -498,7 +589,97 @@ class BaseNodeAndRelationship:
 
         :return: The fake instance.
         """
+        fake_instance = cls._get_hydrator(forced_fake_instance_class)(node_or_rel_object)
+
+        # Add additional parameters.
+        if additional_parameters is not None:
+            if isinstance(additional_parameters, dict):
+                fake_instance.__dict__.update(additional_parameters)
+
+            else:
+                bulb_logger.error(
+                    'BULBFakeInstanceError("The \'additional_parameters\' argument of the build_fake_instance() method, must be a dict.")')
+                raise BULBFakeInstanceError(
+                    "The 'additional_parameters' argument of the build_fake_instance() method, must be a dict.")
+
+        return fake_instance
+
+    @staticmethod
+    def _get_sftp_files_paths(properties_fields, properties_dict):
+        """
+        This method collects the paths of the files stored on the SFTP server by the 'sftp' properties of a node or of a
+        relationship, to remove them (see _remove_sftp_files()).
+
+        :param properties_fields (required) : The property fields of the node_model or of the relationship.
+
+        :param properties_dict (required) : The properties of the node or of the relationship.
+
+        :return: The list of the paths of the files, relative to the root of the storage (as they are purged on the CDN).
+        """
+        files_paths = []
+
+        if settings.DEBUG is False:
+            for field_name, field in properties_fields.items():
+                if field.sftp:
+                    file_url = properties_dict.get(field_name)
+
+                    if isinstance(file_url, str) and file_url != "None" and file_url != "":
+                        files_paths.append("/".join(file_url.split("/")[3:]))
+
+        return files_paths
+
+    @staticmethod
+    def _remove_sftp_files(files_paths):
+        """
+        This method removes files from the SFTP server with a single connection, then purges them on the CDN with a single
+        request (if BULB_USE_CDN77 is True).
+
+        :param files_paths (required) : The list returned by the _get_sftp_files_paths() method.
+        """
+        if not files_paths:
+            return
+
+        with SFTP.connect() as sftp:
+            for file_path in files_paths:
+                remote_file_path = "/www/" + file_path
+
+                if sftp.exists(remote_file_path):
+                    try:
+                        sftp.remove(remote_file_path)
+
+                    except:
+                        pass
+
+        if settings.BULB_USE_CDN77:
+            from bulb.sftp_and_cdn.cdn_apis import CDN77
+
+            try:
+                CDN77.purge(files_paths)
+
+            except:
+                pass
+
+    @classmethod
+    def _get_hydrator(cls, forced_fake_instance_class=None):
+        """
+        This method returns the hydrator used by the build_fake_instance() method : a function which builds a fake instance
+        from a Neo4j node or relationship object. The hydrator is built once for each class and forced class.
+
+        :param forced_fake_instance_class (optional, default=None) : See the build_fake_instance() method.
+
+        :return: The hydrator function.
+        """
+        hydrators_cache = BaseNodeAndRelationshipMetaclass._hydrators_cache
+
+        try:
+            return hydrators_cache[(cls, forced_fake_instance_class)]
+
+        except KeyError:
+            hydrator = hydrators_cache[(cls, forced_fake_instance_class)] = cls._build_hydrator(forced_fake_instance_class)
+            return hydrator
 
+    @classmethod
+    def _build_hydrator(cls, forced_fake_instance_class=None):
         fake_instance_class = cls
 
         if forced_fake_instance_class is not None:
@@ -506,39 +687,55 @@ class BaseNodeAndRelationship:
                     or RelationshipInstance in forced_fake_instance_class.__mro__:
                 fake_instance_class = forced_fake_instance_class
 
-        fake_instance = FakeClass()
-        fake_instance.__class__ = fake_instance_class
+        # The fake instances are built without calling the __init__() method, which would create a new node.
+        new_instance = object.__new__
 
-        property_dict = node_or_rel_object._properties
+        if Node in fake_instance_class.__mro__:
+            def hydrator(node_or_rel_object):
+                fake_instance = new_instance(fake_instance_class)
+                fake_instance_dict = fake_instance.__dict__
+                fake_instance_dict.update(node_or_rel_object._properties)
 
-        for property_name, property_value in property_dict.items():
-            setattr(fake_instance, property_name, property_value)
+                # Add the 'labels' property to the fake_class_instance __dict__.
+                fake_instance_dict["labels"] = list(node_or_rel_object.labels)
 
-        # Add the 'labels' property to the fake_class_instance __dict__.
-        if Node in fake_instance_class.__mro__:
-            setattr(fake_instance, "labels", list(node_or_rel_object.labels))
+                return fake_instance
 
-        # Add the 'rel_type' property to the fake_class_instance __dict__.
-        elif Relationship in fake_instance_class.__mro__ or RelationshipInstance in fake_instance_class.__mro__:
-            setattr(fake_instance, "rel_type", node_or_rel_object.type)
+        elif RelationshipInstance in fake_instance_class.__mro__:
+            fake_instance_class_name = f"{cls.__name__}Instance"
 
-        # Dynamically change the name of the RelationshipInstance object for a more visual render.
-        if RelationshipInstance in fake_instance_class.__mro__:
-            fake_instance.__class__.__name__ = f"{cls.__name__}Instance"
+            def hydrator(node_or_rel_object):
+                # Dynamically change the name of the RelationshipInstance object for a more visual render.
+                fake_instance_class.__name__ = fake_instance_class_name
 
-        # Add additional parameters.
-        if additional_parameters is not None:
-            if isinstance(additional_parameters, dict):
-                for name, value in additional_parameters.items():
-                    setattr(fake_instance, name, value)
+                fake_instance = new_instance(fake_instance_class)
+                fake_instance_dict = fake_instance.__dict__
+                fake_instance_dict.update(node_or_rel_object._properties)
 
-            else:
-                bulb_logger.error(
-                    'BULBFakeInstanceError("The \'additional_parameters\' argument of the build_fake_instance() method, must be a dict.")')
-                raise BULBFakeInstanceError(
-                    "The 'additional_parameters' argument of the build_fake_instance() method, must be a dict.")
+                # Add the 'rel_type' property to the fake_class_instance __dict__.
+                fake_instance_dict["rel_type"] = node_or_rel_object.type
 
-        return fake_instance
+                return fake_instance
+
+        elif Relationship in fake_instance_class.__mro__:
+            def hydrator(node_or_rel_object):
+                fake_instance = new_instance(fake_instance_class)
+                fake_instance_dict = fake_instance.__dict__
+                fake_instance_dict.update(node_or_rel_object._properties)
+
+                # Add the 'rel_type' property to the fake_class_instance __dict__.
+                fake_instance_dict["rel_type"] = node_or_rel_object.type
+
+                return fake_instance
+
+        else:
+            def hydrator(node_or_rel_object):
+                fake_instance = new_instance(fake_instance_class)
+                fake_instance.__dict__.update(node_or_rel_object._properties)
+
+                return fake_instance
+
+        return hydrator
 
 
 class Node(BaseNodeAndRelationship):
@@ -546,6 +743,21 @@ class Node(BaseNodeAndRelationship):
     This is the base class for all Node classes.
     """
 
+    # A lazy and chainable QuerySet of the class, see bulb.db.queryset.
+    objects = QuerySetDescriptor()
+
+    def __init_subclass__(cls, register=True, **kwargs):
+        """
+        :param register (optional, default=True) : If it is False, the node_model is not registered in the process-wide
+                                                   registry (see bulb.db.registry), so it is ignored by the admin and by
+                                                   the 'bulb-apply' command. Example : class Temporary(Node, register=False)
+        """
+        super().__init_subclass__(**kwargs)
+
+        # Register the node_model in the process-wide registry (see bulb.db.registry).
+        if register:
+            node_models_registry.register(cls)
+
     def __init__(self, **received_properties_dict):
         self.labels = None
         self.properties = None
@@ -555,14 +767,6 @@ class Node(BaseNodeAndRelationship):
 
         self._constructor(received_properties_dict)
 
-    def __getattribute__(self, item):
-        value = super().__getattribute__(item)
-
-        if Relationship in value.__class__.__mro__:
-            value._self_node_instance = self
-            value._name = item
-        return value
-
     def __eq__(self, other):
         if self.uuid == other.uuid:
             return True
@@ -590,567 +794,677 @@ class Node(BaseNodeAndRelationship):
         return cls.build_fake_instance(new_instance.returned_database_node_object)
 
     @classmethod
-    def get(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-            handmade=None, return_query=False):
+    def bulk_create(cls, list_of_dicts, batch_size=1000):
         """
-        This method allow the retrieving of Node (or of one of its children classes) instances.
+        This method creates many nodes with a few queries : the properties of each node are built and checked in Python
+        (like with the create() method), then the nodes are sent by batches with an UNWIND query.
 
-        :param uuid (required): The Universal Unique Identifier of a node to get an unique instance.
+        :param list_of_dicts (required) : A list (or any iterable) of dictionaries. Each dictionary contains the properties of a
+                                          node to create (like the keyword arguments of the create() method).
 
-        :param order_by (optional, default=None) : Must be the name of the property with which the returned datas will be sorted.
-                                                   Examples : "datetime", "first_name", etc...
+        :param batch_size (optional, default=1000) : Must be an integer. The number of nodes created by each query.
 
-        :param limit (optional, default=None) : Must be an integer. This parameter defines the number of returned elements.
+        :return: The list of the created instances.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            bulb_logger.error(
+                f'BULBNodeError("The \'batch_size\' parameter of the bulk_create() method of {cls.__name__} must be a positive integer.")')
+            raise BULBNodeError(
+                f"The 'batch_size' parameter of the bulk_create() method of {cls.__name__} must be a positive integer.")
 
-        :param skip (optional, default=None) : Must be an integer. This parameter defines the number of skipped elements. For example
-                                               if self.skip = 3, the 3 first returned elements will be skipped.
+        cypher_labels = DatabaseNode.format_labels_to_cypher(cls._get_labels())
+        properties_fields = cls._get_property_fields()
 
-        :param desc (optional, default=False) : Must be a boolean. If it is False the elements will be returned in an increasing order,
-                                                but it is True, they will be returned in a descending order.
+        # If BULB_USE_DATABASE_UNIQUE_CONSTRAINTS is True, the 'unique' properties are checked by the database constraints.
+        if settings.BULB_USE_DATABASE_UNIQUE_CONSTRAINTS:
+            unique_fields_names = []
 
-        :param only (optional, default=None) : Must be a list of field_names. If this parameter is filled, the return will not be Node
-                                               instances, but a dict with "only" the mentioned fields.
+        else:
+            unique_fields_names = [field_name for field_name, field in properties_fields.items() if field.unique]
 
-        :param filter (optional, default=None) : Must be Q statement. You must use the Q class stored in bulb.db
-                                                 Example: Q(name__contains="al") | Q(age__year__lte=8)
+        created_instances = []
+        rows = []
+        unique_values_dict = {field_name: [] for field_name in unique_fields_names}
 
-        :param distinct (optional, default=False) : Must be a boolean. If it is True, the returned list will be only composed with
-                                                    unique elements.
+        for received_properties_dict in list_of_dicts:
+            # Build the properties without sending a query per node.
+            properties = cls._build_bare_properties(properties_fields, received_properties_dict)
+            rows.append(DatabaseNode.format_properties_to_parameters(properties_fields, properties))
 
-        :param handmade: If this param is filled, no other must be filled. With 'handmade', you can insert your own get query and
-                         the function will transform the objects returned by the database into Python instance of this class. WARNING :
-                         Please consider using the gdbh.r_transaction() method (imported from bulb.db) if your request no returns full
-                         Neo4j objects but a list of properties.
-                         Examples :
-                         ❌ : MATCH (n) RETURN n.first_name, n.last_name
-                         ✅ : MATCH (n) RETURN n
+            # Collect the values of the 'unique' properties, to check them once per batch.
+            for field_name in unique_fields_names:
+                if received_properties_dict.get(field_name) is not None and properties.get(field_name) is not None:
+                    unique_values_dict[field_name].append(format_value_to_parameter(properties.get(field_name)))
 
-                         In addition, note that the RETURN must absolutely be named 'n' like "node".
+            if len(rows) >= batch_size:
+                created_instances.extend(cls._bulk_create_batch(cypher_labels, rows, unique_values_dict))
+                rows = []
+                unique_values_dict = {field_name: [] for field_name in unique_fields_names}
 
-        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return the cypher query.
+        if rows:
+            created_instances.extend(cls._bulk_create_batch(cypher_labels, rows, unique_values_dict))
 
-        :return: If uuid is None, a list will be returned. Else it will be a unique instance.
+        return created_instances
+
+    @classmethod
+    def _bulk_create_batch(cls, cypher_labels, rows, unique_values_dict):
         """
+        This method checks the 'unique' constraints of a batch of nodes and creates them with a single query.
 
-        if handmade is None:
+        :param cypher_labels (required) : The cypher formatted labels of the nodes.
 
-            where_statement = ""
-            uuid_property_statement = ""
-            order_by_statement = ""
-            limit_statement = ""
-            skip_statement = ""
-            desc_statement = ""
+        :param rows (required) : The list of the properties dictionaries (already formatted as parameters) of the nodes.
 
-            # Build the uuid_property_statement.
-            if uuid is not None:
-                uuid_property_statement = "{uuid:'%s'}" % uuid
+        :param unique_values_dict (required) : A dictionary where keys are the names of the 'unique' properties and values the
+                                               lists of their values in the batch.
 
-            # Build the match_statement.
-            cyher_labels = DatabaseNode.format_labels_to_cypher(cls._get_labels())
-            match_statement = f"MATCH (n:{cyher_labels} {uuid_property_statement})"
+        :return: The list of the created instances.
+        """
+        for field_name, values in unique_values_dict.items():
+            if values:
+                # Check the duplicates in the batch itself, then in the database.
+                duplicate_was_found = len(values) != len(set(str(value) for value in values))
+
+                if not duplicate_was_found:
+                    duplicate_was_found = bool(gdbh.r_transaction("""
+                    UNWIND $values AS value
+                    MATCH (n:%s)
+                    WHERE n.%s = value
+                    RETURN value LIMIT 1
+                    """ % (cypher_labels, field_name), {"values": values}))
+
+                if duplicate_was_found:
+                    bulb_logger.error(
+                        f'BULBUniqueConstraintError("An instance of {cls.__name__} must have an UNIQUE \'{field_name}\'.")')
+                    raise BULBUniqueConstraintError(
+                        f"An instance of {cls.__name__} must have an UNIQUE '{field_name}'.")
 
-            # Build the where statement.
-            if filter is not None:
-                if filter[0:2] == "n." or filter[0:6] == "NOT n.":
-                    where_statement = "WHERE " + filter
+        response = gdbh.w_transaction("""
+        UNWIND $rows AS row
+        CREATE (n:%s)
+        SET n = row
+        RETURN (n)
+        """ % cypher_labels, {"rows": rows})
 
-                else:
-                    where_statement = filter
+        hydrator = cls._get_hydrator(cls)
 
-            # Build the with_statement.
-            with_statement = "WITH n"
+        return [hydrator(node_object["n"]) for node_object in response]
 
-            # Build order_by statements.
-            if order_by is not None:
-                if isinstance(order_by, dict):
-                    order_by_statement = "ORDER BY"
-                    for order_property, is_desc in order_by.items():
-                        order_by_statement += f" n.{order_property} {'DESC' if is_desc else ''},"
-                    order_by_statement = order_by_statement[0:-1]
+    @classmethod
+    def _build_bare_properties(cls, properties_fields, received_properties_dict):
+        """
+        This method builds and checks the properties of a node (like the create() method does), without creating it and
+        without checking the 'unique' properties in the database.
 
-                else:
-                    order_by_statement = f"ORDER BY n.{order_by}"
+        :param properties_fields (required) : The property fields of the class.
 
-            # Build return_statement statements.
-            if not only:
-                if not distinct:
-                    return_statement = "RETURN (n)"
+        :param received_properties_dict (required) : The dictionary of the received properties.
 
-                else:
-                    return_statement = "RETURN DISTINCT (n)"
+        :return: The dictionary of the built properties.
+        """
+        bare_instance = FakeClass()
+        bare_instance.__class__ = cls
+        bare_instance.properties_fields = properties_fields
 
-            else:
-                only_statement_list = []
+        return Property._build(bare_instance, received_properties_dict, check_unique=False)
 
-                for element in only:
-                    only_statement_list.append(f"n.{element}")
+    @classmethod
+    def _build_lookup_pattern(cls, lookup_fields_names, lookup_parameter_name):
+        """
+        This method builds the node pattern used by the MERGE statements of the get_or_create(), upsert() and bulk_upsert()
+        methods.
+        The lookup must contain a property configured with 'unique=True' : the database only guarantees that concurrent
+        MERGE queries don't create the same node twice when a UNIQUE constraint (see 'bulb-apply') covers the lookup.
 
-                only_statement = ", ".join(only_statement_list)
+        :param lookup_fields_names (required) : The names of the properties which identify the node.
 
-                if not distinct:
-                    return_statement = f"RETURN {only_statement}"
+        :param lookup_parameter_name (required) : The name of the parameter (a map) which contains the values of the lookup.
 
-                else:
-                    return_statement = f"RETURN DISTINCT {only_statement}"
+        :return: The node pattern. Example : "(n:Person {email: $lookup.email})"
+        """
+        if not lookup_fields_names:
+            bulb_logger.error(f'BULBNodeError("The lookup of a MERGE on {cls.__name__} nodes must contain at least one property.")')
+            raise BULBNodeError(f"The lookup of a MERGE on {cls.__name__} nodes must contain at least one property.")
 
-            # Build limit_statement.
-            if limit is not None:
-                if not isinstance(limit, str) and not isinstance(limit, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'limit\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'limit' parameter of the get() method of {cls.__name__} must be a string or an integer.")
+        properties_fields = cls._get_property_fields()
 
-                else:
-                    limit_statement = f"LIMIT {limit}"
+        if not any(properties_fields[field_name].unique for field_name in lookup_fields_names
+                   if field_name in properties_fields):
+            bulb_logger.error(
+                f'BULBNodeError("The lookup of a MERGE on {cls.__name__} nodes must contain a property configured with \'unique=True\', else concurrent MERGE queries can create the same node twice.")')
+            raise BULBNodeError(
+                f"The lookup of a MERGE on {cls.__name__} nodes must contain a property configured with 'unique=True', else concurrent MERGE queries can create the same node twice.")
 
-            # Build skip_statement and add its required variable.
-            if skip is not None:
-                if not isinstance(skip, str) and not isinstance(skip, int):
-                    bulb_logger.error(
-                        f'BULBNodeError("The \'skip\' parameter of the get() method of {cls.__name__} must be a string or an integer.")')
-                    raise BULBNodeError(
-                        f"The 'skip' parameter of the get() method of {cls.__name__} must be a string or an integer.")
+        cypher_labels = DatabaseNode.format_labels_to_cypher(cls._get_labels())
+        lookup_statement = ", ".join(f"{field_name}: {lookup_parameter_name}.{field_name}"
+                                     for field_name in lookup_fields_names)
 
-                else:
-                    skip_statement = f"SKIP {skip}"
+        return f"(n:{cypher_labels} {{{lookup_statement}}})"
 
-            # Build desc_statement.
-            if not isinstance(desc, bool):
-                bulb_logger.error(
-                    f'BULBNodeError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
-                raise BULBNodeError(
-                    f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
+    @classmethod
+    def get_or_create(cls, lookup, defaults=None):
+        """
+        This method gets the node which has the properties of 'lookup', or creates it if it doesn't exist.
+        The node is first looked for with a MATCH query, so the properties (and the callable default values) are only
+        built if the node doesn't exist. Then, it is created with a MERGE query : as the lookup must contain a property
+        configured with 'unique=True', its UNIQUE constraint (see 'bulb-apply') prevents concurrent calls from creating
+        the same node twice.
 
-            else:
-                if desc is True and not isinstance(order_by, dict):
-                    desc_statement = "DESC"
-
-            request_statement = """
-            %s
-            %s
-            %s
-            %s
-            %s
-            %s
-            %s
-            %s
-            """ % (match_statement,
-                   where_statement,
-                   with_statement,
-                   order_by_statement,
-                   desc_statement,
-                   skip_statement,
-                   limit_statement,
-                   return_statement)
+        :param lookup (required) : A dictionary of properties' names and values which identify the node. It must contain a
+                                   property configured with 'unique=True'.
 
-            if return_query is False:
+        :param defaults (optional, default=None) : A dictionary of properties' names and values which are only applied if the
+                                                   node is created.
 
-                response = gdbh.r_transaction(request_statement)
+        NB : Only the properties of 'lookup' are used to find the node : the other 'unique' properties are not checked
+             before the creation (the UNIQUE constraints of the database will reject the duplicates, see 'bulb-apply').
 
-                if response:
-                    if only is None:
+        :return: A tuple (instance, created) where 'created' is True if the node has been created.
+        """
+        properties_fields = cls._get_property_fields()
+        lookup_parameters = {property_name: format_value_to_parameter(property_value)
+                             for property_name, property_value in lookup.items()}
+        lookup_pattern = cls._build_lookup_pattern(list(lookup_parameters.keys()), "$lookup")
+
+        # Look for the node before building the properties : most of the time, the node already exists.
+        response = gdbh.r_transaction("""
+        MATCH %s
+        RETURN n
+        LIMIT 1
+        """ % lookup_pattern, {"lookup": lookup_parameters})
+
+        if response:
+            return cls._get_hydrator(cls)(response[0]["n"]), False
+
+        properties = cls._build_bare_properties(properties_fields, {**lookup, **(defaults or {})})
+
+        response = gdbh.w_transaction("""
+        MERGE %s
+        ON CREATE SET n += $properties, n._bulb_created = true
+        WITH n, exists(n._bulb_created) AS created
+        REMOVE n._bulb_created
+        RETURN n, created
+        """ % lookup_pattern,
+                                      {"lookup": lookup_parameters,
+                                       "properties": DatabaseNode.format_properties_to_parameters(properties_fields,
+                                                                                                  properties)})
+
+        return cls._get_hydrator(cls)(response[0]["n"]), response[0]["created"]
 
-                        fake_instances_list = []
+    @classmethod
+    def upsert(cls, lookup, values):
+        """
+        This method updates the node which has the properties of 'lookup' with 'values', or creates it with the properties
+        of 'lookup' and 'values' if it doesn't exist (see bulk_upsert()). If the node exists, only the properties of 'values'
+        are sent : the other required properties of the node_model don't have to be given.
 
-                        for node_object in response:
-                            fake_instances_list.append(cls.build_fake_instance(node_object["n"],
-                                                                               forced_fake_instance_class=cls))
+        :param lookup (required) : A dictionary of properties' names and values which identify the node.
 
-                        if uuid is not None:
-                            return fake_instances_list[0]
+        :param values (required) : A dictionary of properties' names and values which are applied to the node, whether it is
+                                   created or updated.
+                                   NB : The properties configured with 'sftp=True' cannot be updated with this method.
 
-                        else:
-                            return fake_instances_list
+        :return: The instance.
+        """
+        return cls.bulk_upsert([{**lookup, **values}], list(lookup.keys()))[0]
 
-                    else:
-                        return response
+    @classmethod
+    def bulk_upsert(cls, list_of_dicts, lookup_fields, batch_size=1000):
+        """
+        This method upserts many nodes (see upsert()) with two queries per batch : the existing nodes are first found with a
+        single read query, then they are updated and the other nodes are created with a single write query. So the
+        properties of the created nodes are only built (and checked, and their callable default values like make_uuid()
+        are only called) for the dictionaries of the nodes which don't exist : the dictionaries of the existing nodes only
+        have to contain the updated properties.
+        The nodes are created with a MERGE statement : as the lookup must contain a property configured with 'unique=True',
+        running it many times, or in parallel, with the same datas never creates duplicates (once the UNIQUE constraint of
+        this property has been applied with 'bulb-apply').
 
-                else:
-                    return None
+        NB : If an existing node is deleted between the two queries of its batch, it is neither updated nor created again,
+             and it is not returned.
 
-            else:
-                return request_statement
+        :param list_of_dicts (required) : A list (or any iterable) of dictionaries. Each dictionary contains the properties of a
+                                          node.
 
-        else:
+        :param lookup_fields (required) : The list of the names of the properties which identify the nodes. They must be in
+                                          each dictionary, and one of them must be configured with 'unique=True'.
 
-            if return_query is False:
-                response = gdbh.r_transaction(handmade)
+        :param batch_size (optional, default=1000) : Must be an integer. The number of nodes upserted by each query.
 
-                fake_instances_list = []
+        :return: The list of the created or updated instances, in the order of 'list_of_dicts'.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            bulb_logger.error(
+                f'BULBNodeError("The \'batch_size\' parameter of the bulk_upsert() method of {cls.__name__} must be a positive integer.")')
+            raise BULBNodeError(
+                f"The 'batch_size' parameter of the bulk_upsert() method of {cls.__name__} must be a positive integer.")
 
-                for node_object in response:
-                    fake_instances_list.append(cls.build_fake_instance(node_object["n"],
-                                                                       forced_fake_instance_class=cls))
+        properties_fields = cls._get_property_fields()
+        lookup_pattern = cls._build_lookup_pattern(list(lookup_fields), "row.lookup")
+        hydrator = cls._get_hydrator(cls)
 
-                return fake_instances_list
+        upserted_instances = []
+        rows = []
 
-            else:
-                return handmade
+        def upsert_batch(batch_rows):
+            # Find the existing nodes first : the properties of the created nodes are only built for the other rows.
+            response = gdbh.r_transaction("""
+            UNWIND $rows AS row
+            MATCH %s
+            RETURN DISTINCT row.index AS index
+            """ % lookup_pattern, {"rows": [{"index": index, "lookup": row["lookup"]}
+                                            for index, row in enumerate(batch_rows)]})
 
+            found_indexes = set(record["index"] for record in response)
 
-    @classmethod
-    def get_str(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
-            return_query=False):
-        """
-        A get method which returns string serialized instances / instances dict.
+            matched_rows = []
+            created_rows = []
 
-        See Node.get() documentation part to learn the role of each parameter.
+            for index, row in enumerate(batch_rows):
+                if index in found_indexes:
+                    matched_rows.append({"index": index, "lookup": row["lookup"], "properties": row["properties"]})
 
-        :return:
-        """
-        instances = cls.get(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only, filter=filter,
-                            distinct=distinct, return_query=return_query)
+                else:
+                    create_properties = cls._build_bare_properties(properties_fields, row["received_properties_dict"])
+                    created_rows.append({"index": index,
+                                         "lookup": row["lookup"],
+                                         "properties": row["properties"],
+                                         "create_properties": DatabaseNode.format_properties_to_parameters(
+                                             properties_fields, create_properties)})
 
-        if instances is not None:
-            for instance in instances:
+            response = gdbh.w_transaction("""
+            UNWIND $matched_rows AS row
+            MATCH %s
+            SET n += row.properties
+            RETURN row.index AS index, n
+            UNION ALL
+            UNWIND $created_rows AS row
+            MERGE %s
+            ON CREATE SET n += row.create_properties
+            ON MATCH SET n += row.properties
+            RETURN row.index AS index, n
+            """ % (lookup_pattern, lookup_pattern), {"matched_rows": matched_rows, "created_rows": created_rows})
+
+            return [hydrator(node_object["n"]) for node_object in sorted(response, key=lambda record: record["index"])]
+
+        for received_properties_dict in list_of_dicts:
+            try:
+                lookup = {field_name: format_value_to_parameter(received_properties_dict[field_name])
+                          for field_name in lookup_fields}
 
-                if only is not None:
-                    for property_name, property_value in instance.items():
+            except KeyError as missing_field_name:
+                bulb_logger.error(
+                    f'BULBNodeError("The lookup property {missing_field_name} is missing in a dictionary given to the bulk_upsert() method of {cls.__name__}.")')
+                raise BULBNodeError(
+                    f"The lookup property {missing_field_name} is missing in a dictionary given to the bulk_upsert() method of {cls.__name__}.")
 
-                        # Serialize datetime, date and time objects.
-                        if isinstance(property_value, neotime.DateTime) or isinstance(property_value, neotime.Date) or isinstance(property_value, neotime.Time):
-                            instance[property_name] = str(property_value)
+            # Check the properties before building them : the files of the 'sftp' properties would be stored.
+            rows.append({"lookup": lookup,
+                         "properties": cls._prepare_bulk_properties(properties_fields, received_properties_dict),
+                         "received_properties_dict": received_properties_dict})
 
-                else:
-                    for property_name, property_value in instance.__dict__.items():
+            if len(rows) >= batch_size:
+                upserted_instances.extend(upsert_batch(rows))
+                rows = []
 
-                        # Serialize datetime, date and time objects.
-                        if isinstance(property_value, neotime.DateTime) or isinstance(property_value, neotime.Date) or isinstance(property_value, neotime.Time):
-                            instance.__dict__[property_name] = str(property_value)
+        if rows:
+            upserted_instances.extend(upsert_batch(rows))
 
-        return instances
+        return upserted_instances
 
-    def update(self, property_name, new_property_value):
-        class_name = self.__class__.__name__
+    @classmethod
+    def get(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
+            handmade=None, parameters=None, return_query=False, iterator=False, chunk_size=1000, prefetch=None, after=None):
+        """
+        This method allow the retrieving of Node (or of one of its children classes) instances.
 
-        if not settings.BULB_CREATE_PROPERTY_IF_NOT_FOUND and property_name not in self.__dict__.keys():
-            bulb_logger.warning(
-                f'BULBNodeWarning("You are trying to update the property \'{property_name}\' of an {class_name} instance, but this property was not found in the instance dict. The update will have maybe no effect.")')
-            warnings.warn(
-                f"You are trying to update the property '{property_name}' of an {class_name} instance, but this property was not found in the instance dict. The update will have maybe no effect.",
-                BULBNodeWarning)
+        :param uuid (required): The Universal Unique Identifier of a node to get an unique instance.
 
-        else:
-            # Create property if it not exists.
-            if property_name not in self.__dict__.keys():
-                try:
-                    gdbh.w_transaction("""
-                    MATCH (n:%s {uuid:"%s"})
-                    CALL apoc.create.setProperty(n, "%s", "%s") YIELD node
-                    RETURN (n)
-                    """ % (class_name, self.uuid,
-                           property_name, None))
-
-                    if eval(f"self.__class__.{property_name}.sftp"):
-                        setattr(self, property_name, "None")
-                    else:
-                        setattr(self, property_name, None)
+        :param order_by (optional, default=None) : Must be the name of the property with which the returned datas will be sorted.
+                                                   Examples : "datetime", "first_name", etc...
 
-                except:
-                    bulb_logger.warning(
-                        f'BULBNodeWarning("You have defined BULB_CREATE_PROPERTY_IF_NOT_FOUND = True, but the neo4j\'s \'apoc\' plugin is not installed. So no new property was created.")')
-                    warnings.warn(
-                        f"You have defined BULB_CREATE_PROPERTY_IF_NOT_FOUND = True, but the neo4j's 'apoc' plugin is not installed. So no new property was created.",
-                        BULBNodeWarning)
+        :param limit (optional, default=None) : Must be an integer. This parameter defines the number of returned elements.
+
+        :param skip (optional, default=None) : Must be an integer. This parameter defines the number of skipped elements. For example
+                                               if self.skip = 3, the 3 first returned elements will be skipped.
+
+        :param desc (optional, default=False) : Must be a boolean. If it is False the elements will be returned in an increasing order,
+                                                but it is True, they will be returned in a descending order.
+
+        :param only (optional, default=None) : Must be a list of field_names. If this parameter is filled, the return will not be Node
+                                               instances, but a dict with "only" the mentioned fields.
 
-            # File handling (with SFTP storage).
-            if eval(f"self.__class__.{property_name}.sftp"):
+        :param filter (optional, default=None) : Must be Q statement. You must use the Q class stored in bulb.db
+                                                 Example: Q(name__contains="al") | Q(age__year__lte=8)
 
-                old_remote_file_path_for_purge = None
+        :param distinct (optional, default=False) : Must be a boolean. If it is True, the returned list will be only composed with
+                                                    unique elements.
 
-                if self.__dict__[property_name] != "None" and self.__dict__[property_name] != "":
-                    old_remote_file_path_for_purge = "/".join(self.__dict__[property_name].split("/")[3:])
+        :param handmade: If this param is filled, no other must be filled. With 'handmade', you can insert your own get query and
+                         the function will transform the objects returned by the database into Python instance of this class. WARNING :
+                         Please consider using the gdbh.r_transaction() method (imported from bulb.db) if your request no returns full
+                         Neo4j objects but a list of properties.
+                         Examples :
+                         ❌ : MATCH (n) RETURN n.first_name, n.last_name
+                         ✅ : MATCH (n) RETURN n
 
-                old_remote_file_path_for_remove = ("/www/" + old_remote_file_path_for_purge) if old_remote_file_path_for_purge is not None else None
+                         In addition, note that the RETURN must absolutely be named 'n' like "node".
 
-                if not isinstance(new_property_value, InMemoryUploadedFile) and not isinstance(new_property_value, TemporaryUploadedFile):
+        :param parameters (optional, default=None) : Must be a dict. The parameters of the 'handmade' query (referenced in the
+                                                     query with the $name syntax).
 
-                    if new_property_value == "None":
+        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return a tuple that contains
+                                                        the cypher query and its parameters dictionary.
 
-                        gdbh.w_transaction("""
-                            MATCH (n:%s {uuid:'%s'})
-                            WHERE exists(n.%s)
-                            SET n.%s = "%s"
-                        """ % (class_name, self.uuid,
-                               property_name,
-                               property_name, None))
+        :param iterator (optional, default=False) : Must be a boolean. If it is True, the method will return a generator which
+                                                    yields the instances one by one, as they are received from the database,
+                                                    instead of a list. Use it to go through large results sets with a flat
+                                                    memory usage.
 
-                        # Remove the old file if there is one.
-                        with SFTP.connect() as sftp:
+        :param chunk_size (optional, default=1000) : Must be an integer. With 'iterator', the number of records fetched by each
+                                                     network round trip (see gdbh.stream()).
 
-                            if old_remote_file_path_for_remove is not None:
-                                if sftp.exists(old_remote_file_path_for_remove):
-                                    try:
-                                        sftp.remove(old_remote_file_path_for_remove)
+        :param prefetch (optional, default=None) : Must be a list of relationships names. The nodes related to the returned
+                                                   instances by these relationships are loaded with a single query per
+                                                   relationship, and the get() method of these relationships (called without
+                                                   parameters) returns them without querying the database.
+                                                   See Node.prefetch_relationships().
 
-                                    except:
-                                        pass
+        :param after (optional, default=None) : The last instance of the previous page (or a tuple of the values of its
+                                                'order_by' properties followed by its uuid). If it is filled, only the instances
+                                                placed after it are returned : unlike 'skip', the previous instances are not
+                                                read by the database, so each page is returned as fast as the first one.
+                                                See QuerySet.after().
 
-                                    if old_remote_file_path_for_purge is not None:
-                                        if settings.BULB_USE_CDN77:
-                                            from bulb.sftp_and_cdn.cdn_apis import CDN77
+        :return: If uuid is None, a list will be returned. Else it will be a unique instance.
+        """
 
-                                            try:
-                                                CDN77.purge([old_remote_file_path_for_purge, ])
+        if handmade is None:
+            queryset = cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                           filter=filter, distinct=distinct, prefetch=prefetch, after=after)
+
+            if iterator and return_query is False:
+                return queryset.iterator(chunk_size=chunk_size)
+
+            if return_query is False:
+                response = list(queryset)
 
-                                            except:
-                                                pass
+                if response:
+                    if only is None and uuid is not None:
+                        return response[0]
 
                     else:
-                        bulb_logger(
-                            f'BULBPropertyError("The property \'{property_name}\' is configured with \'sftp=True\' but its value is neither a file nor \'None\'.")')
-                        raise BULBPropertyError(
-                            f"The property '{property_name}' is configured with 'sftp=True' but its value is neither a file nor 'None'.")
+                        return response
 
                 else:
+                    return None
 
-                    temporary_local_file_path, remote_file_path = compress_file_and_build_paths(new_property_value)
+            else:
+                return queryset.compile()
 
-                    with SFTP.connect() as sftp:
-                        try:
-                            sftp.put(temporary_local_file_path, remote_file_path)
+        else:
 
-                            if old_remote_file_path_for_remove is not None:
-                                if sftp.exists(old_remote_file_path_for_remove):
+            hydrator = cls._get_hydrator(cls)
 
-                                    try:
-                                        sftp.remove(old_remote_file_path_for_remove)
+            if iterator and return_query is False:
+                fake_instances = (hydrator(node_object["n"])
+                                  for node_object in gdbh.stream(handmade, parameters, fetch_size=chunk_size))
 
-                                    except:
-                                        pass
+                if prefetch:
+                    return cls._iterate_with_prefetch(fake_instances, prefetch, chunk_size)
 
-                                    if old_remote_file_path_for_purge is not None:
-                                        if settings.BULB_USE_CDN77:
-                                            from bulb.sftp_and_cdn.cdn_apis import CDN77
+                return fake_instances
 
-                                            try:
-                                                CDN77.purge([old_remote_file_path_for_purge, ])
+            if return_query is False:
+                response = gdbh.r_transaction(handmade, parameters)
+                fake_instances_list = [hydrator(node_object["n"]) for node_object in response]
 
-                                            except:
-                                                pass
+                if prefetch:
+                    cls.prefetch_relationships(fake_instances_list, prefetch)
 
-                        # Check and create default storage folders if they are not already created.
-                        except IOError:
-                            if not sftp.exists("/www/staticfiles"):
-                                sftp.mkdir("/www/staticfiles")
+                return fake_instances_list
 
-                            if not sftp.exists("/www/staticfiles/content"):
-                                sftp.mkdir("/www/staticfiles/content")
+            else:
+                return handmade, (parameters if parameters is not None else {})
 
-                            if not sftp.exists("/www/staticfiles/content/img"):
-                                sftp.mkdir("/www/staticfiles/content/img")
 
-                            if not sftp.exists("/www/staticfiles/content/pdf"):
-                                sftp.mkdir("/www/staticfiles/content/pdf")
+    @classmethod
+    def get_many(cls, uuids, prefetch=None):
+        """
+        This method retrieves many Node (or of one of its children classes) instances by their uuids, with a single query
+        (instead of one get() call per uuid).
 
-                            if not sftp.exists("/www/staticfiles/content/svg"):
-                                sftp.mkdir("/www/staticfiles/content/svg")
+        :param uuids (required) : A list of uuids.
 
-                            sftp.put(temporary_local_file_path, remote_file_path)
+        :param prefetch (optional, default=None) : Must be a list of relationships names. See the get() method.
 
-                            if old_remote_file_path_for_remove is not None:
-                                if sftp.exists(old_remote_file_path_for_remove):
+        :return: A dict which associates the uuids to the instances. The uuids which don't match any node are not in the
+                 dict.
+        """
+        uuids = list(uuids)
 
-                                    try:
-                                        sftp.remove(old_remote_file_path_for_remove)
+        if not uuids:
+            return {}
 
-                                    except:
-                                        pass
+        queryset = cls.objects.filter(uuid__in=uuids)
 
-                                    if old_remote_file_path_for_purge is not None:
-                                        if settings.BULB_USE_CDN77:
-                                            from bulb.sftp_and_cdn.cdn_apis import CDN77
+        if prefetch:
+            queryset = queryset.prefetch(*prefetch)
 
-                                            try:
-                                                CDN77.purge([old_remote_file_path_for_purge, ])
+        return {instance.uuid: instance for instance in queryset}
 
-                                            except:
-                                                pass
+    @classmethod
+    def get_str(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False,
+            return_query=False):
+        """
+        A get method which returns string serialized instances / instances dict.
 
-                    os.remove(temporary_local_file_path)
+        See Node.get() documentation part to learn the role of each parameter.
 
-                    full_stored_file_path_list = (settings.BULB_SFTP_PULL_URL + remote_file_path).split("/")
-                    full_stored_file_path_list.pop(3)
-                    full_stored_file_path = "/".join(full_stored_file_path_list)
+        :return:
+        """
+        instances = cls.get(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only, filter=filter,
+                            distinct=distinct, return_query=return_query)
 
-                    gdbh.w_transaction("""
-                    MATCH (n:%s {uuid:"%s"})
-                    WHERE exists(n.%s)
-                    SET n.%s = "%s"
-                    """ % (class_name, self.uuid,
-                           property_name,
-                           property_name, full_stored_file_path))
+        if instances is not None:
+            for instance in instances:
 
-                    new_property_value = full_stored_file_path
+                if only is not None:
+                    for property_name, property_value in instance.items():
 
-            # Handle spatial 2D fields.
-            elif eval(f"self.__class__.{property_name}.spatial_2D"):
-                if isinstance(new_property_value, tuple):
-                    if len(new_property_value) == 2:
+                        # Serialize datetime, date and time objects.
+                        if isinstance(property_value, neotime.DateTime) or isinstance(property_value, neotime.Date) or isinstance(property_value, neotime.Time):
+                            instance[property_name] = str(property_value)
 
-                        # Test if each value is an integer.
-                        for tuple_item in new_property_value:
-                            if not isinstance(tuple_item, int) and not isinstance(tuple_item, float):
-                                bulb_logger.error(
-                                    f'BULBPropertyError("The property \'{property_name}\' is configured with \'spatial_2D=True\' its value must be a tuple of integers/floats (longitude, latitude).")')
-                                raise BULBPropertyError(
-                                    f"The property '{property_name}' is configured with 'spatial_2D=True' its value must be a tuple of integers/floats (longitude, latitude).")
+                else:
+                    for property_name, property_value in instance.__dict__.items():
 
-                        point_str = "point({latitude:%s, longitude:%s})" % (new_property_value[0], new_property_value[1])
-                        gdbh.w_transaction("""
-                        MATCH (n:%s {uuid:"%s"})
-                        WHERE exists(n.%s)
-                        SET n.%s = %s
-                        """ % (class_name, self.uuid,
-                               property_name,
-                               property_name, point_str))
-                        new_property_value = Spatial2D(new_property_value[0], new_property_value[1])
-                    else:
-                        bulb_logger.error(
-                            f'BULBPropertyError("The property \'{property_name}\' is configured with \'spatial_2D=True\' its value must be a tuple of integers/floats (longitude, latitude).")')
-                        raise BULBPropertyError(
-                            f"The property '{property_name}' is configured with 'spatial_2D=True' its value must be a tuple of integers/floats (longitude, latitude).")
+                        # Serialize datetime, date and time objects.
+                        if isinstance(property_value, neotime.DateTime) or isinstance(property_value, neotime.Date) or isinstance(property_value, neotime.Time):
+                            instance.__dict__[property_name] = str(property_value)
 
-                else:
-                    bulb_logger.error(
-                        f'BULBPropertyError("The property \'{property_name}\' is configured with \'spatial_2D=True\' its value must be a tuple of integers/floats (longitude, latitude).")')
-                    raise BULBPropertyError(
-                        f"The property '{property_name}' is configured with 'spatial_2D=True' its value must be a tuple of integers/floats (longitude, latitude).")
+        return instances
 
-            # Integer, float, boolean and list handling.
-            elif isinstance(new_property_value, int) or isinstance(new_property_value, float) or isinstance(new_property_value, bool) or isinstance(new_property_value, list) or isinstance(new_property_value, tuple):
-                gdbh.w_transaction("""
-                MATCH (n:%s {uuid:"%s"})
-                WHERE exists(n.%s)
-                SET n.%s = %s
-                """ % (class_name, self.uuid,
-                       property_name,
-                       property_name, new_property_value))
+    def update(self, property_name, new_property_value):
+        """
+        This method updates a property of the node, in the database and in the instance.
 
-            # Datetime handling.
-            elif isinstance(new_property_value, datetime.datetime):
-                gdbh.w_transaction("""
-                            MATCH (n:%s {uuid:"%s"})
-                            WHERE exists(n.%s)
-                            SET n.%s = datetime("%s")
-                            """ % (class_name, self.uuid,
-                                   property_name,
-                                   property_name, str(new_property_value).replace(" ", "T")))
-
-            # Date handling.
-            elif isinstance(new_property_value, datetime.date):
-                gdbh.w_transaction("""
-                                MATCH (n:%s {uuid:"%s"})
-                                WHERE exists(n.%s)
-                                SET n.%s = date("%s")
-                                """ % (class_name, self.uuid,
-                                       property_name,
-                                       property_name, str(new_property_value)))
-
-            # Time handling.
-            elif isinstance(new_property_value, datetime.time):
-                gdbh.w_transaction("""
-                            MATCH (n:%s {uuid:"%s"})
-                            WHERE exists(n.%s)
-                            SET n.%s = time("%s")
-                            """ % (class_name, self.uuid,
-                                   property_name,
-                                   property_name, str(new_property_value)))
-
-            # String handling.
-            elif isinstance(new_property_value, str):
-                # Escape quotes to prevent cypher syntax errors.
-                new_property_value = new_property_value.replace('"', '\\"').replace("'", "\\'")
+        :param property_name (required) : The name of the property to update.
 
-                gdbh.w_transaction("""
-                MATCH (n:%s {uuid:'%s'})
-                WHERE exists(n.%s)
-                SET n.%s = "%s"
-                """ % (class_name, self.uuid,
-                       property_name,
-                       property_name, new_property_value))
+        :param new_property_value (required) : The new value of the property.
+
+        :return: The instance itself.
+        """
+        return self.update_many({property_name: new_property_value})
+
+    def update_many(self, properties_dict):
+        """
+        This method updates many properties of the node with a single query, in the database and in the instance.
+
+        :param properties_dict (required) : A dictionary where keys are the names of the properties to update and values their
+                                            new values.
+
+        :return: The instance itself.
+        """
+        class_name = self.__class__.__name__
+        properties_fields = self.__class__._get_property_fields()
+
+        parameters_properties_dict = {}
+        new_properties_dict = {}
+
+        for property_name, new_property_value in properties_dict.items():
+
+            if not settings.BULB_CREATE_PROPERTY_IF_NOT_FOUND and property_name not in self.__dict__.keys():
+                bulb_logger.warning(
+                    f'BULBNodeWarning("You are trying to update the property \'{property_name}\' of an {class_name} instance, but this property was not found in the instance dict. The update will have maybe no effect.")')
+                warnings.warn(
+                    f"You are trying to update the property '{property_name}' of an {class_name} instance, but this property was not found in the instance dict. The update will have maybe no effect.",
+                    BULBNodeWarning)
 
-            # Other
             else:
-                gdbh.w_transaction("""
-                MATCH (n:%s {uuid:'%s'})
-                WHERE exists(n.%s)
-                SET n.%s = "%s"
-                """ % (class_name, self.uuid,
-                       property_name,
-                       property_name, new_property_value))
+                new_property_value = self._prepare_property_value(properties_fields.get(property_name), property_name,
+                                                                  new_property_value)
 
-            setattr(self, property_name, new_property_value)
+                new_properties_dict[property_name] = new_property_value
+                parameters_properties_dict[property_name] = format_value_to_parameter(new_property_value)
+
+        if parameters_properties_dict:
+            # Note : The '+=' operator creates the properties which are not found on the node.
+            gdbh.w_transaction("""
+            MATCH (n:%s {uuid: $uuid})
+            SET n += $properties
+            """ % class_name, {"uuid": self.uuid, "properties": parameters_properties_dict})
+
+            for property_name, new_property_value in new_properties_dict.items():
+                setattr(self, property_name, new_property_value)
 
         return self
 
-    def delete(self):
+    @classmethod
+    def bulk_update(cls, instances_or_uuids, values, batch_size=1000):
+        """
+        This method updates the properties of many nodes with a single query per batch.
 
-        # Handle sftp files removing.
-        # All the attributes (representing the properties of the Node) of the current node class.
-        class_properties_dict = self.__class__._get_property_fields()
+        :param instances_or_uuids (required) : A list of instances of the class (or of one of its children classes) or of
+                                               their uuids.
 
-        for field_name, field_content in class_properties_dict.items():
+        :param values (required) : Either a dictionary of properties' names and values that will be applied to all the nodes, or
+                                   a list of such dictionaries (one per node, in the same order as 'instances_or_uuids').
+                                   NB : The properties configured with 'sftp=True' cannot be updated with this method.
 
-            if eval(f"self.__class__.{field_name}.sftp") and settings.DEBUG is False:
+        :param batch_size (optional, default=1000) : Must be an integer. The number of nodes updated by each query.
 
-                old_remote_file_path_for_purge = None
+        :return: The number of updated nodes.
+        """
+        uuids = [(item.uuid if isinstance(item, BaseNodeAndRelationship) else item) for item in instances_or_uuids]
+        properties_fields = cls._get_property_fields()
+        cypher_labels = DatabaseNode.format_labels_to_cypher(cls._get_labels())
 
-                if self.__dict__[field_name] != "None" and self.__dict__[field_name] != "":
-                    old_remote_file_path_for_purge = "/".join(self.__dict__[field_name].split("/")[3:])
+        if isinstance(values, dict):
+            per_row_values = False
+            parameters_properties_dict = cls._prepare_bulk_properties(properties_fields, values)
 
-                old_remote_file_path_for_remove = ("/www/" + old_remote_file_path_for_purge) if old_remote_file_path_for_purge is not None else None
+        elif isinstance(values, (list, tuple)) and len(values) == len(uuids):
+            per_row_values = True
 
-                # Remove the old file if there is one.
-                with SFTP.connect() as sftp:
+        else:
+            bulb_logger.error(
+                f'BULBNodeError("The \'values\' parameter of the bulk_update() method of {cls.__name__} must be a dict or a list of dicts with one dict per node.")')
+            raise BULBNodeError(
+                f"The 'values' parameter of the bulk_update() method of {cls.__name__} must be a dict or a list of dicts with one dict per node.")
 
-                    if old_remote_file_path_for_remove is not None:
-                        if sftp.exists(old_remote_file_path_for_remove):
-                            try:
-                                sftp.remove(old_remote_file_path_for_remove)
+        updated_nodes_number = 0
 
-                            except:
-                                pass
+        for batch_start in range(0, len(uuids), batch_size):
+            batch_uuids = uuids[batch_start:batch_start + batch_size]
 
-                            if old_remote_file_path_for_purge is not None:
-                                if settings.BULB_USE_CDN77:
-                                    from bulb.sftp_and_cdn.cdn_apis import CDN77
+            if per_row_values:
+                rows = [{"uuid": uuid, "properties": cls._prepare_bulk_properties(properties_fields, row_values)}
+                        for uuid, row_values in zip(batch_uuids, values[batch_start:batch_start + batch_size])]
 
-                                    try:
-                                        CDN77.purge([old_remote_file_path_for_purge, ])
+                response = gdbh.w_transaction("""
+                UNWIND $rows AS row
+                MATCH (n:%s {uuid: row.uuid})
+                SET n += row.properties
+                RETURN COUNT(n)
+                """ % cypher_labels, {"rows": rows})
 
-                                    except:
-                                        pass
+            else:
+                response = gdbh.w_transaction("""
+                UNWIND $uuids AS uuid
+                MATCH (n:%s {uuid: uuid})
+                SET n += $properties
+                RETURN COUNT(n)
+                """ % cypher_labels, {"uuids": batch_uuids, "properties": parameters_properties_dict})
+
+            updated_nodes_number += response[0]["COUNT(n)"]
+
+        return updated_nodes_number
+
+    @classmethod
+    def _prepare_bulk_properties(cls, properties_fields, properties_dict):
+        """
+        This method checks and converts the properties' values of a bulk update into query parameters.
+
+        :param properties_fields (required) : The property fields of the class.
 
-        # Handle relationships on_delete behaviours.
-        class_relationships_dict = self._get_relationship_fields()
+        :param properties_dict (required) : The dictionary of properties' names and new values.
 
+        :return: A dictionary of properties' names and values formatted as parameters.
         """
-        ################################################################################################################
-        ######################################### THE BELOW CODE IS NOT TESTED #########################################
-        ################################################################################################################
+        parameters_properties_dict = {}
+
+        for property_name, new_property_value in properties_dict.items():
+            property_field = properties_fields.get(property_name)
+
+            if property_field is None and not settings.BULB_CREATE_PROPERTY_IF_NOT_FOUND:
+                bulb_logger.warning(
+                    f'BULBNodeWarning("You are trying to update the property \'{property_name}\' of {cls.__name__} instances, but this property is not a property field of the class. The update will have no effect.")')
+                warnings.warn(
+                    f"You are trying to update the property '{property_name}' of {cls.__name__} instances, but this property is not a property field of the class. The update will have no effect.",
+                    BULBNodeWarning)
+                continue
+
+            if property_field is not None and property_field.sftp:
+                bulb_logger.error(
+                    f'BULBPropertyError("The property \'{property_name}\' is configured with \'sftp=True\', it cannot be updated with the bulk_update(), upsert() and bulk_upsert() methods.")')
+                raise BULBPropertyError(
+                    f"The property '{property_name}' is configured with 'sftp=True', it cannot be updated with the bulk_update(), upsert() and bulk_upsert() methods.")
+
+            new_property_value = cls._prepare_spatial_2D_value(property_field, property_name, new_property_value)
+            parameters_properties_dict[property_name] = format_value_to_parameter(new_property_value)
+
+        return parameters_properties_dict
+
+    def _prepare_property_value(self, property_field, property_name, new_property_value):
         """
-        # Handle sftp files removing.
-        for relationship_name, relationship in class_relationships_dict.items():
+        This method prepares the new value of a property before its update : it stores the files of the properties
+        configured with 'sftp=True' (and removes the old ones) and converts the values of the properties configured with
+        'spatial_2D=True'.
+
+        :param property_field (required) : The Property instance of the property, or None if the property is not a property
+                                            field of the class.
 
-            additional_properties = None
-            if relationship.properties is not None:
-                additional_properties = relationship.properties
+        :param property_name (required) : The name of the property.
 
-            relationship_properties = relationship._get_property_fields(additional_fields_dict=additional_properties)
+        :param new_property_value (required) : The new value of the property.
 
-            for field_name, field_value in relationship_properties.items():
+        :return: The value to store in the instance.
+        """
+        # File handling (with SFTP storage).
+        if property_field is not None and property_field.sftp:
 
-                # if eval(f"field_value.__class__.{field_name}.sftp"):
-                if field_value.sftp and settings.DEBUG is False:
+            old_remote_file_path_for_purge = None
+            old_property_value = self.__dict__.get(property_name, "None")
 
-                    old_remote_file_path_for_purge = None
+            if old_property_value is not None and old_property_value != "None" and old_property_value != "":
+                old_remote_file_path_for_purge = "/".join(old_property_value.split("/")[3:])
 
-                    if field_value.__dict__[field_name] != "None" and field_value.__dict__[field_name] != "":
-                        old_remote_file_path_for_purge = "/".join(field_value.__dict__[field_name].split("/")[3:])
+            old_remote_file_path_for_remove = ("/www/" + old_remote_file_path_for_purge) if old_remote_file_path_for_purge is not None else None
 
-                    old_remote_file_path_for_remove = ("/www/" + old_remote_file_path_for_purge) if old_remote_file_path_for_purge is not None else None
+            if not isinstance(new_property_value, InMemoryUploadedFile) and not isinstance(new_property_value, TemporaryUploadedFile):
+
+                if new_property_value == "None":
 
                     # Remove the old file if there is one.
                     with SFTP.connect() as sftp:
@@ -1172,32 +1486,213 @@ class Node(BaseNodeAndRelationship):
 
                                         except:
                                             pass
+
+                    return "None"
+
+                else:
+                    bulb_logger.error(
+                        f'BULBPropertyError("The property \'{property_name}\' is configured with \'sftp=True\' but its value is neither a file nor \'None\'.")')
+                    raise BULBPropertyError(
+                        f"The property '{property_name}' is configured with 'sftp=True' but its value is neither a file nor 'None'.")
+
+            else:
+                temporary_local_file_path, remote_file_path = compress_file_and_build_paths(new_property_value)
+
+                with SFTP.connect() as sftp:
+                    try:
+                        sftp.put(temporary_local_file_path, remote_file_path)
+
+                        if old_remote_file_path_for_remove is not None:
+                            if sftp.exists(old_remote_file_path_for_remove):
+
+                                try:
+                                    sftp.remove(old_remote_file_path_for_remove)
+
+                                except:
+                                    pass
+
+                                if old_remote_file_path_for_purge is not None:
+                                    if settings.BULB_USE_CDN77:
+                                        from bulb.sftp_and_cdn.cdn_apis import CDN77
+
+                                        try:
+                                            CDN77.purge([old_remote_file_path_for_purge, ])
+
+                                        except:
+                                            pass
+
+                    # Check and create default storage folders if they are not already created.
+                    except IOError:
+                        if not sftp.exists("/www/staticfiles"):
+                            sftp.mkdir("/www/staticfiles")
+
+                        if not sftp.exists("/www/staticfiles/content"):
+                            sftp.mkdir("/www/staticfiles/content")
+
+                        if not sftp.exists("/www/staticfiles/content/img"):
+                            sftp.mkdir("/www/staticfiles/content/img")
+
+                        if not sftp.exists("/www/staticfiles/content/pdf"):
+                            sftp.mkdir("/www/staticfiles/content/pdf")
+
+                        if not sftp.exists("/www/staticfiles/content/svg"):
+                            sftp.mkdir("/www/staticfiles/content/svg")
+
+                        sftp.put(temporary_local_file_path, remote_file_path)
+
+                        if old_remote_file_path_for_remove is not None:
+                            if sftp.exists(old_remote_file_path_for_remove):
+
+                                try:
+                                    sftp.remove(old_remote_file_path_for_remove)
+
+                                except:
+                                    pass
+
+                                if old_remote_file_path_for_purge is not None:
+                                    if settings.BULB_USE_CDN77:
+                                        from bulb.sftp_and_cdn.cdn_apis import CDN77
+
+                                        try:
+                                            CDN77.purge([old_remote_file_path_for_purge, ])
+
+                                        except:
+                                            pass
+
+                os.remove(temporary_local_file_path)
+
+                full_stored_file_path_list = (settings.BULB_SFTP_PULL_URL + remote_file_path).split("/")
+                full_stored_file_path_list.pop(3)
+                full_stored_file_path = "/".join(full_stored_file_path_list)
+
+                return full_stored_file_path
+
+        # Handle spatial 2D fields.
+        return self._prepare_spatial_2D_value(property_field, property_name, new_property_value)
+
+    @staticmethod
+    def _prepare_spatial_2D_value(property_field, property_name, new_property_value):
         """
-        ################################################################################################################
-        ######################################### THE ABOVE CODE IS NOT TESTED #########################################
-        ################################################################################################################
+        This method converts the new value of a property configured with 'spatial_2D=True' into a Spatial2D instance.
+
+        :param property_field (required) : The Property instance of the property, or None if the property is not a property
+                                            field of the class.
+
+        :param property_name (required) : The name of the property.
+
+        :param new_property_value (required) : The new value of the property.
+
+        :return: A Spatial2D instance for the spatial 2D properties, else the value itself.
         """
+        if property_field is None or not property_field.spatial_2D:
+            return new_property_value
 
-        for relationship_field_name, relationship_field in class_relationships_dict.items():
-            if relationship_field.on_delete == "CASCADE":
-                related_nodes = eval(f"self.{relationship_field_name}.get()")
+        if isinstance(new_property_value, tuple) and len(new_property_value) == 2:
 
-                if related_nodes is not None:
-                    for node in related_nodes:
-                        node.delete()
+            # Test if each value is an integer.
+            for tuple_item in new_property_value:
+                if not isinstance(tuple_item, int) and not isinstance(tuple_item, float):
+                    bulb_logger.error(
+                        f'BULBPropertyError("The property \'{property_name}\' is configured with \'spatial_2D=True\' its value must be a tuple of integers/floats (longitude, latitude).")')
+                    raise BULBPropertyError(
+                        f"The property '{property_name}' is configured with 'spatial_2D=True' its value must be a tuple of integers/floats (longitude, latitude).")
 
-        gdbh.w_transaction("""
-        MATCH (n:%s {uuid:'%s'})
-        DETACH DELETE (n)
-        """ % (self.__class__.__name__, self.uuid))
+            return Spatial2D(new_property_value[0], new_property_value[1])
+
+        bulb_logger.error(
+            f'BULBPropertyError("The property \'{property_name}\' is configured with \'spatial_2D=True\' its value must be a tuple of integers/floats (longitude, latitude).")')
+        raise BULBPropertyError(
+            f"The property '{property_name}' is configured with 'spatial_2D=True' its value must be a tuple of integers/floats (longitude, latitude).")
+
+    def delete(self):
+        """
+        This method deletes the node, and the nodes related to it by relationships configured with on_delete="CASCADE" (and
+        the nodes related to them, etc...).
+        The related nodes are collected level by level, with one query per "CASCADE" relationship and per level, then all
+        the nodes are deleted with a single DETACH DELETE query. All these queries are run in a single transaction.
+        The files of the 'sftp' properties of the deleted nodes are removed once the transaction is committed, with a
+        single SFTP connection and a single CDN purge.
+        """
+        node_model = self.__class__
 
+        deleted_nodes_ids = []
+        visited_nodes_keys = {self.uuid}
+        files_paths = node_model._get_sftp_files_paths(node_model._get_property_fields(), self.__dict__)
+
+        with gdbh.transaction("WRITE"):
+            # Collect the related nodes level by level : each level is a dict of node_models and uuids.
+            current_level = {node_model: [self.uuid]}
+
+            while current_level:
+                next_level = {}
+
+                for level_node_model, uuids in current_level.items():
+                    for relationship in level_node_model._get_relationship_fields().values():
+                        if relationship.manage_is_done is False:
+                            relationship._manage_relationship_parameters()
+                            relationship.manage_is_done = True
+
+                        files_paths.extend(relationship._get_relationships_sftp_files_paths(level_node_model, uuids))
+
+                        if relationship.on_delete != "CASCADE":
+                            continue
+
+                        related_node_model = relationship.start if relationship.direction == "to" else relationship.target
+
+                        if related_node_model == "self":
+                            related_node_model = level_node_model
+
+                        response = gdbh.r_transaction("""
+                        UNWIND $uuids AS uuid
+                        MATCH (:%s {uuid: uuid})-[:%s]-(m%s)
+                        RETURN DISTINCT m
+                        """ % (level_node_model.__name__, relationship.rel_type,
+                               relationship._get_related_nodes_labels(level_node_model)), {"uuids": uuids})
+
+                        for node_object in response:
+                            related_node_object = node_object["m"]
+                            related_node_uuid = related_node_object._properties.get("uuid")
+                            related_node_key = related_node_uuid if related_node_uuid is not None else related_node_object.id
+
+                            if related_node_key in visited_nodes_keys:
+                                continue
+
+                            visited_nodes_keys.add(related_node_key)
+                            deleted_nodes_ids.append(related_node_object.id)
+
+                            # Find the node_model of the related node, to handle its own relationships.
+                            related_node_object_model = node_models_registry.get_node_model_from_labels(related_node_object.labels)
+
+                            if related_node_object_model is None and inspect.isclass(related_node_model):
+                                related_node_object_model = related_node_model
+
+                            if related_node_object_model is not None:
+                                files_paths.extend(
+                                    related_node_object_model._get_sftp_files_paths(related_node_object_model._get_property_fields(),
+                                                                                    related_node_object._properties))
+
+                                if related_node_uuid is not None:
+                                    next_level.setdefault(related_node_object_model, []).append(related_node_uuid)
+
+                current_level = next_level
+
+            gdbh.w_transaction("""
+            MATCH (n:%s {uuid: $uuid})
+            OPTIONAL MATCH (m) WHERE id(m) IN $ids
+            DETACH DELETE n, m
+            """ % node_model.__name__, {"uuid": self.uuid, "ids": deleted_nodes_ids})
+
+        # Remove the files once the nodes are deleted.
+        BaseNodeAndRelationship._remove_sftp_files(files_paths)
 
     @classmethod
     def count(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None, distinct=False, handmade=None,
-              **extrafields):
-        request_statement = cls.get(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only, filter=filter,
-                                    handmade=handmade, return_query=True, **extrafields)
-        request_count_statement = None
+              parameters=None, **extrafields):
+        if handmade is None:
+            return cls._build_queryset(uuid=uuid, order_by=order_by, limit=limit, skip=skip, desc=desc, only=only,
+                                       filter=filter, distinct=distinct).filter(**extrafields).count()
+
+        request_statement, request_parameters = cls.get(handmade=handmade, parameters=parameters, return_query=True)
 
         if not distinct:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(n)"
@@ -1205,7 +1700,7 @@ class Node(BaseNodeAndRelationship):
         else:
             request_count_statement = request_statement.split("RETURN")[0] + "RETURN COUNT(DISTINCT n)"
 
-        response = gdbh.r_transaction(request_count_statement)
+        response = gdbh.r_transaction(request_count_statement, request_parameters)
 
         if not distinct:
             return response[0]["COUNT(n)"]
@@ -1214,7 +1709,158 @@ class Node(BaseNodeAndRelationship):
             return response[0]["COUNT(DISTINCT n)"]
 
     @classmethod
-    def _get_labels(cls):
+    def aggregate(cls, filter=None, **aggregates):
+        """
+        This method computes aggregates (see bulb.db.aggregates) on the nodes of the class. The aggregates are computed by the
+        database, so only their results are sent back (see QuerySet.aggregate()).
+
+        Example :
+            Product.aggregate(total=Sum("price"), most_expensive=Max("price"))
+            >>> {"total": 254.5, "most_expensive": 42.0}
+
+        :param filter (optional, default=None) : Must be Q statement. You must use the Q class stored in bulb.db
+                                                 Example: Q(name__contains="al") | Q(age__year__lte=8)
+
+        :param aggregates (required) : The aggregates (Count, Sum, Avg, Min or Max instances), named by the keys of the
+                                       returned dict.
+
+        :return: A dict which contains the results of the aggregates.
+        """
+        return cls._build_queryset(filter=filter).aggregate(**aggregates)
+
+    @classmethod
+    def _build_queryset(cls, uuid=None, order_by=None, limit=None, skip=None, desc=False, only=None, filter=None,
+                        distinct=False, prefetch=None, after=None):
+        """
+        This method converts the parameters of the get() and count() methods into a QuerySet.
+
+        See Node.get() documentation part to learn the role of each parameter.
+
+        :return: A QuerySet of the class.
+        """
+        queryset = cls.objects
+
+        if uuid is not None:
+            queryset = queryset.filter(uuid=uuid)
+
+        if filter is not None:
+            queryset = queryset.filter(filter)
+
+        # Check the desc parameter.
+        if not isinstance(desc, bool):
+            bulb_logger.error(
+                f'BULBNodeError("The \'desc\' parameter of the get() method of {cls.__name__} must be a boolean.")')
+            raise BULBNodeError(
+                f"The 'desc' parameter of the get() method of {cls.__name__} must be a boolean.")
+
+        if order_by is not None:
+            if isinstance(order_by, dict):
+                queryset = queryset.order_by(*[("-" if is_desc else "") + order_property
+                                               for order_property, is_desc in order_by.items()])
+
+            else:
+                queryset = queryset.order_by(("-" if desc else "") + order_by)
+
+        if skip is not None:
+            queryset = queryset.skip(skip)
+
+        if limit is not None:
+            queryset = queryset.limit(limit)
+
+        if only:
+            queryset = queryset.only(*only)
+
+        if distinct:
+            queryset = queryset.distinct()
+
+        if prefetch:
+            queryset = queryset.prefetch(*prefetch)
+
+        if after is not None:
+            queryset = queryset.after(after)
+
+        return queryset
+
+    @classmethod
+    def prefetch_relationships(cls, instances, relationships_names):
+        """
+        This method loads the nodes related to many instances by relationships, with a single query per relationship, and
+        stores them in the instances (in instance.__dict__["_prefetched_relationships"]). Then, the get() method of these
+        relationships, called without parameters, returns the stored nodes instead of querying the database.
+        The stored nodes are forgotten by the add() and remove() methods of the relationship.
+
+        :param instances (required) : A list of instances of the class (or of one of its children classes).
+
+        :param relationships_names (required) : The names of the relationships to load.
+        """
+        if not instances:
+            return
+
+        relationships_fields = cls._get_relationship_fields()
+        uuids = [instance.uuid for instance in instances]
+
+        for relationship_name in relationships_names:
+            relationship = relationships_fields.get(relationship_name)
+
+            if relationship is None:
+                bulb_logger.error(
+                    f'BULBRelationshipError("{cls.__name__} has no relationship named \'{relationship_name}\' to prefetch.")')
+                raise BULBRelationshipError(f"{cls.__name__} has no relationship named '{relationship_name}' to prefetch.")
+
+            if relationship.manage_is_done is False:
+                relationship._manage_relationship_parameters()
+                relationship.manage_is_done = True
+
+            response = gdbh.r_transaction("""
+            UNWIND $uuids AS uuid
+            MATCH (s:%s {uuid: uuid})
+            OPTIONAL MATCH (s)-[:%s]-(n%s)
+            RETURN uuid, collect(n) AS related_nodes
+            """ % (cls.__name__, relationship.rel_type, relationship._get_related_nodes_labels(cls)), {"uuids": uuids})
+
+            related_nodes_by_uuid = {record["uuid"]: record["related_nodes"] for record in response}
+
+            for instance in instances:
+                bound_relationship = relationship.__get__(instance, cls)
+                fake_instances_list = []
+
+                for node_object in related_nodes_by_uuid.get(instance.uuid, ()):
+                    fake_instances_list.extend(
+                        bound_relationship._build_fake_instances_from_database_object({"n": node_object}, "node"))
+
+                instance.__dict__.setdefault("_prefetched_relationships", {})[relationship_name] = fake_instances_list
+
+    @classmethod
+    def _iterate_with_prefetch(cls, instances_iterator, relationships_names, chunk_size):
+        """
+        This method prefetches the relationships of the instances of a generator (see prefetch_relationships()), chunk by
+        chunk, and yields them.
+        """
+        chunk = []
+
+        for instance in instances_iterator:
+            chunk.append(instance)
+
+            if len(chunk) >= chunk_size:
+                cls.prefetch_relationships(chunk, relationships_names)
+                yield from chunk
+                chunk = []
+
+        if chunk:
+            cls.prefetch_relationships(chunk, relationships_names)
+            yield from chunk
+
+    @classmethod
+    def _get_labels(cls):
+        """
+        This method returns a list of all labels of a Node instance. The labels are computed once per class (see
+        BaseNodeAndRelationshipMetaclass).
+        :return: A list of all Node instance's labels.
+        """
+        return list(cls._get_cached_metadata("labels", lambda: tuple(cls._build_labels())))
+
+    @classmethod
+    def _build_labels(cls):
         """
         This method detects and regroups in a list, all labels of a Node instance. Then, it returns the list.
         :return: A list of all Node instance's labels.
@@ -1246,8 +1892,61 @@ class Node(BaseNodeAndRelationship):
 
         return list(labels_list)
 
+    @classmethod
+    def _get_indexes(cls):
+        """
+        This method returns a list of all indexes declared on a node_model : those of the properties configured with
+        'index=True', and those of the 'indexes' list of its Meta class (see bulb.db.indexes). The indexes are computed once
+        per class (see BaseNodeAndRelationshipMetaclass).
+        :return: A list of Index instances, which are created on the main label of the node_model (its class name).
+        """
+        return list(cls._get_cached_metadata("indexes", lambda: tuple(cls._build_indexes())))
+
+    @classmethod
+    def _build_indexes(cls):
+        """
+        This method detects and regroups in a list, all indexes of a node_model. Then, it returns the list.
+        :return: A list of all the node_model's indexes.
+        """
+        indexes_list = []
+
+        for property_name, property_field in cls._get_property_fields().items():
+            if property_field.index and not property_field.unique:
+                indexes_list.append(PointIndex(property_name) if property_field.spatial_2D else Index(property_name))
+
+        for index in getattr(getattr(cls, "Meta", None), "indexes", ()):
+            if not isinstance(index, Index):
+                bulb_logger.error(
+                    f'BULBNodeError("The \'indexes\' list of the Meta class of {cls.__name__} must contain only Index, PointIndex or FullTextIndex instances.")')
+                raise BULBNodeError(
+                    f"The 'indexes' list of the Meta class of {cls.__name__} must contain only Index, PointIndex or FullTextIndex instances.")
+
+            indexes_list.append(index)
+
+        # Remove the duplicated indexes (an index declared both on a property and in the Meta class).
+        unique_indexes_list = []
+        indexes_keys = set()
+
+        for index in indexes_list:
+            index_key = index.get_key(cls.__name__)
+
+            if index_key not in indexes_keys:
+                indexes_keys.add(index_key)
+                unique_indexes_list.append(index)
+
+        return unique_indexes_list
+
     @classmethod
     def _get_relationship_fields(cls):
+        """
+        This method returns a read-only dictionary of all relationship fields of a Node instance. The dictionary is
+        computed once per class (see BaseNodeAndRelationshipMetaclass).
+        :return: A dictionary of all Node instance's relationships.
+        """
+        return cls._get_cached_metadata("relationship_fields", lambda: MappingProxyType(cls._build_relationship_fields()))
+
+    @classmethod
+    def _build_relationship_fields(cls):
         """
         This method detects and regroups in a dictionary, all relationship fields of a Node instance. Then, it returns
         the dictionary.
@@ -1325,17 +2024,51 @@ class Relationship(BaseNodeAndRelationship):
         # Internals.
         self._self_node_instance = None
         self._name = None
+        self._unbound_relationship = None
 
         self.manage_is_done = False
 
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        """
+        When a relationship is accessed from a node_model instance, this method returns a copy of the relationship bound to
+        the instance. The copy is built on the first access and stored in the instance (in
+        instance.__dict__["_bound_relationships"]), so the next accesses only cost two dict lookups. When the relationship is
+        accessed from the node_model class, the relationship itself is returned.
+        """
+        if instance is None:
+            return self
+
+        bound_relationships = instance.__dict__.get("_bound_relationships")
+
+        if bound_relationships is None:
+            bound_relationships = instance.__dict__["_bound_relationships"] = {}
+
+        else:
+            try:
+                return bound_relationships[id(self)]
+
+            except KeyError:
+                pass
+
+        bound_relationship = object.__new__(self.__class__)
+        bound_relationship_dict = bound_relationship.__dict__
+        bound_relationship_dict.update(self.__dict__)
+        bound_relationship_dict["_self_node_instance"] = instance
+        bound_relationship_dict["_unbound_relationship"] = self
+
+        bound_relationships[id(self)] = bound_relationship
+
+        return bound_relationship
+
     def _manage_relationship_parameters(self):
         """
         This method manage all the Relationship object's parameters : It check their values and assigns them default
         values if nothing is found. More, it allow the "distinct" syntax for relationships.
         :return:
         """
-        all_node_models = get_all_node_models()
-
         # 'rel_type' parameter value research.
         if self.rel_type is None:
             try:
@@ -1402,32 +2135,11 @@ class Relationship(BaseNodeAndRelationship):
                         pass
 
                     else:
-                        related_node_model_was_found = False
-                        for node_model in all_node_models:
-                            if self.start == "User":
-                                from bulb.contrib.auth.node_models import User
-                                self.start = User
-                                related_node_model_was_found = True
-
-                            elif self.start == "Group":
-                                from bulb.contrib.auth.node_models import Group
-                                self.start = Group
-                                related_node_model_was_found = True
-
-                            elif self.start == "Permission":
-                                from bulb.contrib.auth.node_models import Permission
-                                self.start = Permission
-                                related_node_model_was_found = True
-
-                            elif self.start == "Session":
-                                from bulb.contrib.sessions.node_models import Session
-                                self.start = Session
-                                related_node_model_was_found = True
-
-                            elif node_model.__name__ == self.start:
-                                self.start = node_model
-                                related_node_model_was_found = True
-                                break
+                        related_node_model = node_models_registry.get_node_model(self.start)
+                        related_node_model_was_found = related_node_model is not None
+
+                        if related_node_model_was_found:
+                            self.start = related_node_model
 
                         if related_node_model_was_found is False:
                             bulb_logger.error(
@@ -1474,12 +2186,11 @@ class Relationship(BaseNodeAndRelationship):
                         pass
 
                     else:
-                        related_node_model_was_found = False
-                        for node_model in all_node_models:
-                            if node_model.__name__ == self.target:
-                                self.target = node_model
-                                related_node_model_was_found = True
-                                break
+                        related_node_model = node_models_registry.get_node_model(self.target)
+                        related_node_model_was_found = related_node_model is not None
+
+                        if related_node_model_was_found:
+                            self.target = related_node_model
 
                         if related_node_model_was_found is False:
                             bulb_logger.error(
@@ -1544,6 +2255,41 @@ class Relationship(BaseNodeAndRelationship):
                 raise BULBRelationshipError(
                     f"The parameter 'unique' of a {self.__class__.__name__} instance must be a boolean.")
 
+        # Store the managed parameters in the relationship of the node_model class, so they are managed only once and not
+        # for each bound relationship (see the __get__() method).
+        unbound_relationship = self.__dict__.get("_unbound_relationship")
+
+        if unbound_relationship is not None and unbound_relationship.manage_is_done is False:
+            for parameter_name in ("rel_type", "direction", "start", "target", "auto", "on_delete", "unique"):
+                setattr(unbound_relationship, parameter_name, getattr(self, parameter_name))
+
+            unbound_relationship.manage_is_done = True
+
+    def _get_relationship_property_fields(self):
+        """
+        This method returns the property fields of the relationship : those declared in its class and those given with the
+        'properties_fields' parameter. They are computed once and stored in the relationship of the node_model class, so
+        all the bound relationships (see the __get__() method) share them.
+        :return: A dictionary of all the relationship's properties.
+        """
+        unbound_relationship = self.__dict__.get("_unbound_relationship") or self
+
+        try:
+            return unbound_relationship.__dict__["_relationship_property_fields"]
+
+        except KeyError:
+            if unbound_relationship.properties_fields is not None:
+                relationship_property_fields = MappingProxyType(
+                    self._get_property_fields(additional_fields_dict=unbound_relationship.properties_fields))
+
+            else:
+                relationship_property_fields = self._get_property_fields()
+
+            unbound_relationship.__dict__["_relationship_property_fields"] = relationship_property_fields
+            self.__dict__["_relationship_property_fields"] = relationship_property_fields
+
+            return relationship_property_fields
+
     def _constructor(self, received_properties_dict):
         """
         This method collects and assigns to the current Relationship (or of one of its children classes) instance, all
@@ -1556,11 +2302,7 @@ class Relationship(BaseNodeAndRelationship):
             self._manage_relationship_parameters()
             self.manage_is_done = True
 
-        if self.properties_fields is not None:
-            self.properties_fields = self._get_property_fields(additional_fields_dict=self.properties_fields)
-
-        else:
-            self.properties_fields = self._get_property_fields()
+        self.properties_fields = self._get_relationship_property_fields()
 
         self.properties = Property._build(self, received_properties_dict)
 
@@ -1582,6 +2324,8 @@ class Relationship(BaseNodeAndRelationship):
             self._manage_relationship_parameters()
             self.manage_is_done = True
 
+        self._clear_prefetched_nodes()
+
         received_properties_dict = (properties if properties is not None else {})
         relationship_start_node = None
         relationship_target_node = None
@@ -1653,9 +2397,9 @@ class Relationship(BaseNodeAndRelationship):
 
                 if self.target is not None:
                     response = gdbh.r_transaction("""
-                    MATCH (n:%s {uuid:'%s'})
+                    MATCH (n:%s {uuid: $uuid})
                     RETURN count(n) > 0 as bool
-                    """ % (self.target.__name__, uuid))
+                    """ % self.target.__name__, {"uuid": uuid})
 
                     if response[0]["bool"] is True:
                         other_node_instance.__class__.__name__ = self.target.__name__
@@ -1669,9 +2413,9 @@ class Relationship(BaseNodeAndRelationship):
 
                 else:
                     response = gdbh.r_transaction("""
-                    MATCH (n: {uuid:'%s'})
+                    MATCH (n {uuid: $uuid})
                     RETURN count(n) > 0 as bool, LABELS(n) as labels
-                    """ % uuid)
+                    """, {"uuid": uuid})
 
                     if response[0]["bool"] is True:
                         other_node_instance.__class__.__name__ = response[0]["labels"][0]
@@ -1682,9 +2426,9 @@ class Relationship(BaseNodeAndRelationship):
 
                 if self.start is not None:
                     response = gdbh.r_transaction("""
-                    MATCH (n:%s {uuid:'%s'})
+                    MATCH (n:%s {uuid: $uuid})
                     RETURN count(n) > 0 as bool
-                    """ % (self.start.__name__, uuid))
+                    """ % self.start.__name__, {"uuid": uuid})
 
                     if response[0]["bool"] is True:
                         other_node_instance.__class__.__name__ = self.start.__name__
@@ -1698,9 +2442,9 @@ class Relationship(BaseNodeAndRelationship):
 
                 else:
                     response = gdbh.r_transaction("""
-                    MATCH (n: {uuid:'%s'})
+                    MATCH (n {uuid: $uuid})
                     RETURN count(n) > 0 as bool, LABELS(n) as labels
-                    """ % uuid)
+                    """, {"uuid": uuid})
 
                     if response[0]["bool"] is True:
                         other_node_instance.__class__.__name__ = response[0]["labels"][0]
@@ -1723,8 +2467,8 @@ class Relationship(BaseNodeAndRelationship):
         # Build properties.
         self._constructor(received_properties_dict)
 
-        relationship_cypher_properties = DatabaseNode.format_properties_to_cypher(self.properties_fields,
-                                                                                  self.properties)
+        relationship_properties = DatabaseNode.format_properties_to_parameters(self.properties_fields,
+                                                                               self.properties)
         response = None
 
         if self.direction == "from":
@@ -1732,11 +2476,11 @@ class Relationship(BaseNodeAndRelationship):
             # Apply the 'unique' constraint.
             if self.unique:
                 uniqueness_test_response = gdbh.r_transaction("""
-                           MATCH (n:%s {uuid:'%s'}),
+                           MATCH (n:%s {uuid: $uuid}),
                                  (n)-[r:%s]->()
                            RETURN (r)
-                           """ % (relationship_start_node.__class__.__name__, relationship_start_node.uuid,
-                                  self.rel_type))
+                           """ % (relationship_start_node.__class__.__name__,
+                                  self.rel_type), {"uuid": relationship_start_node.uuid})
 
                 if uniqueness_test_response:
                     bulb_logger.error(
@@ -1745,13 +2489,15 @@ class Relationship(BaseNodeAndRelationship):
                         f"The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique '{self._name}'.")
 
             response = gdbh.w_transaction("""
-                       MATCH (n1:%s {uuid:'%s'}),
-                             (n2:%s {uuid:'%s'})
-                       CREATE (n1)-[r:%s %s]->(n2)
+                       MATCH (n1:%s {uuid: $start_uuid}),
+                             (n2:%s {uuid: $target_uuid})
+                       CREATE (n1)-[r:%s $properties]->(n2)
                        RETURN (r)
-                       """ % (relationship_start_node.__class__.__name__, relationship_start_node.uuid,
-                              relationship_target_node.__class__.__name__, relationship_target_node.uuid,
-                              self.rel_type, relationship_cypher_properties))
+                       """ % (relationship_start_node.__class__.__name__,
+                              relationship_target_node.__class__.__name__,
+                              self.rel_type), {"start_uuid": relationship_start_node.uuid,
+                                               "target_uuid": relationship_target_node.uuid,
+                                               "properties": relationship_properties})
 
             return self.__class__.build_fake_instance(response[0]["r"])
 
@@ -1760,11 +2506,11 @@ class Relationship(BaseNodeAndRelationship):
             # Apply the 'unique' constraint.
             if self.unique:
                 uniqueness_test_response = gdbh.r_transaction("""
-                           MATCH (n:%s {uuid:'%s'}),
+                           MATCH (n:%s {uuid: $uuid}),
                                  ()-[r:%s]->(n)
                            RETURN (r)
-                           """ % (relationship_target_node.__class__.__name__, relationship_target_node.uuid,
-                                  self.rel_type))
+                           """ % (relationship_target_node.__class__.__name__,
+                                  self.rel_type), {"uuid": relationship_target_node.uuid})
 
                 if uniqueness_test_response:
                     bulb_logger.error(
@@ -1773,13 +2519,15 @@ class Relationship(BaseNodeAndRelationship):
                         f"The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique '{self._name}'.")
 
             response = gdbh.w_transaction("""
-                       MATCH (n1:%s {uuid:'%s'}),
-                             (n2:%s {uuid:'%s'})
-                       CREATE (n1)-[r:%s %s]->(n2)
+                       MATCH (n1:%s {uuid: $start_uuid}),
+                             (n2:%s {uuid: $target_uuid})
+                       CREATE (n1)-[r:%s $properties]->(n2)
                        RETURN (r)
-                       """ % (relationship_start_node.__class__.__name__, relationship_start_node.uuid,
-                              relationship_target_node.__class__.__name__, relationship_target_node.uuid,
-                              self.rel_type, relationship_cypher_properties))
+                       """ % (relationship_start_node.__class__.__name__,
+                              relationship_target_node.__class__.__name__,
+                              self.rel_type), {"start_uuid": relationship_start_node.uuid,
+                                               "target_uuid": relationship_target_node.uuid,
+                                               "properties": relationship_properties})
 
             return self.__class__.build_fake_instance(response[0]["r"])
 
@@ -1788,13 +2536,13 @@ class Relationship(BaseNodeAndRelationship):
             # Apply the 'unique' constraint.
             if self.unique:
                 uniqueness_test_response = gdbh.r_transaction("""
-                           MATCH (n:%s {uuid:'%s'}),
+                           MATCH (n:%s {uuid: $uuid}),
                                  (n)-[r_from:%s]->(),
                                  (n)<-[r_to:%s]-()
                            RETURN r_from, r_to
-                           """ % (relationship_start_node.__class__.__name__, relationship_start_node.uuid,
+                           """ % (relationship_start_node.__class__.__name__,
                                   self.rel_type,
-                                  self.rel_type))
+                                  self.rel_type), {"uuid": relationship_start_node.uuid})
 
                 if uniqueness_test_response:
                     bulb_logger.error(
@@ -1805,23 +2553,294 @@ class Relationship(BaseNodeAndRelationship):
             # Note : Both relationships are create from the same datas, but the uuid of the 'to' relationship is
             #        changed to prevent uuid's concept violation.
             response = gdbh.w_transaction("""
-                       MATCH (n1:%s {uuid:'%s'}),
-                             (n2:%s {uuid:'%s'})
-                       CREATE (n1)-[r_from:%s %s]->(n2),
-                              (n1)<-[r_to:%s %s]-(n2)
-                       SET r_to.uuid = '%s'
+                       MATCH (n1:%s {uuid: $start_uuid}),
+                             (n2:%s {uuid: $target_uuid})
+                       CREATE (n1)-[r_from:%s $properties]->(n2),
+                              (n1)<-[r_to:%s $properties]-(n2)
+                       SET r_to.uuid = $to_uuid
                        RETURN r_from, r_to
-                       """ % (relationship_start_node.__class__.__name__, relationship_start_node.uuid,
-                              relationship_target_node.__class__.__name__, relationship_target_node.uuid,
-                              self.rel_type, relationship_cypher_properties,
-                              self.rel_type, relationship_cypher_properties,
-                              make_uuid()))
+                       """ % (relationship_start_node.__class__.__name__,
+                              relationship_target_node.__class__.__name__,
+                              self.rel_type,
+                              self.rel_type), {"start_uuid": relationship_start_node.uuid,
+                                               "target_uuid": relationship_target_node.uuid,
+                                               "properties": relationship_properties,
+                                               "to_uuid": make_uuid()})
 
             return {'rel_from_self': self.__class__.build_fake_instance(response[0]["r_from"]),
                     'rel_to_self': self.__class__.build_fake_instance(response[0]["r_to"])}
 
+    def _get_related_nodes_uuids(self, instances_or_uuids, method_name):
+        """
+        This method collects the uuids of the nodes received by the add_many(), set() and remove_many() methods, once
+        each, and applies the 'start', 'target' and 'auto' constraints to them. The existence of the nodes is checked by
+        the queries of these methods.
+
+        :param instances_or_uuids (required) : A list of node_models' instances and/or of node_models' uuids.
+
+        :param method_name (required) : The name of the calling method (used in the errors messages).
+
+        :return: The list of the uuids.
+        """
+        self_node_instance = self._self_node_instance
+        related_node_model = self.start if self.direction == "to" else self.target
+
+        # The list keeps the order of the uuids, the set finds the duplicates.
+        related_nodes_uuids = []
+        seen_related_nodes_uuids = set()
+
+        for instance_or_uuid in instances_or_uuids:
+            if isinstance(instance_or_uuid, str):
+                related_node_uuid = instance_or_uuid
+
+            elif isinstance(instance_or_uuid, Node):
+                if (inspect.isclass(related_node_model) and related_node_model not in instance_or_uuid.__class__.__mro__
+                        and related_node_model.__name__ != instance_or_uuid.__class__.__name__):
+                    bulb_logger.error(
+                        f'BULBRelationshipError("The \'{self._name}\' relationship only connects \'{self_node_instance.__class__.__name__}\' and \'{related_node_model.__name__}\' instances (or instances of one of their children classes). Not \'{instance_or_uuid.__class__.__name__}\' instances.")')
+                    raise BULBRelationshipError(
+                        f"The '{self._name}' relationship only connects '{self_node_instance.__class__.__name__}' and '{related_node_model.__name__}' instances (or instances of one of their children classes). Not '{instance_or_uuid.__class__.__name__}' instances.")
+
+                related_node_uuid = instance_or_uuid.uuid
+
+            else:
+                bulb_logger.error(
+                    f'BULBRelationshipError("The {method_name}() method of {self.__class__.__name__} instances must take a list of node_models\' instances and/or uuids.")')
+                raise BULBRelationshipError(
+                    f"The {method_name}() method of {self.__class__.__name__} instances must take a list of node_models' instances and/or uuids.")
+
+            if related_node_uuid not in seen_related_nodes_uuids:
+                seen_related_nodes_uuids.add(related_node_uuid)
+                related_nodes_uuids.append(related_node_uuid)
+
+        # Apply the 'auto' constraint.
+        if method_name != "remove_many" and self.auto is False and self_node_instance.uuid in seen_related_nodes_uuids:
+            bulb_logger.error(
+                f'BULBRelationshipError("The parameter \'auto\' of the \'{self._name}\' relationship is True. It says that the same node cannot be the start and the target of a relationship.")')
+            raise BULBRelationshipError(
+                f"The parameter 'auto' of the '{self._name}' relationship is True. It says that the same node cannot be the start and the target of a relationship.")
+
+        return related_nodes_uuids
+
+    def _build_relationships_rows(self, related_nodes_uuids, properties):
+        """
+        This method builds the properties of the relationships created by the add_many() and set() methods : the
+        properties are built once, and each relationship only receives its own uuid.
+
+        :param related_nodes_uuids (required) : The uuids of the nodes to which the relationships will target.
+
+        :param properties (required) : The properties dictionary of the relationships, or None.
+
+        :return: A list of dicts (one per relationship), which contain the uuid of the other node and the properties of the
+                 relationship.
+        """
+        self._constructor(properties if properties is not None else {})
+
+        relationship_properties = DatabaseNode.format_properties_to_parameters(self.properties_fields,
+                                                                               self.properties)
+
+        rows = []
+
+        for related_node_uuid in related_nodes_uuids:
+            row = {"uuid": related_node_uuid,
+                   "properties": dict(relationship_properties, uuid=make_uuid())}
+
+            # Note : Both relationships are create from the same datas, but the uuid of the 'to' relationship is
+            #        changed to prevent uuid's concept violation.
+            if self.direction == "bi":
+                row["to_properties"] = dict(relationship_properties, uuid=make_uuid())
+
+            rows.append(row)
+
+        return rows
+
+    def _get_relationship_patterns(self, relationship_variable, other_node_variable):
+        """
+        This method returns the cypher patterns of the relationship between the self node (named 's') and another node,
+        following the direction of the relationship.
+
+        :param relationship_variable (required) : The name of the relationship variable.
+
+        :param other_node_variable (required) : The name of the other node variable.
+
+        :return: A tuple that contains the pattern which matches the relationship, and the pattern(s) which create it (with
+                 'r_from' and 'r_to' variables if the relationship is bidirectional).
+        """
+        if self.direction == "from":
+            return (f"(s)-[{relationship_variable}:{self.rel_type}]->({other_node_variable})",
+                    f"(s)-[{relationship_variable}:{self.rel_type}]->({other_node_variable})")
+
+        elif self.direction == "to":
+            return (f"(s)<-[{relationship_variable}:{self.rel_type}]-({other_node_variable})",
+                    f"(s)<-[{relationship_variable}:{self.rel_type}]-({other_node_variable})")
+
+        return (f"(s)-[{relationship_variable}:{self.rel_type}]-({other_node_variable})",
+                f"(s)-[r_from:{self.rel_type}]->({other_node_variable}), (s)<-[r_to:{self.rel_type}]-({other_node_variable})")
+
+    def add_many(self, instances_or_uuids, properties=None):
+        """
+        This method handles the creation of the relationships between the self_instance and many other node_models'
+        instances at once : all the relationships are created by a single query (instead of one query per relationship
+        with the add() method). The 'start', 'target', 'auto' and 'unique' constraints are applied like the add() method
+        does, and if one of the other nodes doesn't exist (or doesn't match the 'start' or 'target' constraint), no
+        relationship is created.
+
+        :param instances_or_uuids (required) : A list of node_models' instances and/or of node_models' uuids, to which the
+                                               relationships will target.
+
+        :param properties (optional, default=None): The properties dictionary to fill if the relationships take one or more
+                                                    properties. The same properties are applied to each relationship (but each
+                                                    relationship gets its own uuid).
+
+        :return: A list of RelationshipInstance instances, or a list of dicts of two RelationshipInstance instances if
+                 self.bi (bidirectional relationship) is True.
+        """
+        if self.manage_is_done is False:
+            self._manage_relationship_parameters()
+            self.manage_is_done = True
+
+        self._clear_prefetched_nodes()
+
+        self_node_instance = self._self_node_instance
+        related_nodes_uuids = self._get_related_nodes_uuids(instances_or_uuids, "add_many")
+
+        if not related_nodes_uuids:
+            return []
+
+        # Apply the 'unique' constraint.
+        if self.unique:
+            uniqueness_test_response = None
+
+            if len(related_nodes_uuids) == 1:
+                uniqueness_test_response = gdbh.r_transaction("""
+                MATCH (s:%s {uuid: $uuid}),
+                      %s
+                RETURN (r)
+                LIMIT 1
+                """ % (self_node_instance.__class__.__name__, self._get_relationship_patterns("r", "")[0]),
+                                                              {"uuid": self_node_instance.uuid})
+
+            if len(related_nodes_uuids) > 1 or uniqueness_test_response:
+                bulb_logger.error(
+                    f'BULBUniqueConstraintError("The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique \'{self._name}\'.")')
+                raise BULBUniqueConstraintError(
+                    f"The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique '{self._name}'.")
+
+        rows = self._build_relationships_rows(related_nodes_uuids, properties)
+
+        # Build the create_statement.
+        create_pattern = self._get_relationship_patterns("r", "o")[1]
+
+        if self.direction == "bi":
+            create_statement = (f"CREATE {create_pattern}\n"
+                                f"        SET r_from = row.properties, r_to = row.to_properties\n"
+                                f"        RETURN r_from, r_to")
+
+        else:
+            create_statement = (f"CREATE {create_pattern}\n"
+                                f"        SET r = row.properties\n"
+                                f"        RETURN r")
+
+        # The relationships are only created if all the other nodes are found.
+        related_nodes_labels = self._get_related_nodes_labels(self_node_instance.__class__)
+
+        response = gdbh.w_transaction("""
+        MATCH (s:%s {uuid: $self_uuid})
+        UNWIND $rows AS row
+        OPTIONAL MATCH (o%s {uuid: row.uuid})
+        WITH s, collect({row: row, node: o}) AS pairs
+        WHERE all(pair IN pairs WHERE pair.node IS NOT NULL)
+        UNWIND pairs AS pair
+        WITH s, pair.row AS row, pair.node AS o
+        %s
+        """ % (self_node_instance.__class__.__name__, related_nodes_labels, create_statement),
+                                      {"self_uuid": self_node_instance.uuid, "rows": rows})
+
+        if not response:
+            bulb_logger.error(
+                f'BULBRelationshipError("The add_many() method of the \'{self._name}\' relationship has received uuids of nodes that do not exist or that the relationship cannot connect. No relationship has been created.")')
+            raise BULBRelationshipError(
+                f"The add_many() method of the '{self._name}' relationship has received uuids of nodes that do not exist or that the relationship cannot connect. No relationship has been created.")
+
+        if self.direction == "bi":
+            return [{'rel_from_self': self.__class__.build_fake_instance(record["r_from"]),
+                     'rel_to_self': self.__class__.build_fake_instance(record["r_to"])} for record in response]
+
+        return [self.__class__.build_fake_instance(record["r"]) for record in response]
+
+    def set(self, instances_or_uuids, properties=None):
+        """
+        This method replaces the relationships of the self_instance by relationships to the given node_models' instances :
+        the relationships to the other nodes are removed, and the missing relationships are created. The difference is
+        computed by the database, and all the changes are done by a single query. The 'start', 'target', 'auto' and
+        'unique' constraints are applied, and if one of the given nodes doesn't exist (or doesn't match the 'start' or
+        'target' constraint), nothing is changed.
+
+        :param instances_or_uuids (required) : A list of node_models' instances and/or of node_models' uuids, to which the
+                                               relationships will target. An empty list removes all the relationships.
+
+        :param properties (optional, default=None): The properties dictionary to fill if the created relationships take one or
+                                                    more properties. The existing relationships are kept as they are.
+        """
+        if self.manage_is_done is False:
+            self._manage_relationship_parameters()
+            self.manage_is_done = True
+
+        self._clear_prefetched_nodes()
+
+        self_node_instance = self._self_node_instance
+        related_nodes_uuids = self._get_related_nodes_uuids(instances_or_uuids, "set")
+
+        # Apply the 'unique' constraint.
+        if self.unique and len(related_nodes_uuids) > 1:
+            bulb_logger.error(
+                f'BULBUniqueConstraintError("The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique \'{self._name}\'.")')
+            raise BULBUniqueConstraintError(
+                f"The {self.__class__.__name__} instances must be UNIQUE : {self_node_instance.__class__.__name__} instances must have an unique '{self._name}'.")
+
+        rows = self._build_relationships_rows(related_nodes_uuids, properties)
+
+        match_pattern = self._get_relationship_patterns("old_r", "old")[0]
+        existence_pattern = self._get_relationship_patterns("", "n")[0]
+        create_pattern = self._get_relationship_patterns("r", "o")[1]
+
+        if self.direction == "bi":
+            set_statement = "SET r_from = row.properties, r_to = row.to_properties"
+
+        else:
+            set_statement = "SET r = row.properties"
+
+        # Note : The WHERE clause stops the query (so nothing is changed) if one of the nodes is not found.
+        response = gdbh.w_transaction("""
+        MATCH (s:%s {uuid: $self_uuid})
+        OPTIONAL MATCH (o%s)
+        WHERE o.uuid IN $uuids
+        WITH s, collect(o) AS nodes
+        WHERE size(nodes) = size($uuids)
+        OPTIONAL MATCH %s
+        WHERE NOT old.uuid IN $uuids
+        WITH s, nodes, collect(old_r) AS old_relationships
+        FOREACH (old_r IN old_relationships | DELETE old_r)
+        FOREACH (row IN $rows |
+            FOREACH (o IN [n IN nodes WHERE n.uuid = row.uuid AND NOT %s] |
+                CREATE %s
+                %s))
+        RETURN size(old_relationships) AS removed
+        """ % (self_node_instance.__class__.__name__,
+               self._get_related_nodes_labels(self_node_instance.__class__),
+               match_pattern,
+               existence_pattern,
+               create_pattern,
+               set_statement), {"self_uuid": self_node_instance.uuid, "uuids": related_nodes_uuids, "rows": rows})
+
+        if not response:
+            bulb_logger.error(
+                f'BULBRelationshipError("The set() method of the \'{self._name}\' relationship has received uuids of nodes that do not exist or that the relationship cannot connect. No relationship has been changed.")')
+            raise BULBRelationshipError(
+                f"The set() method of the '{self._name}' relationship has received uuids of nodes that do not exist or that the relationship cannot connect. No relationship has been changed.")
+
     def get(self, direction="bi", returned="node", order_by=None, limit=None,  skip=None, desc=False, distinct=False,
-            only=None, filter=None, return_query=False):
+            only=None, filter=None, return_query=False, iterator=False, chunk_size=1000):
         """
         This method allow the retrieving of node_models' instances' relationships but also of the other node_models'
         instances on the other ends of these relationships.
@@ -1870,7 +2889,15 @@ class Relationship(BaseNodeAndRelationship):
         :param filter (optional, default=None) : Must be Q statement. You must use the Q class stored in bulb.db
                                                  Example: Q(name__contains="al") | Q(age__year__lte=8)
 
-        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return the cypher query.
+        :param return_query (optional, default=False) : Must be a boolean. If true, the method will return a tuple that contains
+                                                        the cypher query and its parameters dictionary.
+
+        :param iterator (optional, default=False) : Must be a boolean. If it is True, the method will return a generator which
+                                                    yields the elements one by one, as they are received from the database,
+                                                    instead of a list.
+
+        :param chunk_size (optional, default=1000) : Must be an integer. With 'iterator', the number of records fetched by each
+                                                     network round trip (see gdbh.stream()).
 
         :return: (see :param returned)
         """
@@ -1878,9 +2905,19 @@ class Relationship(BaseNodeAndRelationship):
             self._manage_relationship_parameters()
             self.manage_is_done = True
 
-        request_required_values_list = []
         self_node_instance = self._self_node_instance
 
+        # Return the prefetched nodes (see Node.prefetch_relationships()) if the default parameters are used.
+        prefetched_relationships = self_node_instance.__dict__.get("_prefetched_relationships")
+
+        if prefetched_relationships is not None and self._name in prefetched_relationships:
+            if (direction == "bi" and returned == "node" and order_by is None and limit is None and skip is None
+                    and desc is False and distinct is False and only is None and filter is None and return_query is False
+                    and iterator is False):
+                return list(prefetched_relationships[self._name]) or None
+
+        query_parameters = {"uuid": self_node_instance.uuid}
+
         match_statement = None
         where_statement = ""
         with_statement = None
@@ -1911,49 +2948,49 @@ class Relationship(BaseNodeAndRelationship):
 
             if self.direction == "from" or self.direction == "bi":
                 if self.target:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]->" + "(n%s)" % target_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]->" + "(n%s)" % target_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]->(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]->(n)"
 
             elif self.direction == "to":
                 if self.start:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]->" + "(n%s)" % start_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]->" + "(n%s)" % start_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]->(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]->(n)"
 
         elif direction == "to":
 
             if self.direction == "from" or self.direction == "bi":
                 if self.target:
-                    match_statement = "MATCH (:%s {uuid:'%s'})<-[r:%s]-" + "(n%s)" % target_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})<-[r:%s]-" + "(n%s)" % target_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})<-[r:%s]-(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})<-[r:%s]-(n)"
 
             elif self.direction == "to":
                 if self.start:
-                    match_statement = "MATCH (:%s {uuid:'%s'})<-[r:%s]-" + "(n%s)" % start_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})<-[r:%s]-" + "(n%s)" % start_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})<-[r:%s]-(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})<-[r:%s]-(n)"
 
         elif direction == "bi":
 
             if self.direction == "from" or self.direction == "bi":
                 if self.target:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]-" + "(n%s)" % target_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]-" + "(n%s)" % target_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]-(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]-(n)"
 
             elif self.direction == "to":
                 if self.start:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]-" + "(n%s)" % start_labels
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]-" + "(n%s)" % start_labels
 
                 else:
-                    match_statement = "MATCH (:%s {uuid:'%s'})-[r:%s]-(n)"
+                    match_statement = "MATCH (:%s {uuid: $uuid})-[r:%s]-(n)"
 
         else:
             bulb_logger.error(
@@ -1962,7 +2999,20 @@ class Relationship(BaseNodeAndRelationship):
                 f"The 'direction' argument of the get() method of a {self.__class__.__name__} instance, must be 'from', 'to', or 'bi'.")
 
         # Build the where statement.
-        if filter is not None:
+        if isinstance(filter, Q):
+            related_node_model = self.start if self.direction == "to" else self.target
+
+            if related_node_model == "self":
+                related_node_model = self_node_instance.__class__
+
+            # Only the nodes can be filtered by lookups which traverse relationships.
+            if returned == "rel" or not inspect.isclass(related_node_model):
+                related_node_model = None
+
+            where_statement = "WHERE " + filter.compile("r" if returned == "rel" else "n", query_parameters,
+                                                        related_node_model)[0]
+
+        elif filter is not None:
             where_statement = "WHERE " + filter
 
             if returned == "rel":
@@ -2040,7 +3090,7 @@ class Relationship(BaseNodeAndRelationship):
                     raise BULBRelationshipError(
                         f"The 'order_by' argument of the get() method of a {self.__class__.__name__} instance, must start by 'r.' or 'n.' when the 'returned' argument is 'both'.")
 
-                order_by_statement = "ORDER BY %s"
+                order_by_statement = f"ORDER BY {order_by}"
 
             if not only:
                 return_statement_list.append("[r, n]")
@@ -2059,23 +3109,17 @@ class Relationship(BaseNodeAndRelationship):
         return_statement = " ".join(return_statement_list)
 
         # Add match_statement required variables.
-        request_required_values_list.extend((self_node_instance.__class__.__name__,
-                                             self_node_instance.uuid,
-                                             self.rel_type))
-
-        # Add order_by_statement required variable.
-        # if order_by is not None:
-        #     request_required_values_list.append(order_by)
+        match_statement = match_statement % (self_node_instance.__class__.__name__, self.rel_type)
 
         # Build skip_statement and add its required variable.
         if skip is not None:
-            skip_statement = "SKIP %s"
-            request_required_values_list.append(skip)
+            skip_statement = "SKIP $skip"
+            query_parameters["skip"] = int(skip)
 
         # Build limit_statement and add its required variable.
         if limit is not None:
-            limit_statement = "LIMIT %s"
-            request_required_values_list.append(limit)
+            limit_statement = "LIMIT $limit"
+            query_parameters["limit"] = int(limit)
 
         # Build desc_statement.
         if desc is True:
@@ -2101,90 +3145,19 @@ class Relationship(BaseNodeAndRelationship):
                return_statement)
 
         if return_query is False:
-            response = gdbh.r_transaction(request_statement % tuple(request_required_values_list))
+
+            if iterator:
+                return self._iterate_database_objects(request_statement, query_parameters, returned, only, chunk_size)
+
+            response = gdbh.r_transaction(request_statement, query_parameters)
 
             if response:
                 if only is None:
 
-                    node_models_list = []
                     fake_instance_list = []
 
                     for database_object in response:
-                        rel_object = None
-                        node_object = None
-
-                        if returned == "rel":
-                            rel_object = database_object["r"]
-
-                        elif returned == "node":
-                            node_object = database_object["n"]
-
-                        elif returned == "both":
-                            rel_object = database_object["[r, n]"][0]
-                            node_object = database_object["[r, n]"][1]
-
-                        def render_nodes_and_relationships(node_model=None):
-                            if returned == "rel":
-                                fake_instance_list.append(self.__class__.build_fake_instance(rel_object,
-                                                                                             forced_fake_instance_class=RelationshipInstance,
-                                                                                             additional_parameters={
-                                                                                                 "related_relationship": self}))
-                            elif returned == "node":
-                                fake_instance_list.append(self.__class__.build_fake_instance(node_object,
-                                                                                             forced_fake_instance_class=node_model))
-
-                            elif returned == "both":
-                                fake_instance_list.append({"rel": self.__class__.build_fake_instance(rel_object,
-                                                                                                     forced_fake_instance_class=RelationshipInstance,
-                                                                                                     additional_parameters={
-                                                                                                         "related_relationship": self}),
-                                                           "node": self.__class__.build_fake_instance(node_object,
-                                                                                                      forced_fake_instance_class=node_model)})
-
-                        if self.start == "self" and self.target == "self":
-                            render_nodes_and_relationships(self._self_node_instance.__class__)
-
-                        else:
-                            if not node_models_list:
-                                # Collect all the node models.
-                                node_models_list = get_all_node_models()
-
-                            related_node_model_class_was_found = False
-                            render_is_done = False
-
-                            for node_model in node_models_list:
-
-                                if self.direction == "from" or self.direction == "bi":
-                                    if self.target is not None:
-                                        if compare_different_modules_classes(self.target, node_model):
-                                            render_nodes_and_relationships(node_model)
-                                            related_node_model_class_was_found = True
-                                            render_is_done = True
-
-                                elif self.direction == "to":
-                                    if self.start is not None:
-                                        if compare_different_modules_classes(self.start, node_model):
-                                            render_nodes_and_relationships(node_model)
-                                            related_node_model_class_was_found = True
-                                            render_is_done = True
-
-                            # Handle case where no "start" and/or "target" constraints are applied to the relationship.
-                            if render_is_done is False:
-                                if returned == "rel":
-                                    render_nodes_and_relationships()
-                                    related_node_model_class_was_found = True
-
-                                elif returned == "node" or returned == "both":
-                                    for node_model in node_models_list:
-                                        if node_model.__name__ in node_object.labels:
-                                            render_nodes_and_relationships(node_model)
-                                            related_node_model_class_was_found = True
-
-                            if related_node_model_class_was_found is False:
-                                bulb_logger.error(
-                                    f'BULBRelationshipError("The node retrieved with the get() method of a {self.__class__.__name__} instance, matches with no one node_model of the project.")')
-                                raise BULBRelationshipError(
-                                    f"The node retrieved with the get() method of a {self.__class__.__name__} instance, matches with no one node_model of the project.")
+                        fake_instance_list.extend(self._build_fake_instances_from_database_object(database_object, returned))
 
                     return fake_instance_list
 
@@ -2194,28 +3167,167 @@ class Relationship(BaseNodeAndRelationship):
                 return None
 
         else:
-            return request_statement % tuple(request_required_values_list)
+            return request_statement, query_parameters
+
+    def _get_related_nodes_labels(self, node_model):
+        """
+        This method returns the cypher label of the nodes at the other end of the relationship (following the 'start' or
+        'target' constraint), or an empty string if there is no constraint.
+
+        :param node_model (required) : The node_model which owns the relationship.
+        """
+        related_node_model = self.start if self.direction == "to" else self.target
+
+        if related_node_model == "self":
+            return ":" + node_model.__name__
+
+        elif inspect.isclass(related_node_model):
+            return ":" + related_node_model.__name__
+
+        elif isinstance(related_node_model, str):
+            return ":" + related_node_model
+
+        return ""
+
+    def _clear_prefetched_nodes(self):
+        """
+        This method forgets the nodes prefetched for the relationship of the bound instance (see
+        Node.prefetch_relationships()).
+        """
+        if self._self_node_instance is not None:
+            self._self_node_instance.__dict__.get("_prefetched_relationships", {}).pop(self._name, None)
+
+    def _get_relationships_sftp_files_paths(self, node_model, uuids):
+        """
+        This method collects the paths of the files stored by the 'sftp' properties of the relationships of nodes (see
+        Node.delete()). The database is only queried if the relationship has 'sftp' properties.
+
+        :param node_model (required) : The node_model of the nodes.
+
+        :param uuids (required) : The uuids of the nodes.
+
+        :return: The list of the paths of the files.
+        """
+        properties_fields = self._get_relationship_property_fields()
+
+        if settings.DEBUG is not False or not any(field.sftp for field in properties_fields.values()):
+            return []
+
+        response = gdbh.r_transaction("""
+        UNWIND $uuids AS uuid
+        MATCH (:%s {uuid: uuid})-[r:%s]-()
+        RETURN DISTINCT r
+        """ % (node_model.__name__, self.rel_type), {"uuids": uuids})
+
+        files_paths = []
+
+        for rel_object in response:
+            files_paths.extend(self._get_sftp_files_paths(properties_fields, rel_object["r"]._properties))
+
+        return files_paths
+
+    def _build_fake_instances_from_database_object(self, database_object, returned):
+        """
+        This method builds the elements returned by the get() method (see its 'returned' parameter) from a record of the
+        response of the database.
+
+        :param database_object (required) : A record of the response of the database, as a dict.
+
+        :param returned (required) : The 'returned' parameter of the get() method.
+
+        :return: The list of the built elements.
+        """
+        fake_instance_list = []
+
+        rel_object = None
+        node_object = None
+
+        if returned == "rel":
+            rel_object = database_object["r"]
+
+        elif returned == "node":
+            node_object = database_object["n"]
+
+        elif returned == "both":
+            rel_object = database_object["[r, n]"][0]
+            node_object = database_object["[r, n]"][1]
+
+        def render_nodes_and_relationships(node_model=None):
+            if returned == "rel":
+                fake_instance_list.append(self.__class__.build_fake_instance(rel_object,
+                                                                             forced_fake_instance_class=RelationshipInstance,
+                                                                             additional_parameters={
+                                                                                 "related_relationship": self}))
+            elif returned == "node":
+                fake_instance_list.append(self.__class__.build_fake_instance(node_object,
+                                                                             forced_fake_instance_class=node_model))
+
+            elif returned == "both":
+                fake_instance_list.append({"rel": self.__class__.build_fake_instance(rel_object,
+                                                                                     forced_fake_instance_class=RelationshipInstance,
+                                                                                     additional_parameters={
+                                                                                         "related_relationship": self}),
+                                           "node": self.__class__.build_fake_instance(node_object,
+                                                                                      forced_fake_instance_class=node_model)})
+
+        if self.start == "self" and self.target == "self":
+            render_nodes_and_relationships(self._self_node_instance.__class__)
+
+        elif returned == "rel":
+            render_nodes_and_relationships()
+
+        else:
+            # Find the most specific node_model of the node from its labels (see bulb.db.registry).
+            node_model = node_models_registry.get_node_model_from_labels(node_object.labels)
+
+            # Handle case where the node_model of the "start" or "target" constraint is not registered.
+            if node_model is None:
+                related_node_model = self.start if self.direction == "to" else self.target
+
+                if isinstance(related_node_model, type):
+                    node_model = related_node_model
+
+            if node_model is None:
+                bulb_logger.error(
+                    f'BULBRelationshipError("The node retrieved with the get() method of a {self.__class__.__name__} instance, matches with no one node_model of the project.")')
+                raise BULBRelationshipError(
+                    f"The node retrieved with the get() method of a {self.__class__.__name__} instance, matches with no one node_model of the project.")
+
+            render_nodes_and_relationships(node_model)
+
+        return fake_instance_list
+
+    def _iterate_database_objects(self, request_statement, query_parameters, returned, only, chunk_size):
+        """
+        This method streams the response of the get() method and yields its elements one by one.
+        """
+        for database_object in gdbh.stream(request_statement, query_parameters, fetch_size=chunk_size):
+            if only is not None:
+                yield database_object
+
+            else:
+                yield from self._build_fake_instances_from_database_object(database_object, returned)
 
     def count(self, direction="bi", returned="node", order_by=None, limit=None, skip=None, desc=False,
               distinct=False, only=None, filter=None, **extrafields):
 
-        request_statement = self.get(direction=direction, returned=returned, order_by=order_by, limit=limit, skip=skip,
-                                    desc=desc, distinct=distinct, only=only, filter=filter, return_query=True,
-                                    **extrafields)
+        request_statement, request_parameters = self.get(direction=direction, returned=returned, order_by=order_by,
+                                                         limit=limit, skip=skip, desc=desc, distinct=distinct, only=only,
+                                                         filter=filter, return_query=True, **extrafields)
 
         returned_object = None
 
         if returned == "rel":
-            returned_object = ["r"]
+            returned_object = "r"
 
         elif returned == "node":
-            returned_object = ["n"]
+            returned_object = "n"
 
         elif returned == "both":
-            returned_object = ["[r, n]"]
+            returned_object = "[r, n]"
 
         request_count_statement = request_statement.split("RETURN")[0] + f"RETURN COUNT({returned_object})"
-        response = gdbh.r_transaction(request_count_statement)
+        response = gdbh.r_transaction(request_count_statement, request_parameters)
 
         return response[0][f"COUNT({returned_object})"]
 
@@ -2224,19 +3336,17 @@ class Relationship(BaseNodeAndRelationship):
             self._manage_relationship_parameters()
             self.manage_is_done = True
 
+        self._clear_prefetched_nodes()
+
         if instance is not None:
-            gdbh.w_transaction("""
-            MATCH (:%s {uuid:'%s'})-[r:%s {uuid:'%s'}]-({uuid:'%s'})
-            DETACH DELETE (r)
-            """ % (
-                self._self_node_instance.__class__.__name__, self._self_node_instance.uuid, self.rel_type, self.uuid, instance.uuid))
+            uuid = instance.uuid
 
-        elif uuid is not None:
-            response = gdbh.w_transaction("""
-            MATCH (:%s {uuid:'%s'})-[r:%s]-({uuid:'%s'})
+        if uuid is not None:
+            gdbh.w_transaction("""
+            MATCH (:%s {uuid: $self_uuid})-[r:%s]-({uuid: $uuid})
             DETACH DELETE (r)
-            """ % (
-                self._self_node_instance.__class__.__name__, self._self_node_instance.uuid, self.rel_type, uuid))
+            """ % (self._self_node_instance.__class__.__name__, self.rel_type),
+                               {"self_uuid": self._self_node_instance.uuid, "uuid": uuid})
 
         else:
             bulb_logger.error(
@@ -2244,6 +3354,29 @@ class Relationship(BaseNodeAndRelationship):
             raise BULBRelationshipError(
                 f"The remove() method of {self.__class__.__name__} instances must have as parameter either a node_model instance, or an 'uuid'.")
 
+    def remove_many(self, instances_or_uuids):
+        """
+        This method removes the relationships between the self_instance and many other node_models' instances at once,
+        with a single query (instead of one query per relationship with the remove() method).
+
+        :param instances_or_uuids (required) : A list of node_models' instances and/or of node_models' uuids.
+        """
+        if self.manage_is_done is False:
+            self._manage_relationship_parameters()
+            self.manage_is_done = True
+
+        self._clear_prefetched_nodes()
+
+        related_nodes_uuids = self._get_related_nodes_uuids(instances_or_uuids, "remove_many")
+
+        if related_nodes_uuids:
+            gdbh.w_transaction("""
+            MATCH (s:%s {uuid: $self_uuid})-[r:%s]-(n)
+            WHERE n.uuid IN $uuids
+            DELETE r
+            """ % (self._self_node_instance.__class__.__name__, self.rel_type),
+                               {"self_uuid": self._self_node_instance.uuid, "uuids": related_nodes_uuids})
+
 
 class RelationshipInstance:
     """
@@ -2258,7 +3391,7 @@ class RelationshipInstance:
 
     def update(self, property_name, new_property_value):
         class_name = self.__class__.__name__
-        properties_fields = self.related_relationship.__dict__["properties_fields"]
+        properties_fields = self.related_relationship._get_relationship_property_fields()
 
         if not settings.BULB_CREATE_PROPERTY_IF_NOT_FOUND and property_name not in properties_fields.keys():
             bulb_logger.warning(
@@ -2270,17 +3403,15 @@ class RelationshipInstance:
         else:
 
             cypher_relation_type = ":" + self.rel_type
-            cypher_properties_dict = "{uuid: '%s'}" % self.uuid
 
             # Create property if it not exists.
             if property_name not in self.__dict__.keys():
                 try:
                     gdbh.w_transaction("""
-                    MATCH ()-[r%s %s]->()
-                    CALL apoc.create.setRelProperty(r, "%s", "%s") YIELD rel
+                    MATCH ()-[r%s {uuid: $uuid}]->()
+                    CALL apoc.create.setRelProperty(r, $property_name, $value) YIELD rel
                     RETURN (r)
-                    """ % (cypher_relation_type, cypher_properties_dict,
-                           property_name, None))
+                    """ % cypher_relation_type, {"uuid": self.uuid, "property_name": property_name, "value": "None"})
 
                 except:
                     bulb_logger.warning(
@@ -2298,12 +3429,12 @@ class RelationshipInstance:
                     if new_property_value == "None":
 
                         gdbh.w_transaction("""
-                        MATCH ()-[r%s %s]->()
+                        MATCH ()-[r%s {uuid: $uuid}]->()
                         WHERE exists(r.%s)
-                        SET r.%s = '%s'
-                        """ % (cypher_relation_type, cypher_properties_dict,
+                        SET r.%s = $value
+                        """ % (cypher_relation_type,
                                property_name,
-                               property_name, None))
+                               property_name), {"uuid": self.uuid, "value": "None"})
 
                     else:
                         bulb_logger.error(
@@ -2387,84 +3518,31 @@ class RelationshipInstance:
                     full_stored_file_path = "/".join(full_stored_file_path_list)
 
                     gdbh.w_transaction("""
-                    MATCH ()-[r%s %s]->()
+                    MATCH ()-[r%s {uuid: $uuid}]->()
                     WHERE exists(r.%s)
-                    SET r.%s = '%s'
-                    """ % (cypher_relation_type, cypher_properties_dict,
+                    SET r.%s = $value
+                    """ % (cypher_relation_type,
                            property_name,
-                           property_name, full_stored_file_path))
+                           property_name), {"uuid": self.uuid, "value": full_stored_file_path})
                     new_property_value = full_stored_file_path
 
-            # Integer, float, boolean and list handling.
-            elif isinstance(new_property_value, int) or isinstance(new_property_value, float) or isinstance(new_property_value, bool) or isinstance(new_property_value, list):
-                gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
-                WHERE exists(r.%s)
-                SET r.%s = %s
-                """ % (cypher_relation_type, cypher_properties_dict,
-                       property_name,
-                       property_name, new_property_value))
-
-            # Datetime handling
-            elif isinstance(new_property_value, datetime.datetime):
-                gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
-                WHERE exists(r.%s)
-                SET r.%s = datetime("%s")
-                """ % (cypher_relation_type, cypher_properties_dict,
-                       property_name,
-                       property_name, str(new_property_value).replace(" ", "T")))
-
-            # Date handling
-            elif isinstance(new_property_value, datetime.date):
-                gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
-                WHERE exists(r.%s)
-                SET r.%s = date("%s")
-                """ % (cypher_relation_type, cypher_properties_dict,
-                       property_name,
-                       property_name, str(new_property_value)))
-
-            # Time handling.
-            elif isinstance(new_property_value, datetime.time):
-                gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
-                WHERE exists(r.%s)
-                SET r.%s = time("%s")
-                """ % (cypher_relation_type, cypher_properties_dict,
-                       property_name,
-                       property_name, str(new_property_value)))
-
-            # String handling
-            elif isinstance(new_property_value, str):
-                # Escape quotes to prevent cypher syntax errors.
-                new_property_value = new_property_value.replace('"', '\\"').replace("'", "\\'")
-
-                gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
-                WHERE exists(r.%s)
-                SET r.%s = "%s"
-                """ % (cypher_relation_type, cypher_properties_dict,
-                       property_name,
-                       property_name, new_property_value))
-
-            # Other
+            # Other values handling (integers, floats, booleans, lists, datetimes, dates, times, strings, etc...).
             else:
                 gdbh.w_transaction("""
-                MATCH ()-[r%s %s]->()
+                MATCH ()-[r%s {uuid: $uuid}]->()
                 WHERE exists(r.%s)
-                SET r.%s = '%s'
-                """ % (cypher_relation_type, cypher_properties_dict,
+                SET r.%s = $value
+                """ % (cypher_relation_type,
                        property_name,
-                       property_name, new_property_value))
+                       property_name), {"uuid": self.uuid,
+                                        "value": format_value_to_parameter(new_property_value)})
 
             setattr(self, property_name, new_property_value)
 
     def delete(self):
         cypher_relation_type = ":" + self.rel_type
-        cypher_properties_dict = "{uuid: '%s'}" % self.uuid
 
         gdbh.w_transaction("""
-        MATCH ()-[r%s %s]->()
+        MATCH ()-[r%s {uuid: $uuid}]->()
         DETACH DELETE (r)
-        """ % (cypher_relation_type, cypher_properties_dict))
+        """ % cypher_relation_type, {"uuid": self.uuid})
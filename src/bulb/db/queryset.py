@@ -0,0 +1,706 @@
+from bulb.db.exceptions import BULBQuerySetError
+from bulb.db.utils import format_value_to_parameter
+from bulb.db.aggregates import Aggregate
+from bulb.db.Q_filter import Q
+from bulb.db.base import gdbh
+from bulb.utils.log import bulb_logger
+
+
+class QuerySet:
+    """
+    A lazy and chainable query on the nodes of a node_model. Each chaining method returns a new QuerySet, and the database
+    is only queried when the QuerySet is iterated, sliced with an integer, measured with len(), or when one of the exists(),
+    first(), count() or aggregate() methods is called.
+
+    The QuerySet is compiled once into a parameterized Cypher query (see compile()), and its results are cached after the
+    first evaluation.
+
+    Examples :
+        User.objects.filter(is_active_user=True).order_by("-last_name").limit(10)
+        Session.objects.filter(session_key=session_key).exists()
+        Product.objects.values("category").annotate(products_count=Count(), total=Sum("price"))
+
+    :param node_model (required) : The node_model class (Node or one of its children classes) targeted by the query.
+    """
+
+    def __init__(self, node_model):
+        self.node_model = node_model
+
+        self._properties = {}
+        self._conditions = []
+        self._order_by = []
+        self._skip = None
+        self._limit = None
+        self._only = None
+        self._distinct = False
+        self._prefetch = ()
+        self._after = None
+        self._values = None
+        self._annotations = {}
+
+        self._compiled_query = None
+        self._result_cache = None
+
+    def __repr__(self):
+        return f"<QuerySet of {self.node_model.__name__}>"
+
+    def _clone(self):
+        """
+        This method returns a new unevaluated QuerySet with the same statements as the current one.
+        """
+        clone = self.__class__(self.node_model)
+        clone._properties = self._properties.copy()
+        clone._conditions = self._conditions[:]
+        clone._order_by = self._order_by[:]
+        clone._skip = self._skip
+        clone._limit = self._limit
+        clone._only = self._only
+        clone._distinct = self._distinct
+        clone._prefetch = self._prefetch
+        clone._after = self._after
+        clone._values = self._values
+        clone._annotations = self._annotations.copy()
+
+        return clone
+
+    ############
+    # CHAINING #
+    ############
+
+    def filter(self, *q_statements, **lookups):
+        """
+        This method returns a new QuerySet filtered with the Q statements and/or the lookups.
+
+        :param q_statements (optional) : Q statements. You must use the Q class stored in bulb.db
+                                         Example: Q(name__contains="al") | Q(age__year__lte=8)
+                                         Raw Cypher conditions (strings or Qstr instances) are also accepted.
+
+        :param lookups (optional) : Lookups of the form property_name=value (matched with a parameter in the MATCH pattern), or
+                                    property_name__action=value (compiled with a Q statement).
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+
+        for q_statement in q_statements:
+            if q_statement:
+                if isinstance(q_statement, str) and q_statement[0:6] == "WHERE ":
+                    q_statement = q_statement[6:]
+
+                clone._conditions.append(q_statement)
+
+        lookups_q_statement = Q(**{lookup: value for lookup, value in lookups.items() if "__" in lookup})
+
+        if lookups_q_statement:
+            clone._conditions.append(lookups_q_statement)
+
+        for lookup, value in lookups.items():
+            if "__" not in lookup:
+                clone._properties[lookup] = value
+
+        return clone
+
+    def order_by(self, *properties):
+        """
+        This method returns a new QuerySet sorted with the given properties.
+
+        :param properties (required) : The names of the properties with which the returned datas will be sorted. Prefix a name
+                                       with '-' to sort in a descending order.
+                                       Examples : "datetime", "-first_name", etc...
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+
+        for property_name in properties:
+            if property_name[0:1] == "-":
+                clone._order_by.append((property_name[1:], True))
+
+            else:
+                clone._order_by.append((property_name, False))
+
+        return clone
+
+    def skip(self, skip):
+        """
+        This method returns a new QuerySet which skips the 'skip' first elements.
+
+        :param skip (required) : Must be an integer.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._skip = self._check_integer("skip", skip)
+
+        return clone
+
+    def limit(self, limit):
+        """
+        This method returns a new QuerySet which returns at most 'limit' elements.
+
+        :param limit (required) : Must be an integer.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._limit = self._check_integer("limit", limit)
+
+        return clone
+
+    def only(self, *fields_names):
+        """
+        This method returns a new QuerySet which returns dicts with "only" the mentioned fields instead of node_model
+        instances.
+
+        :param fields_names (required) : The names of the fields to return.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._only = list(fields_names)
+
+        return clone
+
+    def distinct(self):
+        """
+        This method returns a new QuerySet which returns only unique elements.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._distinct = True
+
+        return clone
+
+    def prefetch(self, *relationships_names):
+        """
+        This method returns a new QuerySet which loads the nodes related to the returned instances by the given
+        relationships, with a single query per relationship (see Node.prefetch_relationships()).
+
+        :param relationships_names (required) : The names of the relationships of the node_model.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._prefetch = self._prefetch + tuple(relationships_names)
+
+        return clone
+
+    def after(self, cursor):
+        """
+        This method returns a new QuerySet which only returns the elements placed after the 'cursor' element, following the
+        order of the QuerySet (keyset pagination). Unlike skip(), the previous elements are not read and discarded by the
+        database, so each page is returned as fast as the first one, with an index on the ordering properties.
+        The uuid is added as a last ordering property, so the elements which have the same values are not skipped.
+        The nodes whose ordering properties are missing (null) are placed like the database sorts them : after the other
+        nodes in an ascending order, and before them in a descending order.
+
+        Example :
+            page = Article.objects.order_by("-publication_datetime").limit(20)
+            next_page = page.after(list(page)[-1])
+
+        :param cursor (required) : The last element of the previous page : a node_model instance, or a tuple of the values of
+                                   its ordering properties followed by its uuid (or only its uuid if the QuerySet is not
+                                   ordered).
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._after = cursor
+
+        return clone
+
+    def values(self, *fields_names):
+        """
+        This method returns a new QuerySet which returns dicts with the values of the mentioned fields instead of node_model
+        instances. Combined with annotate(), the nodes are grouped by these values.
+
+        :param fields_names (required) : The names of the fields to return.
+
+        :return: A new QuerySet.
+        """
+        clone = self._clone()
+        clone._values = list(fields_names)
+
+        return clone
+
+    def annotate(self, **aggregates):
+        """
+        This method returns a new QuerySet which returns dicts with the results of the aggregates (see bulb.db.aggregates)
+        computed by the database, for each group of nodes which have the same values() (or for all the nodes if values()
+        was not used). Then, order_by() sorts the returned dicts by the names of the values and of the aggregates.
+
+        Example :
+            Product.objects.values("category").annotate(products_count=Count()).order_by("-products_count")
+            >>> [{"category": "books", "products_count": 12}, {"category": "games", "products_count": 3}]
+
+        :param aggregates (required) : The aggregates (Count, Sum, Avg, Min or Max instances), named by the keys of the
+                                       returned dicts.
+
+        :return: A new QuerySet.
+        """
+        self._check_aggregates(aggregates)
+
+        clone = self._clone()
+        clone._annotations.update(aggregates)
+
+        return clone
+
+    def _check_aggregates(self, aggregates):
+        for aggregate_name, aggregate in aggregates.items():
+            if not isinstance(aggregate, Aggregate):
+                bulb_logger.error(
+                    f'BULBQuerySetError("The \'{aggregate_name}\' aggregate of a QuerySet of {self.node_model.__name__} must be an instance of Count, Sum, Avg, Min or Max (see bulb.db.aggregates).")')
+                raise BULBQuerySetError(
+                    f"The '{aggregate_name}' aggregate of a QuerySet of {self.node_model.__name__} must be an instance of Count, Sum, Avg, Min or Max (see bulb.db.aggregates).")
+
+    def _is_grouped(self):
+        """
+        This method returns True if the QuerySet returns values() or annotate() dicts instead of nodes.
+        """
+        return self._values is not None or bool(self._annotations)
+
+    def _get_ordering(self):
+        """
+        This method returns the ordering of the QuerySet : a list of (property_name, is_desc) tuples. If after() was used,
+        the uuid is added as a last ordering property.
+        """
+        if self._after is not None and (not self._order_by or self._order_by[-1][0] != "uuid"):
+            return self._order_by + [("uuid", self._order_by[-1][1] if self._order_by else False)]
+
+        return self._order_by
+
+    def _build_after_condition(self, ordering, query_parameters):
+        """
+        This method builds the condition of the after() method : the elements whose ordering values are after the values of
+        the cursor, compared in the order of the ordering properties.
+        The null values are handled like the database sorts them (as greater than all the other values) : the missing
+        values of the cursor are compared with IS NULL conditions (they are not sent as parameters), and the nodes whose
+        ordering values are null are placed after the cursor in an ascending order.
+
+        :param ordering (required) : The ordering of the QuerySet (see _get_ordering()).
+
+        :param query_parameters (required) : The parameters dictionary of the query, in which the values of the cursor are
+                                             added.
+
+        :return: The condition.
+        """
+        cursor = self._after
+
+        if isinstance(cursor, (tuple, list)):
+            cursor_values = list(cursor)
+
+        elif isinstance(cursor, str):
+            cursor_values = [cursor]
+
+        else:
+            cursor_values = [vars(cursor).get(property_name) for property_name, is_desc in ordering]
+
+        if len(cursor_values) != len(ordering):
+            bulb_logger.error(
+                f'BULBQuerySetError("The cursor of the after() method of a QuerySet of {self.node_model.__name__} must contain a value for each ordering property, followed by the uuid.")')
+            raise BULBQuerySetError(
+                f"The cursor of the after() method of a QuerySet of {self.node_model.__name__} must contain a value for each ordering property, followed by the uuid.")
+
+        conditions = []
+        equalities = []
+        first_property_condition = None
+
+        for index, (property_name, is_desc) in enumerate(ordering):
+            cursor_value = cursor_values[index]
+
+            if cursor_value is None:
+                # No value is placed after the nulls in an ascending order, all of them are after in a descending order.
+                after_value_condition = f"n.{property_name} IS NOT NULL" if is_desc else None
+                equal_value_condition = f"n.{property_name} IS NULL"
+                after_or_equal_value_condition = None if is_desc else equal_value_condition
+
+            else:
+                query_parameters[f"after_{index}"] = format_value_to_parameter(cursor_value)
+                after_value_condition = f"n.{property_name} {'<' if is_desc else '>'} $after_{index}"
+                equal_value_condition = f"n.{property_name} = $after_{index}"
+                after_or_equal_value_condition = f"n.{property_name} {'<=' if is_desc else '>='} $after_{index}"
+
+                # The nulls are placed after the values in an ascending order (the uuid is never null).
+                if not is_desc and property_name != "uuid":
+                    after_value_condition = f"({after_value_condition} OR n.{property_name} IS NULL)"
+                    after_or_equal_value_condition = f"({after_or_equal_value_condition} OR n.{property_name} IS NULL)"
+
+            if index == 0:
+                first_property_condition = after_or_equal_value_condition
+
+            if after_value_condition is not None:
+                conditions.append(" AND ".join(equalities + [after_value_condition]))
+
+            equalities.append(equal_value_condition)
+
+        if not conditions:
+            return "false"
+
+        after_condition = " OR ".join(f"({condition})" for condition in conditions)
+
+        # The OR branches can't be resolved with an index seek, so a range on the first ordering property (which is
+        # implied by all of them) is added before them : the database seeks the index from the cursor instead of scanning
+        # the label.
+        if len(ordering) > 1 and first_property_condition is not None:
+            after_condition = f"{first_property_condition} AND ({after_condition})"
+
+        return after_condition
+
+    def _check_integer(self, parameter_name, value):
+        if not isinstance(value, str) and not isinstance(value, int):
+            bulb_logger.error(
+                f'BULBQuerySetError("The \'{parameter_name}\' parameter of a QuerySet of {self.node_model.__name__} must be a string or an integer.")')
+            raise BULBQuerySetError(
+                f"The '{parameter_name}' parameter of a QuerySet of {self.node_model.__name__} must be a string or an integer.")
+
+        return int(value)
+
+    #############
+    # COMPILING #
+    #############
+
+    def _build_statements(self, grouped=False):
+        """
+        This method builds the statements shared by all the queries of the QuerySet : everything until the RETURN clause.
+
+        :param grouped (optional, default=False) : Must be a boolean. If it is True, only the MATCH and WHERE statements are
+                                                   built, because the rows returned by values() and annotate() are sorted and
+                                                   paginated after the RETURN clause (see _build_pagination_statements()).
+
+        :return: A tuple that contains the list of the statements and the parameters dictionary.
+        """
+        from bulb.db.node_models import DatabaseNode
+
+        query_parameters = {}
+        property_statement = ""
+        where_statement = ""
+        order_by_statement = ""
+
+        # Build the property_statement.
+        if self._properties:
+            property_statement_list = []
+
+            # The parameters are prefixed, so they never collide with the other parameters of the query ($skip, $limit,
+            # $after_0, $q_0, etc...).
+            for property_name, value in self._properties.items():
+                property_statement_list.append(f"{property_name}: $p_{property_name}")
+                query_parameters[f"p_{property_name}"] = format_value_to_parameter(value)
+
+            property_statement = "{" + ", ".join(property_statement_list) + "}"
+
+        # Build the match_statement.
+        cypher_labels = DatabaseNode.format_labels_to_cypher(self.node_model._get_labels())
+        match_statement = f"MATCH (n:{cypher_labels} {property_statement})"
+
+        # Build the where statement (the Q statements are compiled with their values as parameters).
+        ordering = self._get_ordering()
+        conditions = [condition.compile("n", query_parameters, self.node_model)[0] if isinstance(condition, Q) else condition
+                      for condition in self._conditions]
+
+        if self._after is not None and grouped:
+            bulb_logger.error(
+                f'BULBQuerySetError("The after() method of a QuerySet of {self.node_model.__name__} cannot be combined with the values() and annotate() methods.")')
+            raise BULBQuerySetError(
+                f"The after() method of a QuerySet of {self.node_model.__name__} cannot be combined with the values() and annotate() methods.")
+
+        if self._after is not None:
+            conditions = conditions + [self._build_after_condition(ordering, query_parameters)]
+
+        if conditions:
+            if len(conditions) == 1:
+                where_statement = "WHERE " + conditions[0]
+
+            else:
+                where_statement = "WHERE " + " AND ".join(f"({condition})" for condition in conditions)
+
+        if grouped:
+            return [statement for statement in (match_statement, where_statement) if statement], query_parameters
+
+        # Build the with_statement.
+        with_statement = "WITH n"
+
+        # Build order_by statements.
+        if ordering:
+            order_by_statement = "ORDER BY " + ", ".join(f"n.{property_name}{' DESC' if is_desc else ''}"
+                                                         for property_name, is_desc in ordering)
+
+        statements = [match_statement,
+                      where_statement,
+                      with_statement,
+                      order_by_statement]
+
+        return ([statement for statement in statements if statement] + self._build_pagination_statements(query_parameters),
+                query_parameters)
+
+    def _build_pagination_statements(self, query_parameters):
+        """
+        This method builds the SKIP and LIMIT statements of the QuerySet.
+
+        :param query_parameters (required) : The parameters dictionary of the query, in which the values are added.
+
+        :return: The list of the statements.
+        """
+        statements = []
+
+        # Build skip_statement.
+        if self._skip is not None:
+            statements.append("SKIP $skip")
+            query_parameters["skip"] = self._skip
+
+        # Build limit_statement.
+        if self._limit is not None:
+            statements.append("LIMIT $limit")
+            query_parameters["limit"] = self._limit
+
+        return statements
+
+    def _build_grouped_return_items(self):
+        """
+        This method builds the items of the RETURN clause of values() and annotate() : the values are the grouping keys of
+        the aggregates.
+
+        :return: The list of the items.
+        """
+        return ([f"n.{field_name} AS {field_name}" for field_name in (self._values or [])]
+                + [f"{aggregate.compile()} AS {aggregate_name}" for aggregate_name, aggregate in self._annotations.items()])
+
+    def compile(self):
+        """
+        This method compiles the QuerySet into a parameterized Cypher query. The compilation is done only once.
+
+        :return: A tuple that contains the cypher query and its parameters dictionary.
+        """
+        if self._compiled_query is None and self._is_grouped():
+            statements, query_parameters = self._build_statements(grouped=True)
+
+            # Build return_statement statements.
+            return_items = ", ".join(self._build_grouped_return_items())
+            statements.append(f"RETURN DISTINCT {return_items}" if self._distinct else f"RETURN {return_items}")
+
+            # Build order_by statements (with the names of the returned items).
+            if self._order_by:
+                statements.append("ORDER BY " + ", ".join(f"{item_name}{' DESC' if is_desc else ''}"
+                                                          for item_name, is_desc in self._order_by))
+
+            statements.extend(self._build_pagination_statements(query_parameters))
+
+            self._compiled_query = "\n".join(statements), query_parameters
+
+        elif self._compiled_query is None:
+            statements, query_parameters = self._build_statements()
+
+            # Build return_statement statements.
+            if not self._only:
+                return_statement = "RETURN DISTINCT (n)" if self._distinct else "RETURN (n)"
+
+            else:
+                only_statement = ", ".join(f"n.{element}" for element in self._only)
+                return_statement = f"RETURN DISTINCT {only_statement}" if self._distinct else f"RETURN {only_statement}"
+
+            statements.append(return_statement)
+
+            self._compiled_query = "\n".join(statements), query_parameters
+
+        return self._compiled_query
+
+    ##############
+    # EVALUATING #
+    ##############
+
+    def _fetch(self):
+        """
+        This method runs the compiled query and caches the results.
+
+        :return: A list of node_model instances, or a list of dicts if only(), values() or annotate() was used.
+        """
+        if self._result_cache is None:
+            request_statement, query_parameters = self.compile()
+            response = gdbh.r_transaction(request_statement, query_parameters)
+
+            build_result = self._get_result_builder()
+            self._result_cache = [build_result(database_object) for database_object in response]
+
+            if self._prefetch and not self._only and not self._is_grouped():
+                self.node_model.prefetch_relationships(self._result_cache, self._prefetch)
+
+        return self._result_cache
+
+    def _get_result_builder(self):
+        """
+        This method returns the function which builds an element of the QuerySet from a record of the database.
+        """
+        if self._is_grouped():
+            return lambda database_object: dict(database_object)
+
+        if self._only:
+            return lambda database_object: database_object
+
+        hydrator = self.node_model._get_hydrator(self.node_model)
+
+        return lambda database_object: hydrator(database_object["n"])
+
+    def __iter__(self):
+        return iter(self._fetch())
+
+    def iterator(self, chunk_size=1000):
+        """
+        This method streams the results of the QuerySet : the records are hydrated one by one, as they are received from
+        the database, and they are not cached. Use it to go through large results sets with a flat memory usage.
+
+        :param chunk_size (optional, default=1000) : Must be an integer. The number of records fetched by each network round
+                                                     trip (see gdbh.stream()).
+
+        :return: A generator of node_model instances, or of dicts if only(), values() or annotate() was used.
+        """
+        if self._result_cache is not None:
+            yield from self._result_cache
+            return
+
+        request_statement, query_parameters = self.compile()
+        build_result = self._get_result_builder()
+
+        results = (build_result(database_object)
+                   for database_object in gdbh.stream(request_statement, query_parameters, fetch_size=chunk_size))
+
+        if self._prefetch and not self._only and not self._is_grouped():
+            results = self.node_model._iterate_with_prefetch(results, self._prefetch, chunk_size)
+
+        yield from results
+
+    def __len__(self):
+        return len(self._fetch())
+
+    def __bool__(self):
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+
+        return self.exists()
+
+    def __getitem__(self, item):
+        if self._result_cache is not None:
+            return self._result_cache[item]
+
+        if isinstance(item, slice):
+            if (item.start is not None and item.start < 0) or (item.stop is not None and item.stop < 0) or item.step is not None:
+                bulb_logger.error(
+                    'BULBQuerySetError("QuerySets only support slicing with positive bounds and without step.")')
+                raise BULBQuerySetError("QuerySets only support slicing with positive bounds and without step.")
+
+            start = item.start or 0
+            clone = self._clone()
+            clone._skip = (self._skip or 0) + start
+
+            if item.stop is not None:
+                stop_limit = max(item.stop - start, 0)
+                clone._limit = stop_limit if self._limit is None else max(min(stop_limit, self._limit - start), 0)
+
+            elif self._limit is not None:
+                clone._limit = max(self._limit - start, 0)
+
+            return clone
+
+        elif isinstance(item, int):
+            if item < 0:
+                bulb_logger.error('BULBQuerySetError("QuerySets do not support negative indexing.")')
+                raise BULBQuerySetError("QuerySets do not support negative indexing.")
+
+            results = self[item:item + 1]._fetch()
+
+            if not results:
+                raise IndexError("QuerySet index out of range.")
+
+            return results[0]
+
+        else:
+            bulb_logger.error('BULBQuerySetError("QuerySets indices must be integers or slices.")')
+            raise BULBQuerySetError("QuerySets indices must be integers or slices.")
+
+    def first(self):
+        """
+        This method returns the first element of the QuerySet, or None if the QuerySet is empty. Only one element is
+        requested to the database.
+        """
+        if self._result_cache is not None:
+            return self._result_cache[0] if self._result_cache else None
+
+        results = self[0:1]._fetch()
+
+        return results[0] if results else None
+
+    def exists(self):
+        """
+        This method returns True if the QuerySet contains at least one element, else False. No element is sent back by the
+        database.
+        """
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+
+        if self._is_grouped():
+            return self.count() > 0
+
+        statements, query_parameters = self._build_statements()
+        statements.append("RETURN true AS found LIMIT 1")
+
+        response = gdbh.r_transaction("\n".join(statements), query_parameters)
+
+        return bool(response)
+
+    def count(self):
+        """
+        This method returns the number of elements of the QuerySet, counted by the database.
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+
+        # Count the rows returned by values() and annotate().
+        if self._is_grouped():
+            statements, query_parameters = self._build_statements(grouped=True)
+            return_items = ", ".join(self._build_grouped_return_items())
+            statements.append(f"WITH DISTINCT {return_items}" if self._distinct else f"WITH {return_items}")
+            statements.extend(self._build_pagination_statements(query_parameters))
+            statements.append("RETURN COUNT(*) AS count")
+
+        else:
+            statements, query_parameters = self._build_statements()
+            statements.append("RETURN COUNT(DISTINCT n) AS count" if self._distinct else "RETURN COUNT(n) AS count")
+
+        response = gdbh.r_transaction("\n".join(statements), query_parameters)
+
+        return response[0]["count"]
+
+    def aggregate(self, **aggregates):
+        """
+        This method computes aggregates (see bulb.db.aggregates) on the nodes of the QuerySet. The aggregates are computed by
+        the database, so only their results are sent back.
+
+        Example :
+            Product.objects.filter(category="books").aggregate(total=Sum("price"), average_price=Avg("price"))
+            >>> {"total": 254.5, "average_price": 21.2}
+
+        :param aggregates (required) : The aggregates (Count, Sum, Avg, Min or Max instances), named by the keys of the
+                                       returned dict.
+
+        :return: A dict which contains the results of the aggregates.
+        """
+        self._check_aggregates(aggregates)
+
+        if not aggregates:
+            return {}
+
+        statements, query_parameters = self._build_statements()
+        statements.append("RETURN " + ", ".join(f"{aggregate.compile()} AS {aggregate_name}"
+                                                for aggregate_name, aggregate in aggregates.items()))
+
+        response = gdbh.r_transaction("\n".join(statements), query_parameters)
+
+        return dict(response[0])
+
+
+class QuerySetDescriptor:
+    """
+    This descriptor provides a new QuerySet of the node_model on each access to 'node_model.objects'.
+    """
+
+    def __get__(self, instance, owner):
+        return QuerySet(owner)
@@ -0,0 +1,191 @@
+from django.conf import settings
+from django.apps import apps
+from django.utils.module_loading import autodiscover_modules
+import importlib
+import threading
+import sys
+import os
+
+
+class NodeModelsRegistry:
+    """
+    This class stores all the node_models classes of the process. Each Node subclass registers itself when it is created
+    (see Node.__init_subclass__()), and the node_models modules of the project are imported once, when the application
+    is ready (see bulb.apps.BulbConfig) or on the first lookup.
+
+    The native node_models (Permission, Group, User and Session) can be overloaded by the project : in this case, the
+    registry returns the node_models defined in the BULB_<NAME>_NODE_MODEL_FILE settings.
+    """
+
+    def __init__(self):
+        self._node_models = []
+        self._node_models_by_name = {}
+        self._all_node_models_cache = None
+        self._node_models_by_labels_cache = None
+        self._resolved_labels_cache = {}
+
+        self._discovery_is_done = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _get_native_node_models_getters():
+        from bulb.contrib.auth.node_models import get_permission_node_model, get_group_node_model, get_user_node_model
+        from bulb.contrib.sessions.node_models import get_session_node_model
+
+        return {"Permission": get_permission_node_model,
+                "Group": get_group_node_model,
+                "User": get_user_node_model,
+                "Session": get_session_node_model}
+
+    def register(self, node_model):
+        """
+        This method registers a node_model class.
+
+        :param node_model (required) : The node_model class (a child class of Node).
+        """
+        with self._lock:
+            self._node_models.append(node_model)
+            self._node_models_by_name[node_model.__name__] = node_model
+            self._all_node_models_cache = None
+            self._node_models_by_labels_cache = None
+            self._resolved_labels_cache = {}
+
+    def autodiscover(self):
+        """
+        This method imports, once, the node_models modules of the installed applications, of the project and of bulb, so
+        all their node_models classes are registered.
+        Note that the modules are imported with their dotted path (and not executed again from their file path), so the
+        registered classes are the same objects as the imported ones.
+        """
+        if self._discovery_is_done:
+            return
+
+        with self._lock:
+            if self._discovery_is_done:
+                return
+
+            # Import the node_models modules of bulb.
+            for native_module_path in ("bulb.contrib.auth.node_models",
+                                       "bulb.contrib.sessions.node_models",
+                                       "bulb.contrib.handling.node_models",
+                                       "bulb.contrib.admin.node_models"):
+                importlib.import_module(native_module_path)
+
+            # Import the node_models modules of the installed applications (when the applications registry is loaded).
+            if apps.ready:
+                autodiscover_modules("node_models")
+
+            # Import the node_models modules of the project which are not in an installed application.
+            imported_files_paths = set(os.path.realpath(module.__file__) for module in list(sys.modules.values())
+                                       if getattr(module, "__file__", None))
+
+            for root, dirs, files in os.walk(settings.BASE_DIR):
+                if "node_models.py" in files:
+                    file_path = os.path.join(root, "node_models.py")
+
+                    if os.path.realpath(file_path) in imported_files_paths:
+                        continue
+
+                    module_path_list = os.path.relpath(file_path[:-3], settings.BASE_DIR).split(os.sep)
+
+                    # Ignore the files which are not in importable packages (virtual environments, etc...).
+                    if all(module_path_part.isidentifier() for module_path_part in module_path_list):
+                        importlib.import_module(".".join(module_path_list))
+
+            self._discovery_is_done = True
+
+    def get_node_model(self, node_model_name):
+        """
+        This method returns the node_model class named 'node_model_name', or None if there is not.
+
+        :param node_model_name (required) : The name of the node_model class (which is also its main label).
+        """
+        self.autodiscover()
+
+        native_node_models_getters = self._get_native_node_models_getters()
+
+        if node_model_name in native_node_models_getters:
+            return native_node_models_getters[node_model_name]()
+
+        return self._node_models_by_name.get(node_model_name)
+
+    def get_all_node_models(self):
+        """
+        This method returns the list of all the node_models classes defined in the node_models modules. It cares about
+        inheritance and overloading.
+        """
+        self.autodiscover()
+
+        if self._all_node_models_cache is not None:
+            return list(self._all_node_models_cache)
+
+        native_node_models_getters = self._get_native_node_models_getters()
+
+        node_models_list = []
+        needed_native_node_models = set()
+
+        for node_model in self._node_models:
+            if node_model.__module__.split(".")[-1] != "node_models":
+                continue
+
+            if node_model.__name__ in native_node_models_getters:
+                needed_native_node_models.add(node_model.__name__)
+
+            elif node_model not in node_models_list:
+                node_models_list.append(node_model)
+
+        # Add overloaded native classes.
+        for native_node_model_name, native_node_model_getter in native_node_models_getters.items():
+            if native_node_model_name in needed_native_node_models:
+                node_models_list.append(native_node_model_getter())
+
+        self._all_node_models_cache = tuple(node_models_list)
+
+        return node_models_list
+
+    def _get_node_models_by_labels(self):
+        """
+        This method returns the index of the node_models classes by their labels : a dict whose keys are the frozensets of
+        the labels of the node_models, and whose values are the node_models classes. The index is built once.
+        """
+        if self._node_models_by_labels_cache is None:
+            node_models_by_labels = {}
+
+            for node_model in self.get_all_node_models():
+                node_models_by_labels.setdefault(frozenset(node_model._get_labels()), node_model)
+
+            self._node_models_by_labels_cache = node_models_by_labels
+
+        return self._node_models_by_labels_cache
+
+    def get_node_model_from_labels(self, labels):
+        """
+        This method returns the most specific node_model class of a node, from its labels, or None if there is not.
+        As the labels of a node_model include the labels of its parent classes, the node_model whose labels are exactly the
+        labels of the node is returned. Else (if the node has additional labels), the node_model with the most labels among
+        those whose all labels are labels of the node is returned. The results are cached by labels set.
+
+        :param labels (required) : The labels of the node (an iterable of strings, like the 'labels' attribute of a neo4j
+                                   Node object).
+        """
+        labels = frozenset(labels)
+
+        try:
+            return self._resolved_labels_cache[labels]
+
+        except KeyError:
+            node_models_by_labels = self._get_node_models_by_labels()
+            node_model = node_models_by_labels.get(labels)
+
+            if node_model is None:
+                matching_labels_sets = [labels_set for labels_set in node_models_by_labels if labels_set <= labels]
+
+                if matching_labels_sets:
+                    node_model = node_models_by_labels[max(matching_labels_sets, key=len)]
+
+            self._resolved_labels_cache[labels] = node_model
+
+            return node_model
+
+
+node_models_registry = NodeModelsRegistry()
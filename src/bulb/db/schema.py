@@ -0,0 +1,153 @@
+from bulb.db.indexes import get_database_indexes, describe_index
+from bulb.db.base import gdbh
+import re
+
+
+# The descriptions of the nodes constraints returned by the db.constraints() procedure. Examples :
+#     CONSTRAINT ON ( person:Person ) ASSERT person.name IS UNIQUE
+#     CONSTRAINT ON ( person:Person ) ASSERT exists(person.name)
+CONSTRAINT_DESCRIPTION_REGEX = re.compile(
+    r"^CONSTRAINT ON \( `?(?P<variable>[^`:]+)`?:`?(?P<label>[^`]+?)`? \) ASSERT "
+    r"(?:exists\(`?(?P=variable)`?\.`?(?P<exists_property>[^`)]+)`?\)|`?(?P=variable)`?\.`?(?P<unique_property>[^`]+?)`? IS UNIQUE)$")
+
+
+class Constraint:
+    """
+    A REQUIRED (existence) or UNIQUE constraint on a property of the nodes of a node_model, declared with 'required=True'
+    or 'unique=True' on the property, and created by the bulb-apply command.
+
+    :param constraint_type (required) : Constraint.UNIQUE or Constraint.REQUIRED.
+
+    :param property_name (required) : The name of the property.
+    """
+
+    UNIQUE = "node_unique_constraint"
+    REQUIRED = "node_exists_constraint"
+
+    def __init__(self, constraint_type, property_name):
+        self.constraint_type = constraint_type
+        self.property_name = property_name
+
+    def get_key(self, label):
+        """
+        :return: The key which identifies the constraint of the label in the database (see get_database_constraints()).
+        """
+        return self.constraint_type, (label,), (self.property_name,)
+
+    def get_create_query(self, label):
+        """
+        :return: A tuple that contains the cypher query which creates the constraint of the label, and its parameters.
+        """
+        return f"CREATE CONSTRAINT ON {get_constraint_assertion(self.get_key(label))}", {}
+
+
+def get_constraint_assertion(constraint_key):
+    """
+    This function returns the assertion of a constraint, from its key. Example : "(x:Person) ASSERT x.name IS UNIQUE"
+    """
+    constraint_type, (label,), (property_name,) = constraint_key
+
+    if constraint_type == Constraint.UNIQUE:
+        return f"(x:{label}) ASSERT x.{property_name} IS UNIQUE"
+
+    return f"(x:{label}) ASSERT exists(x.{property_name})"
+
+
+def get_database_constraints():
+    """
+    This function returns the nodes constraints of the database, as a dict whose keys identify the constraints like the
+    get_key() method of the Constraint class, and whose values are the cypher queries (with their parameters) which drop
+    them. The other constraints (like the node keys and the relationships constraints) are ignored.
+    """
+    database_constraints = {}
+
+    for record in gdbh.r_transaction("CALL db.constraints()"):
+        match = CONSTRAINT_DESCRIPTION_REGEX.match(record["description"])
+
+        if match is not None:
+            if match.group("unique_property") is not None:
+                constraint_key = (Constraint.UNIQUE, (match.group("label"),), (match.group("unique_property"),))
+
+            else:
+                constraint_key = (Constraint.REQUIRED, (match.group("label"),), (match.group("exists_property"),))
+
+            database_constraints[constraint_key] = (f"DROP CONSTRAINT ON {get_constraint_assertion(constraint_key)}", {})
+
+    return database_constraints
+
+
+def get_declared_schema(node_models):
+    """
+    This function returns the constraints and the indexes declared by node_models. They are applied on the main label of
+    each node_model (its class name).
+
+    :param node_models (required) : A list of node_models classes.
+
+    :return: A dict whose keys identify the constraints and the indexes, and whose values are the cypher queries (with
+             their parameters) which create them.
+    """
+    declared_schema = {}
+
+    for node_model in node_models:
+        label = node_model.__name__
+        schema_items = []
+
+        for property_name, property_field in node_model._get_property_fields().items():
+            if property_field.required:
+                schema_items.append(Constraint(Constraint.REQUIRED, property_name))
+
+            if property_field.unique:
+                schema_items.append(Constraint(Constraint.UNIQUE, property_name))
+
+        schema_items.extend(node_model._get_indexes())
+
+        for schema_item in schema_items:
+            declared_schema[schema_item.get_key(label)] = schema_item.get_create_query(label)
+
+    return declared_schema
+
+
+def get_schema_changes(node_models):
+    """
+    This function compares the constraints and the indexes declared by node_models with those of the database, and
+    returns the changes to apply : the constraints and the indexes of the node_models labels which are not declared
+    anymore are dropped, and the declared ones which are not in the database are created. The constraints and the indexes
+    of the other labels are kept.
+    The drops come first, so a property can switch from an index to a UNIQUE constraint (or the reverse), and a full-text
+    index can be created again with other properties.
+
+    :param node_models (required) : A list of node_models classes.
+
+    :return: A list of tuples : ("DROP" or "CREATE", the key of the constraint or of the index, the cypher query, its
+             parameters).
+    """
+    labels = set(node_model.__name__ for node_model in node_models)
+    declared_schema = get_declared_schema(node_models)
+
+    database_schema = get_database_constraints()
+    database_schema.update(get_database_indexes())
+
+    schema_changes = []
+
+    for schema_key, (drop_query, drop_parameters) in database_schema.items():
+        if schema_key not in declared_schema and set(schema_key[1]) <= labels:
+            schema_changes.append(("DROP", schema_key, drop_query, drop_parameters))
+
+    for schema_key, (create_query, create_parameters) in declared_schema.items():
+        if schema_key not in database_schema:
+            schema_changes.append(("CREATE", schema_key, create_query, create_parameters))
+
+    return schema_changes
+
+
+def describe_schema_key(schema_key):
+    """
+    This function returns a readable description of a constraint or of an index, from its key.
+    Example : "UNIQUE CONSTRAINT ON :Person(email)"
+    """
+    if schema_key[0] in (Constraint.UNIQUE, Constraint.REQUIRED):
+        constraint_name = "UNIQUE" if schema_key[0] == Constraint.UNIQUE else "REQUIRED"
+
+        return f"{constraint_name} CONSTRAINT ON :{schema_key[1][0]}({schema_key[2][0]})"
+
+    return describe_index(schema_key)
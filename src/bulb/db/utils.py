@@ -1,12 +1,61 @@
+import datetime
 import uuid
+import pytz
 
 
 def make_uuid():
     return uuid.uuid4().hex
 
 
-def compare_different_modules_classes(class1, class2):
-    class2.__module__ = class1.__module__
-    if class1.__name__ == class2.__name__ and class1.__dict__.keys() == class2.__dict__.keys():
-        return True
-    return False
+def format_value_to_parameter(value):
+    """
+    This function converts a Python value into a value that can be sent to the Neo4j database as a query parameter.
+
+    NB : The conversion reproduces what the old interpolated cypher queries stored in the database :
+         - Naive datetimes and times are considered as UTC values (like Neo4j's datetime() and time() functions do).
+         - Tuples are converted into lists.
+         - Spatial2D objects are converted into WGS-84 points.
+         - Unsupported values (None included) are stored as their string representation.
+
+    :param value (required) : The value to convert.
+
+    :return: The converted value.
+    """
+    from bulb.db.node_models import Spatial2D
+
+    # Integer, float, boolean and string handling.
+    if isinstance(value, (bool, int, float, str)):
+        return value
+
+    # List and tuple handling.
+    elif isinstance(value, (list, tuple)):
+        return [format_value_to_parameter(item) for item in value]
+
+    # Datetime handling.
+    elif isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            return pytz.utc.localize(value)
+        return value
+
+    # Date handling.
+    elif isinstance(value, datetime.date):
+        return value
+
+    # Time handling.
+    elif isinstance(value, datetime.time):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=pytz.utc)
+        return value
+
+    # Spatial 2D handling.
+    elif isinstance(value, Spatial2D):
+        from neo4j.types.spatial import WGS84Point
+        return WGS84Point((value.longitude, value.latitude))
+
+    # Neo4j values (neotime objects, points, etc...) handling.
+    elif value.__class__.__module__.split(".")[0] in ["neotime", "neo4j"]:
+        return value
+
+    # Other
+    else:
+        return str(value)
@@ -394,6 +394,12 @@ def set_bulb_settings_on(root_settings):
     # NB : The neo4j's 'apoc' plugin is required for this functionality.
     root_settings['BULB_CREATE_PROPERTY_IF_NOT_FOUND']  = True
 
+    # If True, the 'unique' properties of the nodes are not checked with a query before each creation : the UNIQUE
+    # constraints of the database (created by the 'bulb-apply' command) reject the duplicates and their errors are raised
+    # as BULBUniqueConstraintError. It saves a query per 'unique' property and avoids race conditions.
+    # NB : The 'bulb-apply' command must have been run, else the duplicates will be created without error.
+    root_settings['BULB_USE_DATABASE_UNIQUE_CONSTRAINTS'] = False
+
     #################
     # BULB SESSIONS #
     #################
@@ -0,0 +1,37 @@
+"""
+The tests of bulb. They don't need a Neo4j database : the driver is never connected, and the tests which send queries
+replace the methods of gdbh (see bulb.db.base) with mocks, to check the queries and to return the records.
+
+Run them from the root of the repository :
+    python -m unittest discover -s tests -t .
+"""
+from unittest import mock
+import tempfile
+import os
+import sys
+
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIRECTORY), "src"))
+
+from django.conf import settings
+
+if not settings.configured:
+    from bulb.settings import set_bulb_settings_on
+
+    # The log files of bulb are written in the BASE_DIR, and its node_models.py files are imported : use an empty one.
+    tests_settings = {"BASE_DIR": tempfile.mkdtemp(prefix="bulb_tests_"),
+                      "INSTALLED_APPS": [],
+                      "MIDDLEWARE": [],
+                      "TEMPLATES": [{"OPTIONS": {"context_processors": []}}],
+                      "AUTHENTICATION_BACKENDS": [],
+                      "DEBUG": False}
+
+    set_bulb_settings_on(tests_settings)
+    settings.configure(**{name: value for name, value in tests_settings.items() if name.isupper()})
+
+# The database handler creates its driver when bulb.db is imported : no connection is opened during the tests.
+import neo4j.v1
+
+neo4j.v1.GraphDatabase.driver = mock.MagicMock()
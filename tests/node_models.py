@@ -0,0 +1,37 @@
+from bulb.db import node_models, Index, FullTextIndex
+
+
+class FriendshipRelationship(node_models.Relationship):
+    rel_type = "IS_FRIEND_WITH"
+    direction = "bi"
+    start = "self"
+    target = "self"
+
+
+class Author(node_models.Node):
+    email = node_models.Property(unique=True)
+    first_name = node_models.Property(required=True)
+    last_name = node_models.Property(required=True, index=True)
+    age = node_models.Property()
+
+    friends = FriendshipRelationship()
+
+    class Meta:
+        indexes = [Index("last_name", "first_name")]
+
+
+class AuthorshipRelationship(node_models.Relationship):
+    rel_type = "IS_WRITTEN_BY"
+    direction = "from"
+    start = "self"
+    target = Author
+
+
+class Article(node_models.Node):
+    title = node_models.Property()
+    views = node_models.Property(default=0)
+
+    authors = AuthorshipRelationship()
+
+    class Meta:
+        indexes = [FullTextIndex("title")]
@@ -0,0 +1,57 @@
+from bulb.db.exceptions import BULBUniqueConstraintError, BULBTransactionError
+from neo4j.exceptions import ConstraintError
+from bulb.db.base import gdbh
+from unittest import mock
+import unittest
+
+
+class ExplicitTransactionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.driver_transaction = mock.MagicMock()
+        session = mock.MagicMock()
+        session.__enter__.return_value.begin_transaction.return_value = self.driver_transaction
+
+        init_session_patcher = mock.patch.object(gdbh, "init_session", return_value=session)
+        init_session_patcher.start()
+        self.addCleanup(init_session_patcher.stop)
+
+    def test_commit(self):
+        with gdbh.transaction():
+            gdbh.w_transaction("CREATE (n:Author)")
+
+        self.driver_transaction.commit.assert_called_once_with()
+        self.driver_transaction.rollback.assert_not_called()
+
+    def test_caught_constraint_error_rollbacks_the_transaction(self):
+        self.driver_transaction.run.side_effect = ConstraintError("Node(0) already exists with label `Author`")
+
+        with self.assertRaises(BULBTransactionError):
+            with gdbh.transaction():
+                try:
+                    gdbh.w_transaction("CREATE (n:Author {email: 'john@doe.com'})")
+
+                except BULBUniqueConstraintError:
+                    pass
+
+        self.driver_transaction.commit.assert_not_called()
+        self.driver_transaction.rollback.assert_called_once_with()
+
+    def test_caught_error_in_a_nested_block_rollbacks_the_transaction(self):
+        self.driver_transaction.run.side_effect = Exception("The query has failed.")
+
+        with self.assertRaises(BULBTransactionError):
+            with gdbh.transaction():
+                with gdbh.transaction():
+                    try:
+                        gdbh.r_transaction("MATCH (n:Author) RETURN n")
+
+                    except Exception:
+                        pass
+
+        self.driver_transaction.commit.assert_not_called()
+        self.driver_transaction.rollback.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+from bulb.db.base import gdbh
+from unittest import mock
+import contextlib
+import importlib
+import unittest
+import io
+
+
+class BackfillTests(unittest.TestCase):
+
+    def test_batches_are_read_from_the_last_processed_id(self):
+        backfill_command = importlib.import_module("bulb.db.management.commands.bulb-backfill").Command()
+        missing_node_ids = [3, 5, 8, 13, 21]
+
+        def r_transaction(query, parameters=None):
+            if "count(n)" in query:
+                return [{"missing_count": len(missing_node_ids)}]
+
+            return [{"node_id": node_id} for node_id in missing_node_ids
+                    if node_id > parameters["last_node_id"]][0:parameters["batch_size"]]
+
+        def w_transaction(query, parameters=None):
+            return [{"filled_count": len(parameters["node_ids"])}]
+
+        with mock.patch.object(gdbh, "r_transaction", side_effect=r_transaction) as mocked_r_transaction, \
+                mock.patch.object(gdbh, "w_transaction", side_effect=w_transaction) as mocked_w_transaction, \
+                contextlib.redirect_stdout(io.StringIO()):
+            backfill_command.backfill_property("Author", "age", 0, batch_size=2, sleep=0)
+
+        self.assertEqual([call[0][1]["node_ids"] for call in mocked_w_transaction.call_args_list], [[3, 5], [8, 13], [21]])
+        self.assertEqual([call[0][1]["last_node_id"] for call in mocked_r_transaction.call_args_list[1:]], [-1, 5, 13, 21])
+
+
+if __name__ == "__main__":
+    unittest.main()
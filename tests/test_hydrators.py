@@ -0,0 +1,60 @@
+from tests.node_models import Author, FriendshipRelationship
+from bulb.db.node_models import RelationshipInstance
+import importlib
+import unittest
+
+
+# The previous implementation of build_fake_instance(), kept by the bulb-benchmark command to compare the hydrators with it.
+build_reference_fake_instance = importlib.import_module(
+    "bulb.db.management.commands.bulb-benchmark").build_reference_fake_instance
+
+
+class DatabaseNode:
+    def __init__(self, labels, properties):
+        self.labels = frozenset(labels)
+        self._properties = properties
+
+
+class DatabaseRelationship:
+    def __init__(self, rel_type, properties):
+        self.type = rel_type
+        self._properties = properties
+
+
+class HydratorsTests(unittest.TestCase):
+
+    def assertSameInstance(self, instance, reference_instance):
+        self.assertIs(instance.__class__, reference_instance.__class__)
+        self.assertEqual(instance.__dict__, reference_instance.__dict__)
+
+    def test_node(self):
+        database_node = DatabaseNode(["Author"], {"uuid": "a1", "first_name": "John", "last_name": "Doe", "age": 30})
+
+        self.assertSameInstance(Author._get_hydrator(Author)(database_node),
+                                build_reference_fake_instance(Author, database_node, Author))
+        self.assertSameInstance(Author.build_fake_instance(database_node, forced_fake_instance_class=Author),
+                                build_reference_fake_instance(Author, database_node, Author))
+
+    def test_node_without_properties(self):
+        database_node = DatabaseNode(["Author"], {})
+
+        self.assertSameInstance(Author._get_hydrator(Author)(database_node),
+                                build_reference_fake_instance(Author, database_node, Author))
+
+    def test_relationship(self):
+        database_relationship = DatabaseRelationship("IS_FRIEND_WITH", {"uuid": "r1", "since": 2012})
+        additional_parameters = {"related_relationship": Author.friends}
+
+        self.assertSameInstance(
+            FriendshipRelationship.build_fake_instance(database_relationship,
+                                                       forced_fake_instance_class=RelationshipInstance,
+                                                       additional_parameters=additional_parameters),
+            build_reference_fake_instance(FriendshipRelationship, database_relationship, RelationshipInstance,
+                                          additional_parameters))
+
+    def test_hydrators_are_cached(self):
+        self.assertIs(Author._get_hydrator(Author), Author._get_hydrator(Author))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from tests.test_hydrators import DatabaseNode
+from tests.node_models import Author
+from bulb.db.exceptions import BULBNodeError
+from bulb.db.base import gdbh
+from unittest import mock
+import unittest
+
+
+class UpsertTests(unittest.TestCase):
+
+    def test_update_of_an_existing_node_with_other_required_properties(self):
+        existing_node = DatabaseNode(["Author"], {"uuid": "a1", "email": "john@doe.com", "first_name": "Johnny",
+                                                  "last_name": "Doe"})
+
+        with mock.patch.object(gdbh, "r_transaction", return_value=[{"index": 0}]) as r_transaction, \
+                mock.patch.object(gdbh, "w_transaction", return_value=[{"index": 0, "n": existing_node}]) as w_transaction:
+            author = Author.upsert({"email": "john@doe.com"}, {"first_name": "Johnny"})
+
+        self.assertEqual(r_transaction.call_args[0][1], {"rows": [{"index": 0, "lookup": {"email": "john@doe.com"}}]})
+        self.assertEqual(w_transaction.call_args[0][1],
+                         {"matched_rows": [{"index": 0, "lookup": {"email": "john@doe.com"},
+                                            "properties": {"email": "john@doe.com", "first_name": "Johnny"}}],
+                          "created_rows": []})
+        self.assertEqual((author.uuid, author.first_name), ("a1", "Johnny"))
+
+    def test_creation_builds_and_checks_the_properties(self):
+        created_node = DatabaseNode(["Author"], {"uuid": "a2", "email": "jane@doe.com"})
+
+        with mock.patch.object(gdbh, "r_transaction", return_value=[]), \
+                mock.patch.object(gdbh, "w_transaction", return_value=[{"index": 0, "n": created_node}]) as w_transaction:
+            Author.upsert({"email": "jane@doe.com"}, {"first_name": "Jane", "last_name": "Doe"})
+
+        created_row = w_transaction.call_args[0][1]["created_rows"][0]
+
+        self.assertEqual(w_transaction.call_args[0][1]["matched_rows"], [])
+        self.assertEqual(created_row["create_properties"]["first_name"], "Jane")
+        self.assertIn("uuid", created_row["create_properties"])
+
+    def test_instances_are_returned_in_the_order_of_the_dicts(self):
+        nodes = [DatabaseNode(["Author"], {"uuid": f"a{index}"}) for index in range(3)]
+
+        with mock.patch.object(gdbh, "r_transaction", return_value=[{"index": 1}]), \
+                mock.patch.object(gdbh, "w_transaction",
+                                  return_value=[{"index": 1, "n": nodes[1]}, {"index": 0, "n": nodes[0]},
+                                                {"index": 2, "n": nodes[2]}]):
+            authors = Author.bulk_upsert([{"email": f"{index}@doe.com", "first_name": "John", "last_name": "Doe"}
+                                          for index in range(3)], ["email"])
+
+        self.assertEqual([author.uuid for author in authors], ["a0", "a1", "a2"])
+
+    def test_lookup_must_contain_a_unique_property(self):
+        with self.assertRaises(BULBNodeError):
+            Author.upsert({"first_name": "John"}, {"age": 30})
+
+
+if __name__ == "__main__":
+    unittest.main()
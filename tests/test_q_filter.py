@@ -0,0 +1,73 @@
+from tests.node_models import Author, Article
+from bulb.db.Q_filter import BULBQError
+from bulb.db import Q
+import unittest
+
+
+class QCompilationTests(unittest.TestCase):
+
+    def test_lookups_are_compiled_with_parameters(self):
+        self.assertEqual(Q(first_name="John", age__gte=18).compile(),
+                         ("n.first_name = $q_0 AND n.age >= $q_1", {"q_0": "John", "q_1": 18}))
+
+    def test_or_is_grouped_inside_and(self):
+        self.assertEqual(((Q(first_name="John") | Q(last_name="Doe")) & Q(age=30)).compile(),
+                         ("(n.first_name = $q_0 OR n.last_name = $q_1) AND n.age = $q_2",
+                          {"q_0": "John", "q_1": "Doe", "q_2": 30}))
+
+    def test_not(self):
+        self.assertEqual((~Q(first_name="John")).compile(), ("NOT (n.first_name = $q_0)", {"q_0": "John"}))
+        self.assertEqual(Q(first_name__not_contains="o").compile(), ("NOT n.first_name CONTAINS $q_0", {"q_0": "o"}))
+
+    def test_in_values_are_sent_as_a_list(self):
+        self.assertEqual(Q(age__in=(18, 30)).compile(), ("n.age IN $q_0", {"q_0": [18, 30]}))
+
+    def test_in_rejects_a_string(self):
+        with self.assertRaises(BULBQError):
+            Q(first_name__in="John")
+
+    def test_raw_conditions(self):
+        self.assertEqual((Q("WHERE n.age > 18") & Q(first_name="John")).compile(),
+                         ("(n.age > 18) AND n.first_name = $q_0", {"q_0": "John"}))
+
+    def test_parameters_of_an_existing_query_are_kept(self):
+        condition, parameters = Q(first_name="John").compile("n", {"q_0": "kept"})
+
+        self.assertEqual(condition, "n.first_name = $q_1")
+        self.assertEqual(parameters, {"q_0": "kept", "q_1": "John"})
+
+    def test_relationship_traversal(self):
+        self.assertEqual(
+            Q(friends__first_name="John").compile(node_model=Author),
+            ("ANY(n_friends IN [(n)-[:IS_FRIEND_WITH]-(n_friends:Author) | n_friends] WHERE n_friends.first_name = $q_0)",
+             {"q_0": "John"}))
+
+    def test_nested_relationship_traversal(self):
+        self.assertEqual(
+            Q(authors__friends__age__gte=18).compile(node_model=Article)[0],
+            "ANY(n_authors IN [(n)-[:IS_WRITTEN_BY]-(n_authors:Author) | n_authors] "
+            "WHERE ANY(n_authors_friends IN [(n_authors)-[:IS_FRIEND_WITH]-(n_authors_friends:Author) | n_authors_friends] "
+            "WHERE n_authors_friends.age >= $q_0))")
+
+    def test_unknown_relationship(self):
+        with self.assertRaises(BULBQError):
+            Q(enemies__first_name="John").compile(node_model=Author)
+
+
+
+class QRepresentationTests(unittest.TestCase):
+
+    def test_repr_of_a_relationship_traversal(self):
+        self.assertEqual(repr(Q(friends__first_name__contains="Jo")), "<Q: friends__first_name__contains='Jo'>")
+
+    def test_repr_of_combined_statements(self):
+        self.assertEqual(repr((Q(first_name="John") | Q(friends__first_name="John")) & ~Q(age__lt=18)),
+                         "<Q: (first_name='John' OR friends__first_name='John') AND NOT (age__lt=18)>")
+
+    def test_repr_of_negated_lookups_and_raw_conditions(self):
+        self.assertEqual(repr(Q("n.age > 18", first_name__not_in=["John"])),
+                         "<Q: (n.age > 18) AND first_name__not_in=['John']>")
+
+
+if __name__ == "__main__":
+    unittest.main()
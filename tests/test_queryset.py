@@ -0,0 +1,88 @@
+from tests.node_models import Author
+from bulb.db.exceptions import BULBQuerySetError
+from bulb.db import Q
+import unittest
+
+
+class QuerySetCompilationTests(unittest.TestCase):
+
+    def test_filter_order_by_skip_limit(self):
+        self.assertEqual(
+            Author.objects.filter(Q(age__gt=18)).order_by("-age").skip(5).limit(10).compile(),
+            ("MATCH (n:Author )\nWHERE n.age > $q_0\nWITH n\nORDER BY n.age DESC\nSKIP $skip\nLIMIT $limit\nRETURN (n)",
+             {"q_0": 18, "skip": 5, "limit": 10}))
+
+    def test_keyword_filters_parameters_dont_collide_with_the_pagination_parameters(self):
+        self.assertEqual(Author.objects.filter(limit="a", skip="b").skip(2).limit(5).compile(),
+                         ("MATCH (n:Author {limit: $p_limit, skip: $p_skip})\nWITH n\nSKIP $skip\nLIMIT $limit\nRETURN (n)",
+                          {"p_limit": "a", "p_skip": "b", "skip": 2, "limit": 5}))
+
+    def test_querysets_are_not_mutated_by_chaining(self):
+        queryset = Author.objects.order_by("age")
+        queryset.filter(age__gt=18).limit(10)
+
+        self.assertEqual(queryset.compile(), ("MATCH (n:Author )\nWITH n\nORDER BY n.age\nRETURN (n)", {}))
+
+
+class AfterConditionTests(unittest.TestCase):
+
+    def test_cursor_without_ordering_uses_the_uuid(self):
+        self.assertEqual(Author.objects.after("a1").compile(),
+                         ("MATCH (n:Author )\nWHERE (n.uuid > $after_0)\nWITH n\nORDER BY n.uuid\nRETURN (n)",
+                          {"after_0": "a1"}))
+
+    def test_cursor_starts_with_a_range_on_the_first_ordering_property(self):
+        self.assertEqual(
+            Author.objects.order_by("-age").after((30, "a1")).limit(20).compile(),
+            ("MATCH (n:Author )\n"
+             "WHERE n.age <= $after_0 AND ((n.age < $after_0) OR (n.age = $after_0 AND n.uuid < $after_1))\n"
+             "WITH n\nORDER BY n.age DESC, n.uuid DESC\nLIMIT $limit\nRETURN (n)",
+             {"after_0": 30, "after_1": "a1", "limit": 20}))
+
+    def test_nulls_are_after_the_cursor_in_an_ascending_order(self):
+        self.assertEqual(
+            Author.objects.order_by("age").after((30, "a1")).compile()[0].split("\n")[1],
+            "WHERE (n.age >= $after_0 OR n.age IS NULL) "
+            "AND (((n.age > $after_0 OR n.age IS NULL)) OR (n.age = $after_0 AND n.uuid > $after_1))")
+
+    def test_null_cursor_in_an_ascending_order(self):
+        self.assertEqual(Author.objects.order_by("age").after((None, "a1")).compile(),
+                         ("MATCH (n:Author )\n"
+                          "WHERE n.age IS NULL AND ((n.age IS NULL AND n.uuid > $after_1))\n"
+                          "WITH n\nORDER BY n.age, n.uuid\nRETURN (n)",
+                          {"after_1": "a1"}))
+
+    def test_null_cursor_in_a_descending_order(self):
+        self.assertEqual(Author.objects.order_by("-age").after((None, "a1")).compile(),
+                         ("MATCH (n:Author )\n"
+                          "WHERE (n.age IS NOT NULL) OR (n.age IS NULL AND n.uuid < $after_1)\n"
+                          "WITH n\nORDER BY n.age DESC, n.uuid DESC\nRETURN (n)",
+                          {"after_1": "a1"}))
+
+    def test_cursor_instance_without_the_ordering_property(self):
+        author = Author.build_fake_instance(type("DatabaseNode", (), {"labels": frozenset(["Author"]),
+                                                                      "_properties": {"uuid": "a1"}})())
+
+        self.assertEqual(Author.objects.order_by("-age").after(author).compile()[1], {"after_1": "a1"})
+
+    def test_cursor_instance(self):
+        author = Author.build_fake_instance(type("DatabaseNode", (), {"labels": frozenset(["Author"]),
+                                                                      "_properties": {"uuid": "a1", "age": 30}})())
+
+        self.assertEqual(Author.objects.order_by("age").after(author).compile()[1], {"after_0": 30, "after_1": "a1"})
+
+    def test_cursor_with_missing_values(self):
+        with self.assertRaises(BULBQuerySetError):
+            Author.objects.order_by("age").after("a1").compile()
+
+    def test_after_is_combined_with_the_filters(self):
+        self.assertEqual(Author.objects.filter(age__gt=18).after("a1").compile()[0].split("\n")[1],
+                         "WHERE (n.age > $q_0) AND ((n.uuid > $after_0))")
+
+    def test_after_cannot_be_grouped(self):
+        with self.assertRaises(BULBQuerySetError):
+            Author.objects.values("age").after("a1").compile()
+
+
+if __name__ == "__main__":
+    unittest.main()
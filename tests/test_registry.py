@@ -0,0 +1,27 @@
+from tests.node_models import Author, Article
+from bulb.db.registry import node_models_registry
+from bulb.db import node_models
+import unittest
+
+
+class RegistryTests(unittest.TestCase):
+
+    def test_node_models_are_registered(self):
+        self.assertIs(node_models_registry.get_node_model("Author"), Author)
+        self.assertIn(Article, node_models_registry.get_all_node_models())
+
+    def test_node_model_from_labels(self):
+        self.assertIs(node_models_registry.get_node_model_from_labels(["Author"]), Author)
+        self.assertIs(node_models_registry.get_node_model_from_labels(["Author", "Archived"]), Author)
+        self.assertIsNone(node_models_registry.get_node_model_from_labels(["Unknown"]))
+
+    def test_unregistered_node_model(self):
+        class Unregistered(node_models.Node, register=False):
+            pass
+
+        self.assertIsNone(node_models_registry.get_node_model("Unregistered"))
+        self.assertNotIn(Unregistered, node_models_registry.get_all_node_models())
+
+
+if __name__ == "__main__":
+    unittest.main()
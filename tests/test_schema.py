@@ -0,0 +1,86 @@
+from tests.node_models import Author, Article
+from bulb.db.schema import get_schema_changes, Constraint
+from bulb.db.base import gdbh
+from unittest import mock
+import unittest
+
+
+def build_database_schema(constraints_descriptions, indexes_records):
+    """
+    This function returns a replacement of gdbh.r_transaction() which returns the records of the db.constraints() and
+    db.indexes() procedures.
+    """
+    def r_transaction(query, parameters=None):
+        if query == "CALL db.constraints()":
+            return [{"description": description} for description in constraints_descriptions]
+
+        if query == "CALL db.indexes()":
+            return indexes_records
+
+        raise AssertionError(f"Unexpected query : {query}")
+
+    return r_transaction
+
+
+def build_index_record(labels, properties, index_type="node_label_property", index_name=None):
+    return {"type": index_type, "tokenNames": labels, "properties": properties, "indexName": index_name}
+
+
+class SchemaChangesTests(unittest.TestCase):
+
+    def get_schema_changes(self, constraints_descriptions, indexes_records, node_models=(Author, Article)):
+        with mock.patch.object(gdbh, "r_transaction",
+                               side_effect=build_database_schema(constraints_descriptions, indexes_records)):
+            return [(action, key, query) for action, key, query, parameters in get_schema_changes(list(node_models))]
+
+    def test_empty_database(self):
+        changes = self.get_schema_changes([], [])
+
+        self.assertTrue(all(action == "CREATE" for action, key, query in changes))
+        self.assertIn(("CREATE", (Constraint.UNIQUE, ("Author",), ("email",)),
+                       "CREATE CONSTRAINT ON (x:Author) ASSERT x.email IS UNIQUE"), changes)
+        self.assertIn(("CREATE", (Constraint.REQUIRED, ("Author",), ("first_name",)),
+                       "CREATE CONSTRAINT ON (x:Author) ASSERT exists(x.first_name)"), changes)
+        self.assertIn(("CREATE", ("node_label_property", ("Author",), ("last_name", "first_name")),
+                       "CREATE INDEX ON :Author(last_name, first_name)"), changes)
+        self.assertIn(("CREATE", ("node_fulltext", ("Article",), ("title",), "Article_title_fulltext"),
+                       "CALL db.index.fulltext.createNodeIndex($name, $labels, $properties_names)"), changes)
+        self.assertEqual(len(changes), 8)
+
+    def test_applied_schema(self):
+        changes = self.get_schema_changes(
+            ["CONSTRAINT ON ( author:Author ) ASSERT author.uuid IS UNIQUE",
+             "CONSTRAINT ON ( author:Author ) ASSERT author.email IS UNIQUE",
+             "CONSTRAINT ON ( author:Author ) ASSERT exists(author.first_name)",
+             "CONSTRAINT ON ( author:Author ) ASSERT exists(author.last_name)",
+             "CONSTRAINT ON ( article:Article ) ASSERT article.uuid IS UNIQUE"],
+            [build_index_record(["Author"], ["last_name"]),
+             build_index_record(["Author"], ["last_name", "first_name"]),
+             build_index_record(["Article"], ["title"], "node_fulltext", "Article_title_fulltext")])
+
+        self.assertEqual(changes, [])
+
+    def test_undeclared_items_are_dropped_first(self):
+        changes = self.get_schema_changes(
+            ["CONSTRAINT ON ( author:Author ) ASSERT author.age IS UNIQUE"],
+            [build_index_record(["Author"], ["age"]),
+             build_index_record(["Article"], ["title", "views"], "node_fulltext", "Article_title_fulltext")],
+            node_models=(Author, Article))
+
+        self.assertEqual(changes[0:3],
+                         [("DROP", (Constraint.UNIQUE, ("Author",), ("age",)),
+                           "DROP CONSTRAINT ON (x:Author) ASSERT x.age IS UNIQUE"),
+                          ("DROP", ("node_label_property", ("Author",), ("age",)), "DROP INDEX ON :Author(age)"),
+                          ("DROP", ("node_fulltext", ("Article",), ("title", "views"), "Article_title_fulltext"),
+                           "CALL db.index.fulltext.drop($name)")])
+        self.assertTrue(all(action == "CREATE" for action, key, query in changes[3:]))
+
+    def test_items_of_other_labels_are_kept(self):
+        changes = self.get_schema_changes(["CONSTRAINT ON ( book:Book ) ASSERT book.isbn IS UNIQUE"],
+                                          [build_index_record(["Book"], ["title"])])
+
+        self.assertFalse([change for change in changes if change[0] == "DROP"])
+
+
+if __name__ == "__main__":
+    unittest.main()